@@ -1,5 +1,6 @@
 import sys
 from copy import copy
+from functools import lru_cache
 from typing import Any
 
 from crypto_cpp_py.cpp_bindings import cpp_hash
@@ -7,6 +8,9 @@ from starkware.starknet.services.api.contract_class.contract_class import (
     DeprecatedCompiledClass,
     CompiledClass,
 )
+from starkware.cairo.lang.compiler import import_loader
+from starkware.cairo.lang.compiler.ast.module import CairoFile
+from starkware.cairo.lang.compiler.parser import parse_file
 
 
 def patched_pedersen_hash(left: int, right: int) -> int:
@@ -42,6 +46,23 @@ setattr(DeprecatedCompiledClass, "__deepcopy__", shallow_copy)
 setattr(CompiledClass, "__deepcopy__", shallow_copy)
 
 
+@lru_cache(maxsize=1024)
+def cached_parse_file(code: str, filename: str = "<string>") -> CairoFile:
+    """
+    Parsed modules are keyed by their code and filename, so an edited file is parsed again.
+    """
+    return parse_file(code, filename=filename)
+
+
+# Every pass manager (`StarknetPassManagerFactory`, `TestCollectorPassManagerFactory`,
+# `CairoPassManagerFactory`, ...) collects modules with `ImportsCollector`,
+# which parses each imported file from scratch.
+# Test suites and contracts import the same modules (e.g. the common library),
+# so parsed modules are shared across compilations within a process.
+# Passes never modify the AST in place, they build new nodes, so sharing it is safe.
+setattr(import_loader, "parse_file", cached_parse_file)
+
+
 # Python complains about importing `Project`` if the import below is removed
 # pylint: disable=C0413
 from protostar.commands import (
@@ -4,3 +4,4 @@ from .cairo_pass_manager import CairoPassManagerFactory
 from .cairo_compiler import CairoCompiler, CairoCompilerConfig
 from .hint_local import HintLocal, HintLocalsDict
 from .cairo_enum import CairoVersion
+from .compiled_hint_cache import CachedHintsCairoFunctionRunner
@@ -1,4 +1,6 @@
 import json
+from functools import lru_cache
+from importlib import metadata
 from pathlib import Path
 from typing import Optional, Tuple
 from dataclasses import dataclass
@@ -136,6 +138,31 @@ def compile_protostar_sierra_to_casm(
         return json.loads(compiled_str)
 
 
+@lru_cache(maxsize=None)
+def get_bindings_fingerprint() -> str:
+    """
+    Identifies the build of the Cairo 1 compiler, so cached compilation outputs
+    are not reused after the bindings are upgraded or rebuilt.
+    """
+    try:
+        version = metadata.version("cairo-python-bindings")
+    except metadata.PackageNotFoundError:
+        version = "unknown"
+
+    bindings_path = Path(cairo_python_bindings.__file__)  # pyright: ignore
+    binary_paths = (
+        sorted(bindings_path.parent.glob("*.so"))
+        + sorted(bindings_path.parent.glob("*.pyd"))
+        if bindings_path.stem == "__init__"
+        else [bindings_path]
+    )
+    fingerprint = [version]
+    for binary_path in binary_paths:
+        stat = binary_path.stat()
+        fingerprint.append(f"{binary_path.name}:{stat.st_size}:{stat.st_mtime_ns}")
+    return ";".join(fingerprint)
+
+
 @contextmanager
 def handle_bindings_errors(binding_name: str):
     try:
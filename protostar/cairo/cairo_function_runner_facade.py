@@ -7,6 +7,8 @@ from starkware.cairo.lang.vm.utils import RunResources
 from starkware.cairo.lang.vm.relocatable import MaybeRelocatable
 from starkware.cairo.lang.vm.security import verify_secure_runner
 
+from .compiled_hint_cache import CachedHintsCairoFunctionRunner
+
 
 RUNNER_BUILTINS = ["pedersen", "range_check", "bitwise", "ec_op"]
 RUNNER_BUILTINS_TITLE_CASE = [
@@ -23,7 +25,9 @@ class CairoRunnerFacade:
     @contextmanager
     def new_runner(self) -> Generator[CairoFunctionRunner, None, None]:
         self._previous_runner = None
-        runner = CairoFunctionRunner(program=self._program, layout="starknet")
+        runner = CachedHintsCairoFunctionRunner(
+            program=self._program, layout="starknet"
+        )
         self.current_runner = runner
         yield runner
         self._previous_runner = runner
@@ -0,0 +1,44 @@
+from functools import lru_cache
+from types import CodeType
+from typing import Any, Optional
+
+from starkware.cairo.common.cairo_function_runner import CairoFunctionRunner
+from starkware.cairo.lang.vm.relocatable import MaybeRelocatable
+from starkware.cairo.lang.vm.vm_core import VirtualMachine
+
+
+@lru_cache(maxsize=65536)
+def compile_hint(source: str, filename: str) -> CodeType:
+    # The filename (`<hint{id}>`) is a part of the key, because the VM maps it back to the hint
+    # location in tracebacks. Hints get the same ids whenever the same program is loaded.
+    return compile(source, filename, mode="exec")
+
+
+class CachedHintsVirtualMachine(VirtualMachine):
+    """
+    Virtual machine reusing hints compiled by previous VMs in the process,
+    so the hint compilation cost is paid once per program rather than once per run.
+    """
+
+    def compile_hint(
+        self, source, filename, hint_index: int, pc: MaybeRelocatable
+    ) -> CodeType:
+        try:
+            return compile_hint(source, filename)
+        except (IndentationError, SyntaxError):
+            # Compile again to raise the VM exception pointing to the hint
+            return super().compile_hint(source, filename, hint_index=hint_index, pc=pc)
+
+
+class CachedHintsCairoFunctionRunner(CairoFunctionRunner):
+    def initialize_vm(
+        self,
+        hint_locals: Any,
+        static_locals: Optional[dict[str, Any]] = None,
+        vm_class: Optional[type] = None,
+    ):
+        super().initialize_vm(
+            hint_locals=hint_locals,
+            static_locals=static_locals,
+            vm_class=vm_class or CachedHintsVirtualMachine,
+        )
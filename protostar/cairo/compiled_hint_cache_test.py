@@ -0,0 +1,18 @@
+import pytest
+
+from .compiled_hint_cache import compile_hint
+
+
+def test_hints_are_compiled_once_per_source_and_filename():
+    code = compile_hint("x = 1", "<hint0>")
+
+    assert compile_hint("x = 1", "<hint0>") is code
+    assert compile_hint("x = 1", "<hint1>") is not code
+    assert code.co_filename == "<hint0>"
+
+
+def test_invalid_hints_are_not_cached():
+    with pytest.raises(SyntaxError):
+        compile_hint("x = ", "<hint0>")
+    with pytest.raises(SyntaxError):
+        compile_hint("x = ", "<hint0>")
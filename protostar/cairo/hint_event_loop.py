@@ -0,0 +1,55 @@
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Optional, TypeVar
+
+T = TypeVar("T")
+
+_thread_local = threading.local()
+_vm_executor: Optional[ThreadPoolExecutor] = None
+_vm_executor_pid: Optional[int] = None
+
+
+def run_in_hint_event_loop(awaitable: Awaitable[T]) -> T:
+    """
+    Synchronously runs the awaitable in an event loop kept by the current thread.
+    Hints call async controllers this way, without creating a new event loop on every call.
+    """
+    loop = _get_thread_event_loop()
+    task = asyncio.ensure_future(awaitable, loop=loop)
+    try:
+        return loop.run_until_complete(task)
+    except BaseException:
+        # run_until_complete doesn't get the result from exceptions
+        # that are not subclasses of `Exception`.
+        # Consume all exceptions to prevent asyncio's warning from logging.
+        if task.done() and not task.cancelled():
+            task.exception()
+        raise
+
+
+def get_cairo_vm_executor() -> ThreadPoolExecutor:
+    """
+    Returns the process' executor running Cairo functions.
+    It has a single thread, so its hint event loop is reused by all runs.
+    """
+    global _vm_executor, _vm_executor_pid  # pylint: disable=global-statement
+    if _vm_executor is None or _vm_executor_pid != os.getpid():
+        # Threads aren't inherited by forked processes, so each process needs its own executor
+        _vm_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cairo-vm")
+        _vm_executor_pid = os.getpid()
+    return _vm_executor
+
+
+def _get_thread_event_loop() -> asyncio.AbstractEventLoop:
+    loop: Optional[asyncio.AbstractEventLoop] = getattr(_thread_local, "loop", None)
+    if (
+        loop is None
+        or loop.is_closed()
+        or getattr(_thread_local, "pid", None) != os.getpid()
+    ):
+        loop = asyncio.new_event_loop()
+        _thread_local.loop = loop
+        _thread_local.pid = os.getpid()
+    return loop
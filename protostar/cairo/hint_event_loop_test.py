@@ -0,0 +1,40 @@
+import asyncio
+
+import pytest
+
+from .hint_event_loop import get_cairo_vm_executor, run_in_hint_event_loop
+
+
+async def _get_running_loop() -> asyncio.AbstractEventLoop:
+    return asyncio.get_running_loop()
+
+
+async def _fail():
+    raise ValueError("failed")
+
+
+def test_event_loop_is_reused_in_thread():
+    loop = run_in_hint_event_loop(_get_running_loop())
+
+    assert run_in_hint_event_loop(_get_running_loop()) is loop
+    assert not loop.is_running()
+
+
+def test_exceptions_are_propagated():
+    with pytest.raises(ValueError, match="failed"):
+        run_in_hint_event_loop(_fail())
+
+
+def test_cairo_vm_executor_reuses_thread_and_its_loop():
+    executor = get_cairo_vm_executor()
+
+    first_loop = executor.submit(
+        lambda: run_in_hint_event_loop(_get_running_loop())
+    ).result()
+    second_loop = executor.submit(
+        lambda: run_in_hint_event_loop(_get_running_loop())
+    ).result()
+
+    assert get_cairo_vm_executor() is executor
+    assert first_loop is second_loop
+    assert first_loop is not run_in_hint_event_loop(_get_running_loop())
@@ -1,5 +1,6 @@
+import multiprocessing
 from pathlib import Path
-from typing import List, Iterable, Tuple
+from typing import Callable, List, Iterable, Optional, Tuple, Union
 
 from starkware.cairo.lang.compiler.preprocessor.preprocessor_error import (
     PreprocessorError,
@@ -7,7 +8,9 @@ from starkware.cairo.lang.compiler.preprocessor.preprocessor_error import (
 
 import protostar.cairo.bindings.cairo_bindings as cairo1
 from protostar.testing import TestCollector
-from protostar.testing.test_collector import TestSuiteInfo
+from protostar.testing.test_collection_index import TestCollectionIndex
+from protostar.testing.test_collector import TestSuiteInfo, TestSuiteInfoDict
+from protostar.testing.test_results import BrokenTestSuiteResult
 from protostar.testing.test_suite import Cairo1TestSuite, TestSuite, TestCase
 
 
@@ -15,23 +18,139 @@ class Cairo1TestCollectionException(Exception):
     pass
 
 
+CollectionProgressCallback = Callable[[int, int], None]
+"""Called with the number of collected test suites and the total number of test suites."""
+
+
+# Note: This function has to be top-level function, because it is being pickled by multiprocessing.
+def _collect_tests_in_worker(
+    args: Tuple[Path, list[Tuple[Path, cairo1.PackageName]]]
+) -> Tuple[Path, Union[cairo1.TestCollectorOutput, Exception]]:
+    file_path, linked_libraries = args
+    try:
+        return file_path, cairo1.collect_tests(
+            file_path, linked_libraries=linked_libraries
+        )
+    except Exception as ex:  # pylint: disable=broad-except
+        return file_path, ex
+
+
 class Cairo1TestCollector(TestCollector):
-    def __init__(self, linked_libraries: list[Tuple[Path, cairo1.PackageName]]):
+    def __init__(
+        self,
+        linked_libraries: list[Tuple[Path, cairo1.PackageName]],
+        on_progress: Optional[CollectionProgressCallback] = None,
+        collection_index: Optional[TestCollectionIndex] = None,
+    ):
         super().__init__(
             get_suite_function_names=self.collect_cairo1_tests_and_cache_outputs
         )
         self.linked_libraries = linked_libraries
+        self._on_progress = on_progress
+        self._collection_index = collection_index
         self._cairo_1_test_path_to_sierra_output: dict[Path, str] = {}
+        self._precollected_outputs: dict[
+            Path, Union[cairo1.TestCollectorOutput, Exception]
+        ] = {}
+        self._indexed_paths: set[Path] = set()
 
-    def collect_cairo1_tests_and_cache_outputs(
+    @staticmethod
+    def create_collection_index(project_root_path: Path) -> TestCollectionIndex:
+        return TestCollectionIndex(
+            project_root_path=project_root_path,
+            namespace="cairo1_test_collection",
+            fingerprint=cairo1.get_bindings_fingerprint(),
+        )
+
+    def _build_test_suites_from_test_suite_info_dict(
         self,
-        file_path: Path,
-    ) -> list[tuple[str, cairo1.AvailableGas]]:
-        try:
+        test_suite_info_dict: TestSuiteInfoDict,
+    ) -> Tuple[List[TestSuite], List[BrokenTestSuiteResult]]:
+        file_paths = [
+            file_path
+            for file_path in test_suite_info_dict
+            if not self._precollect_from_index(file_path)
+        ]
+        self._precollect_in_parallel(file_paths)
+        return super()._build_test_suites_from_test_suite_info_dict(
+            test_suite_info_dict
+        )
+
+    def _precollect_from_index(self, file_path: Path) -> bool:
+        if not self._collection_index:
+            return False
+        indexed_output = self._collection_index.read(file_path)
+        if indexed_output is None:
+            return False
+        self._precollected_outputs[file_path] = cairo1.TestCollectorOutput(
+            sierra_output=indexed_output["sierra_output"],
+            collected_tests=[
+                (test_name, available_gas)
+                for test_name, available_gas in indexed_output["collected_tests"]
+            ],
+        )
+        self._indexed_paths.add(file_path)
+        return True
+
+    def _write_to_index(
+        self, file_path: Path, collector_output: cairo1.TestCollectorOutput
+    ):
+        if not self._collection_index or file_path in self._indexed_paths:
+            return
+        # Test suites are separate crates, but they can declare modules placed next to them
+        sibling_modules = [
+            module_path
+            for module_path in file_path.parent.rglob("*.cairo")
+            if not TestCollector.is_test_suite(module_path.name)
+        ]
+        self._collection_index.write(
+            file_path,
+            dependencies=[
+                *sibling_modules,
+                *(package_path for package_path, _ in self.linked_libraries),
+            ],
+            value={
+                "sierra_output": collector_output.sierra_output,
+                "collected_tests": collector_output.collected_tests,
+            },
+        )
+
+    def _precollect_in_parallel(self, file_paths: list[Path]):
+        if len(file_paths) < 2:
+            return
+        with multiprocessing.Pool(
+            processes=min(multiprocessing.cpu_count(), len(file_paths))
+        ) as pool:
+            for collected_count, (file_path, output) in enumerate(
+                pool.imap_unordered(
+                    _collect_tests_in_worker,
+                    [(file_path, self.linked_libraries) for file_path in file_paths],
+                ),
+                start=1,
+            ):
+                self._precollected_outputs[file_path] = output
+                if self._on_progress:
+                    self._on_progress(collected_count, len(file_paths))
+
+    def _collect_tests(self, file_path: Path) -> cairo1.TestCollectorOutput:
+        collector_output = self._precollected_outputs.pop(file_path, None)
+        if collector_output is None:
             collector_output = cairo1.collect_tests(
                 file_path,
                 linked_libraries=self.linked_libraries,
             )
+        if isinstance(collector_output, Exception):
+            raise collector_output
+        if collector_output.sierra_output:
+            self._write_to_index(file_path, collector_output)
+        return collector_output
+
+    def collect_cairo1_tests_and_cache_outputs(
+        self,
+        file_path: Path,
+    ) -> list[tuple[str, cairo1.AvailableGas]]:
+        try:
+            collector_output = self._collect_tests(file_path)
         except RuntimeError as rt_err:
             raise PreprocessorError(str(rt_err)) from rt_err
 
@@ -0,0 +1,56 @@
+import multiprocessing
+import os
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+
+from protostar.cairo.bindings.cairo_bindings import TestCollectorOutput
+
+from protostar.testing.test_suite import Cairo1TestSuite
+
+from .cairo1_test_collector import Cairo1TestCollector
+
+
+# Note: The patched function is called in forked worker processes,
+#   so it has to return picklable values instead of mocks.
+def collect_tests_with_pid(file_path: Path, linked_libraries) -> TestCollectorOutput:
+    if file_path.name == "test_broken.cairo":
+        raise RuntimeError("Compilation failed")
+    return TestCollectorOutput(
+        sierra_output=str(os.getpid()),
+        collected_tests=[(f"{file_path.stem}::test_case", None)],
+    )
+
+
+@pytest.mark.skipif(
+    multiprocessing.get_start_method() != "fork",
+    reason="Patched functions are inherited only by forked processes",
+)
+def test_test_suites_are_collected_in_worker_processes(
+    tmp_path: Path, mocker: MockerFixture
+):
+    mocker.patch(
+        "protostar.cairo_testing.cairo1_test_collector.cairo1.collect_tests",
+        new=collect_tests_with_pid,
+    )
+    for test_suite_name in ["test_a", "test_b", "test_broken"]:
+        (tmp_path / f"{test_suite_name}.cairo").touch()
+    progress: list[tuple[int, int]] = []
+
+    result = Cairo1TestCollector(
+        linked_libraries=[],
+        on_progress=lambda collected, total: progress.append((collected, total)),
+    ).collect(targets=[str(tmp_path)])
+
+    assert sorted(test_suite.test_path.name for test_suite in result.test_suites) == [
+        "test_a.cairo",
+        "test_b.cairo",
+    ]
+    for test_suite in result.test_suites:
+        assert isinstance(test_suite, Cairo1TestSuite)
+        assert int(test_suite.sierra_output) != os.getpid()
+    [broken_test_suite] = result.broken_test_suites
+    assert broken_test_suite.file_path.name == "test_broken.cairo"
+    assert "Compilation failed" in str(broken_test_suite.exception)
+    assert progress[-1] == (3, 3)
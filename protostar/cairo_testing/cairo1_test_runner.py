@@ -1,14 +1,14 @@
 import asyncio
+import re
 import traceback
 from contextlib import contextmanager
 from logging import getLogger
 from pathlib import Path
-from typing import Optional, TYPE_CHECKING, List
+from typing import Optional, TYPE_CHECKING, List, Tuple
 
 from starkware.cairo.lang.compiler.program import Program
 
 from protostar.cairo import CairoCompiler, CairoCompilerConfig
-from protostar.cairo.cairo1_test_suite_parser import ProtostarCasm
 from protostar.cairo_testing.execution_environments.cairo_setup_execution_environment import (
     CairoSetupExecutionEnvironment,
 )
@@ -16,8 +16,12 @@ from protostar.cairo_testing.execution_environments.cairo_setup_execution_enviro
 from protostar.cairo_testing.execution_environments.cairo_setup_case_execution_environment import (
     CairoSetupCaseExecutionEnvironment,
 )
+from protostar.commands.cairo1_commands.fetch_from_scarb import (
+    fetch_linked_libraries_from_scarb,
+)
 from protostar.compiler import (
     Cairo0ProjectCompiler,
+    Cairo1ContractCompilationCache,
     ProjectCairoPathBuilder,
     ProjectCompilerConfig,
 )
@@ -38,6 +42,7 @@ from protostar.cairo_testing.execution_environments.cairo_test_execution_environ
     CairoTestExecutionEnvironment,
 )
 from protostar.cairo_testing.cairo_test_execution_state import CairoTestExecutionState
+from protostar.cairo_testing.protostar_casm_cache import ProtostarCasmCache
 from protostar.testing.test_case_runners.cairo1_test_case_runner import (
     Cairo1TestCaseRunner,
 )
@@ -50,16 +55,45 @@ from protostar.testing.test_suite import (
     Cairo1TestCase,
 )
 from protostar.testing.testing_seed import Seed
-import protostar.cairo.bindings.cairo_bindings as cairo1
+from protostar.cairo.bindings.cairo_bindings import PackageName
 
 
 if TYPE_CHECKING:
     from protostar.testing.test_runner import TestRunner
+    from protostar.testing.test_scheduler import PrewarmArgs
 
 logger = getLogger()
 
+DECLARED_CONTRACT_NAME_PATTERN = re.compile(r"declare\(\s*'([^']+)'\s*\)")
+
+
+def find_declared_contract_names(
+    test_paths: List[Path], contract_names: List[str]
+) -> List[str]:
+    """
+    Returns names of the contracts from the configuration file that are declared in the test suites.
+    """
+    declared_names: set[str] = set()
+    for test_path in test_paths:
+        try:
+            source = test_path.read_text(encoding="utf-8")
+        except OSError:
+            continue
+        declared_names.update(DECLARED_CONTRACT_NAME_PATTERN.findall(source))
+    return [
+        contract_name
+        for contract_name in contract_names
+        if contract_name in declared_names
+    ]
+
 
 class Cairo1TestRunner:
+    # The initial state of the suite run most recently by this worker process.
+    # It is reused when the worker picks up another shard of the same suite.
+    _last_suite_state: Optional[
+        Tuple[Tuple[Path, Seed], CairoTestExecutionState]
+    ] = None
+
     def __init__(
         self,
         project_root_path: Path,
@@ -67,10 +101,13 @@ class Cairo1TestRunner:
         shared_tests_state: SharedTestsState,
         active_profile_name: Optional[str],
         include_paths: Optional[List[str]] = None,
+        linked_libraries: Optional[List[Tuple[Path, PackageName]]] = None,
         profiling: bool = False,
         gas_estimation_enabled: bool = False,
+        declared_classes_snapshot_key: Optional[str] = None,
     ):
         self._gas_estimation_enabled = gas_estimation_enabled
+        self._linked_libraries = linked_libraries
         self.shared_tests_state = shared_tests_state
         self.profiling = profiling
         include_paths = include_paths or []
@@ -95,6 +132,12 @@ class Cairo1TestRunner:
             project_root_path=project_root_path,
             configuration_file=configuration_file,
         )
+        self.contract_compilation_cache = Cairo1ContractCompilationCache(
+            project_root_path=project_root_path
+        )
+        self.casm_cache = ProtostarCasmCache(project_root_path=project_root_path)
+        if declared_classes_snapshot_key:
+            self.contract_compilation_cache.load_snapshot(declared_classes_snapshot_key)
 
         project_cairo_path = (
             self.project_cairo_path_builder.build_project_cairo_path_list(
@@ -113,12 +156,14 @@ class Cairo1TestRunner:
         asyncio.run(
             cls(
                 include_paths=args.include_paths,
+                linked_libraries=args.linked_libraries,
                 project_root_path=args.project_root_path,
                 profiling=args.profiling,
                 cwd=args.cwd,
                 shared_tests_state=args.shared_tests_state,
                 active_profile_name=args.active_profile_name,
                 gas_estimation_enabled=args.gas_estimation_enabled,
+                declared_classes_snapshot_key=args.declared_classes_snapshot_key,
             ).run_test_suite(
                 test_suite=args.test_suite,
                 testing_seed=args.testing_seed,
@@ -126,11 +171,56 @@ class Cairo1TestRunner:
             )
         )
 
+    @staticmethod
+    def prewarm(args: "PrewarmArgs") -> Optional[str]:
+        """
+        Compiles contracts declared by the collected test suites once, before workers start.
+        Contracts declared outside of test suite files are compiled by workers when needed.
+        Contracts that fail to compile are skipped — the failure is reported when a test declares them.
+        """
+        configuration_file = ConfigurationFileFactory(
+            cwd=args.cwd, active_profile_name=args.active_profile_name
+        ).create()
+        contract_names = find_declared_contract_names(
+            test_paths=args.test_paths,
+            contract_names=configuration_file.get_contract_names(),
+        )
+        if not contract_names:
+            return None
+        linked_libraries = args.linked_libraries
+        if linked_libraries is None:
+            try:
+                linked_libraries = fetch_linked_libraries_from_scarb(
+                    args.project_root_path
+                )
+            except ProtostarException as ex:
+                logger.debug("Skipped prewarming of contracts: %s", ex)
+                return None
+        compilation_cache = Cairo1ContractCompilationCache(
+            project_root_path=args.project_root_path
+        )
+        for contract_name in contract_names:
+            contract_paths = configuration_file.get_contract_source_paths(contract_name)
+            if len(contract_paths) != 1:
+                # Only single file contracts can be declared, other ones are reported by `declare`
+                continue
+            try:
+                compilation_cache.compile_contract(
+                    contract_name,
+                    contract_paths[0],
+                    linked_libraries=linked_libraries,
+                )
+            except ProtostarException as ex:
+                logger.debug("Skipped prewarming of contract %s: %s", contract_name, ex)
+        return compilation_cache.save_snapshot()
+
     async def _build_execution_state(self, test_config: TestConfig):
         return await CairoTestExecutionState.from_test_config(
             test_config=test_config,
             cairo0_project_compiler=self.cairo0_project_compiler,
             contract_path_resolver=self.contract_path_resolver,
+            contract_compilation_cache=self.contract_compilation_cache,
+            linked_libraries=self._linked_libraries,
         )
 
     async def _run_suite_setup(
@@ -194,19 +284,28 @@ class Cairo1TestRunner:
                 max_steps=max_steps,
                 gas_estimation_enabled=self._gas_estimation_enabled,
             )
-            test_execution_state = await self._build_execution_state(test_config)
+            suite_state_key = (test_suite.test_path, testing_seed)
+            if (
+                Cairo1TestRunner._last_suite_state
+                and Cairo1TestRunner._last_suite_state[0] == suite_state_key
+            ):
+                test_execution_state = Cairo1TestRunner._last_suite_state[1]
+            else:
+                test_execution_state = await self._build_execution_state(test_config)
+                Cairo1TestRunner._last_suite_state = (
+                    suite_state_key,
+                    test_execution_state,
+                )
 
-            casm_json = cairo1.compile_protostar_sierra_to_casm(
+            protostar_casm = self.casm_cache.compile(
+                sierra_output=test_suite.sierra_output,
                 named_tests=[
                     (test_case.test_fn_name, test_case.available_gas)
                     for test_case in test_suite.test_cases
                 ],
-                input_data=test_suite.sierra_output,
             )
 
-            assert casm_json, f"No CASM was emitted for {test_suite.test_path}"
-
-            protostar_casm = ProtostarCasm.from_json(casm_json)
+            assert protostar_casm, f"No CASM was emitted for {test_suite.test_path}"
 
             test_suite.add_offsets_to_cases(offset_map=protostar_casm.offset_map)
 
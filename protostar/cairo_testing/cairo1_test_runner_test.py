@@ -0,0 +1,20 @@
+from pathlib import Path
+
+from .cairo1_test_runner import find_declared_contract_names
+
+
+def test_only_contracts_declared_in_test_suites_are_found(tmp_path: Path):
+    test_path = tmp_path / "test_main.cairo"
+    test_path.write_text(
+        "fn test_a() {\n"
+        "    let class_hash = declare('minimal').unwrap();\n"
+        "    let other_class_hash = declare( 'with_ctor' ).unwrap();\n"
+        "    let name = 'unused';\n"
+        "}\n",
+        encoding="utf-8",
+    )
+
+    assert find_declared_contract_names(
+        test_paths=[test_path, tmp_path / "missing_test.cairo"],
+        contract_names=["unused", "with_ctor", "minimal", "unknown"],
+    ) == ["with_ctor", "minimal"]
@@ -42,7 +42,7 @@ from protostar.cheatable_starknet.controllers.expect_events_controller import (
 from protostar.cheatable_starknet.controllers.transaction_info import (
     TransactionInfoController,
 )
-from protostar.compiler import Cairo0ProjectCompiler
+from protostar.compiler import Cairo0ProjectCompiler, Cairo1ContractCompilationCache
 from protostar.contract_path_resolver import ContractPathResolver
 from protostar.testing import Hook
 
@@ -53,12 +53,14 @@ class CairoSharedHintLocalFactory:
         cheatable_state: CheatableCachedState,
         cairo0_project_compiler: Cairo0ProjectCompiler,
         contract_path_resolver: ContractPathResolver,
+        contract_compilation_cache: Cairo1ContractCompilationCache,
         test_finish_hook: Hook,
         test_execution_state: CairoTestExecutionState,
     ):
         self.cheatable_state = cheatable_state
         self.cairo0_project_compiler = cairo0_project_compiler
         self.contract_path_resolver = contract_path_resolver
+        self.contract_compilation_cache = contract_compilation_cache
         self._test_finish_hook = test_finish_hook
         self._test_execution_state = test_execution_state
 
@@ -75,6 +77,8 @@ class CairoSharedHintLocalFactory:
         declare_cheatcode = DeclareHintLocal(
             contracts_controller=contracts_controller,
             contract_path_resolver=self.contract_path_resolver,
+            contract_compilation_cache=self.contract_compilation_cache,
+            linked_libraries=self._test_execution_state.linked_libraries,
         )
         declare_cairo0_cheatcode = DeclareCairo0HintLocal(
             project_compiler=self.cairo0_project_compiler,
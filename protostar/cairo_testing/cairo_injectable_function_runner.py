@@ -8,6 +8,7 @@ from starkware.cairo.lang.vm.vm_exceptions import VmException
 from protostar.cairo import HintLocalsDict
 from protostar.cairo.cairo_function_executor import Offset, OffsetOrName
 from protostar.cairo.cairo_function_runner_facade import CairoRunnerFacade
+from protostar.cairo.hint_event_loop import get_cairo_vm_executor
 from protostar.cairo.short_string import short_string_to_str, is_short_string
 from protostar.testing.test_environment_exceptions import RevertableException
 from protostar.starknet import SimpleReportedException
@@ -32,8 +33,9 @@ class CairoInjectableFunctionRunner:
             else:
                 self.run_cairo_function_by_name(function_identifier, *args, **kwargs)
 
+        # Cairo functions are run in the same thread every time, so hints reuse its event loop
         await loop.run_in_executor(
-            executor=None,
+            executor=get_cairo_vm_executor(),
             func=function_runner,
         )
 
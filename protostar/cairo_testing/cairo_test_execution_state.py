@@ -1,7 +1,8 @@
 import dataclasses
 from copy import deepcopy
 from dataclasses import dataclass, field
-from typing import cast
+from pathlib import Path
+from typing import Optional, Tuple, cast
 
 from starkware.crypto.signature.fast_pedersen_hash import pedersen_hash_func
 from starkware.starknet.business_logic.fact_state.patricia_state import (
@@ -16,12 +17,14 @@ from starkware.storage.dict_storage import DictStorage
 from starkware.storage.storage import FactFetchingContext
 from typing_extensions import Self
 
+from protostar.cairo.bindings.cairo_bindings import PackageName
 from protostar.cheatable_starknet.controllers.expect_events_controller import Event
-from protostar.compiler import Cairo0ProjectCompiler
+from protostar.compiler import Cairo0ProjectCompiler, Cairo1ContractCompilationCache
 from protostar.cheatable_starknet.cheatables.cheatable_cached_state import (
     CheatableCachedState,
 )
 from protostar.contract_path_resolver import ContractPathResolver
+from protostar.starknet.state_forking import fork_starknet
 from protostar.testing.stopwatch import Stopwatch
 from protostar.testing.test_config import TestConfig
 from protostar.testing.test_context import TestContext
@@ -38,6 +41,9 @@ class CairoTestExecutionState:
     config: TestConfig
     cairo0_project_compiler: Cairo0ProjectCompiler
     contract_path_resolver: ContractPathResolver
+    contract_compilation_cache: Cairo1ContractCompilationCache
+    # Resolved once by the test command, so that workers don't need to run `scarb metadata`.
+    linked_libraries: Optional[list[Tuple[Path, PackageName]]] = None
     expected_events_list: list[list[Event]] = field(default_factory=list)
 
     @property
@@ -51,7 +57,7 @@ class CairoTestExecutionState:
             config=deepcopy(self.config),
             output_recorder=self.output_recorder.fork(),
             stopwatch=self.stopwatch.fork(),
-            starknet=self.starknet.copy(),
+            starknet=fork_starknet(self.starknet, self.cheatable_state.fork()),
             expected_events_list=self.expected_events_list.copy(),
         )
 
@@ -61,6 +67,8 @@ class CairoTestExecutionState:
         test_config: TestConfig,
         cairo0_project_compiler: Cairo0ProjectCompiler,
         contract_path_resolver: ContractPathResolver,
+        contract_compilation_cache: Cairo1ContractCompilationCache,
+        linked_libraries: Optional[list[Tuple[Path, PackageName]]] = None,
     ):
         general_config = StarknetGeneralConfig()
         ffc = FactFetchingContext(storage=DictStorage(), hash_func=pedersen_hash_func)
@@ -94,4 +102,6 @@ class CairoTestExecutionState:
             config=test_config,
             cairo0_project_compiler=cairo0_project_compiler,
             contract_path_resolver=contract_path_resolver,
+            contract_compilation_cache=contract_compilation_cache,
+            linked_libraries=linked_libraries,
         )
@@ -38,6 +38,7 @@ class CairoSetupExecutionEnvironment(CairoExecutionEnvironment):
                 cheatable_state=state.cheatable_state,
                 cairo0_project_compiler=state.cairo0_project_compiler,
                 contract_path_resolver=state.contract_path_resolver,
+                contract_compilation_cache=state.contract_compilation_cache,
                 test_finish_hook=self._finish_hook,
                 test_execution_state=state,
             )
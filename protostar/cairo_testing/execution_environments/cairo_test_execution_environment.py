@@ -53,6 +53,7 @@ class CairoTestExecutionEnvironment(CairoExecutionEnvironment):
                 cheatable_state=state.cheatable_state,
                 cairo0_project_compiler=state.cairo0_project_compiler,
                 contract_path_resolver=state.contract_path_resolver,
+                contract_compilation_cache=state.contract_compilation_cache,
                 test_execution_state=state,
                 test_finish_hook=self._finish_hook,
             )
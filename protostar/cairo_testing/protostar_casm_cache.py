@@ -0,0 +1,60 @@
+import pickle
+from pathlib import Path
+from typing import Optional
+
+import protostar.cairo.bindings.cairo_bindings as cairo1
+from protostar.cairo.cairo1_test_suite_parser import ProtostarCasm
+from protostar.self.artifact_cache import ArtifactCache, hash_strings
+
+NamedTests = list[tuple[str, cairo1.AvailableGas]]
+
+
+class ProtostarCasmCache:
+    """
+    Caches test programs compiled from Sierra to CASM, keyed by the Sierra code and the tests to run.
+    Entries are pickled, so loading them skips both the compilation and parsing of the CASM JSON.
+    """
+
+    CACHE_NAMESPACE = "cairo1_test_casm"
+    DEFAULT_MAX_ENTRIES = 512
+
+    def __init__(self, project_root_path: Path, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self._artifact_cache = ArtifactCache(
+            project_root_path=project_root_path,
+            namespace=self.CACHE_NAMESPACE,
+            max_entries=max_entries,
+        )
+
+    def compile(
+        self, sierra_output: str, named_tests: NamedTests
+    ) -> Optional[ProtostarCasm]:
+        key = hash_strings(
+            cairo1.get_bindings_fingerprint(),
+            sierra_output,
+            *(f"{name}:{available_gas}" for name, available_gas in named_tests),
+        )
+        protostar_casm = self._read(key)
+        if protostar_casm is not None:
+            return protostar_casm
+
+        casm_json = cairo1.compile_protostar_sierra_to_casm(
+            named_tests=named_tests,
+            input_data=sierra_output,
+        )
+        if not casm_json:
+            return None
+        protostar_casm = ProtostarCasm.from_json(casm_json)
+        self._artifact_cache.write(
+            key, pickle.dumps(protostar_casm, protocol=pickle.HIGHEST_PROTOCOL)
+        )
+        return protostar_casm
+
+    def _read(self, key: str) -> Optional[ProtostarCasm]:
+        entry = self._artifact_cache.read(key)
+        if entry is None:
+            return None
+        try:
+            protostar_casm = pickle.loads(entry)
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return None
+        return protostar_casm if isinstance(protostar_casm, ProtostarCasm) else None
@@ -0,0 +1,38 @@
+from pathlib import Path
+
+from pytest_mock import MockerFixture
+
+from protostar.cairo.cairo1_test_suite_parser import ProtostarCasm
+
+from .protostar_casm_cache import ProtostarCasmCache
+
+MODULE = "protostar.cairo_testing.protostar_casm_cache"
+
+
+def test_compiled_casm_is_reused_for_the_same_sierra_and_tests(
+    tmp_path: Path, mocker: MockerFixture
+):
+    mocker.patch(f"{MODULE}.cairo1.get_bindings_fingerprint", return_value="compiler")
+    compile_sierra_to_casm = mocker.patch(
+        f"{MODULE}.cairo1.compile_protostar_sierra_to_casm",
+        return_value={"bytecode": []},
+    )
+    mocker.patch(
+        f"{MODULE}.ProtostarCasm.from_json",
+        return_value=ProtostarCasm(program="program", offset_map={"test_a": 1}),  # type: ignore
+    )
+    cache = ProtostarCasmCache(project_root_path=tmp_path)
+
+    first_casm = cache.compile("sierra", [("test_a", None)])
+    second_casm = ProtostarCasmCache(project_root_path=tmp_path).compile(
+        "sierra", [("test_a", None)]
+    )
+
+    assert first_casm == second_casm
+    assert second_casm and second_casm.offset_map == {"test_a": 1}
+    assert compile_sierra_to_casm.call_count == 1
+
+    cache.compile("sierra", [("test_a", 100)])
+    cache.compile("other sierra", [("test_a", None)])
+
+    assert compile_sierra_to_casm.call_count == 3
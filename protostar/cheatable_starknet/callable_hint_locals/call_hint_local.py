@@ -1,6 +1,6 @@
-import asyncio
 from typing import Callable, Optional
 
+from protostar.cairo.hint_event_loop import run_in_hint_event_loop
 from protostar.starknet import CheatcodeException, RawAddress, Address, Selector
 from protostar.cheatable_starknet.controllers.contracts import (
     ContractsCheaterException,
@@ -39,7 +39,7 @@ class CallHintLocal(CallableHintLocal):
         function_name: CairoShortString,
         calldata: Optional[CairoData] = None,
     ) -> CallResult:
-        return asyncio.run(
+        return run_in_hint_event_loop(
             self._call(
                 contract_address=Address.from_user_input(contract_address),
                 entry_point_selector=Selector(short_string_to_str(function_name)),
@@ -1,6 +1,6 @@
-import asyncio
 from typing import Any, Protocol
 
+from protostar.cairo.hint_event_loop import run_in_hint_event_loop
 from protostar.cheatable_starknet.controllers.contracts import (
     ContractsController,
     DeclaredContract,
@@ -43,7 +43,7 @@ class DeclareCairo0HintLocal(CallableHintLocal):
                 contract_str
             )
         )
-        declared_class = asyncio.run(
+        declared_class = run_in_hint_event_loop(
             self._contracts_controller.declare_cairo0_contract(compiled_contract)
         )
 
@@ -1,10 +1,8 @@
-import asyncio
-from typing import Callable, Tuple
+from pathlib import Path
+from typing import Callable, Optional, Tuple
 
-from starkware.starknet.services.api.contract_class.contract_class import (
-    ContractClass,
-    CompiledClass,
-)
+from protostar.cairo.hint_event_loop import run_in_hint_event_loop
+from protostar.cairo.bindings.cairo_bindings import PackageName
 from protostar.cairo.short_string import short_string_to_str
 from protostar.cheatable_starknet.callable_hint_locals.callable_hint_local import (
     CallableHintLocal,
@@ -17,9 +15,11 @@ from protostar.cheatable_starknet.controllers.contracts import (
 from protostar.commands.cairo1_commands.fetch_from_scarb import (
     fetch_linked_libraries_from_scarb,
 )
-from protostar.cairo.contract_class import make_contract_class, make_compiled_class
+from protostar.compiler.cairo1_contract_compilation_cache import (
+    Cairo1ContractCompilationCache,
+    PrebuiltContractClasses,
+)
 from protostar.compiler.cairo1_contract_compiler import (
-    Cairo1ContractCompiler,
     SierraCompilationException,
     CasmCompilationException,
 )
@@ -35,9 +35,13 @@ class DeclareHintLocal(CallableHintLocal):
         self,
         contracts_controller: ContractsController,
         contract_path_resolver: ContractPathResolver,
+        contract_compilation_cache: Cairo1ContractCompilationCache,
+        linked_libraries: Optional[list[Tuple[Path, PackageName]]] = None,
     ):
         self._contracts_controller = contracts_controller
         self._contract_path_resolver = contract_path_resolver
+        self._contract_compilation_cache = contract_compilation_cache
+        self._linked_libraries = linked_libraries
 
     @property
     def name(self) -> str:
@@ -47,14 +51,15 @@ class DeclareHintLocal(CallableHintLocal):
         def declare(contract: int) -> DeclaredContract:
             contract_name = short_string_to_str(contract)
 
-            contract_class, compiled_class = _get_contract_classes(
+            prebuilt_classes = _get_contract_classes(
                 contract_name=contract_name,
             )
 
-            declared_class: DeclaredSierraClass = asyncio.run(
+            declared_class: DeclaredSierraClass = run_in_hint_event_loop(
                 self._contracts_controller.declare_sierra_contract(
-                    contract_class=contract_class,
-                    compiled_class=compiled_class,
+                    contract_class=prebuilt_classes.contract_class,
+                    compiled_class=prebuilt_classes.compiled_class,
+                    compiled_class_hash=prebuilt_classes.compiled_class_hash,
                 )
             )
 
@@ -62,7 +67,7 @@ class DeclareHintLocal(CallableHintLocal):
 
         def _get_contract_classes(
             contract_name: str,
-        ) -> Tuple[ContractClass, CompiledClass]:
+        ) -> PrebuiltContractClasses:
             try:
                 contract_path = (
                     self._contract_path_resolver.contract_path_from_contract_name(
@@ -75,15 +80,10 @@ class DeclareHintLocal(CallableHintLocal):
                 ) from ex
 
             try:
-                (
-                    sierra_compiled,
-                    casm_compiled,
-                ) = Cairo1ContractCompiler.compile_contract(
+                return self._contract_compilation_cache.compile_contract(
                     contract_name,
                     contract_path,
-                    linked_libraries=fetch_linked_libraries_from_scarb(
-                        self._contract_path_resolver.project_root_path
-                    ),
+                    linked_libraries=self._get_linked_libraries(),
                 )
             except SierraCompilationException as ex:
                 raise CheatcodeException(
@@ -94,8 +94,11 @@ class DeclareHintLocal(CallableHintLocal):
                     self, f"Compilation of contract {contract_name} to casm failed"
                 ) from ex
 
-            return make_contract_class(sierra_compiled), make_compiled_class(
-                casm_compiled
-            )
-
         return declare
+
+    def _get_linked_libraries(self) -> list[Tuple[Path, PackageName]]:
+        if self._linked_libraries is None:
+            self._linked_libraries = fetch_linked_libraries_from_scarb(
+                self._contract_path_resolver.project_root_path
+            )
+        return self._linked_libraries
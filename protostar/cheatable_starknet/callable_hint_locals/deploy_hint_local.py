@@ -1,8 +1,8 @@
-import asyncio
 from typing import Any, Callable
 
 from starkware.starkware_utils.error_handling import StarkException
 
+from protostar.cairo.hint_event_loop import run_in_hint_event_loop
 from protostar.cheatable_starknet.controllers.contracts import (
     ContractsController,
     PreparedContract,
@@ -32,7 +32,7 @@ class DeployHintLocal(CallableHintLocal):
         contract_address: int,
         class_hash: int,
     ):
-        return asyncio.run(
+        return run_in_hint_event_loop(
             self._run_deploy_prepared(
                 PreparedContract(
                     constructor_calldata=constructor_calldata,
@@ -1,6 +1,6 @@
-import asyncio
 from typing import Any, Optional, List
 
+from protostar.cairo.hint_event_loop import run_in_hint_event_loop
 from protostar.cairo.short_string import short_string_to_str, CairoShortString
 from protostar.cheatable_starknet.callable_hint_locals.callable_hint_local import (
     CallableHintLocal,
@@ -47,7 +47,7 @@ class InvokeHintLocal(CallableHintLocal):
         calldata: Optional[List[int]] = None,
     ):
         try:
-            asyncio.run(
+            run_in_hint_event_loop(
                 self._contracts_controller.invoke(
                     contract_address=contract_address,
                     entry_point_selector=entry_point_selector,
@@ -1,6 +1,6 @@
-import asyncio
 from typing import Any, Callable, Optional, List
 
+from protostar.cairo.hint_event_loop import run_in_hint_event_loop
 from protostar.cheatable_starknet.callable_hint_locals.callable_hint_local import (
     CallableHintLocal,
 )
@@ -30,7 +30,7 @@ class PrepareHintLocal(CallableHintLocal):
         class_hash: int,
         calldata: Optional[List[int]] = None,
     ) -> PreparedContract:
-        return asyncio.run(
+        return run_in_hint_event_loop(
             self._prepare(
                 class_hash=class_hash,
                 constructor_calldata=calldata,
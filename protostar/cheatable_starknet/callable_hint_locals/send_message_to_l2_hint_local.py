@@ -1,6 +1,6 @@
-import asyncio
 from typing import Optional
 
+from protostar.cairo.hint_event_loop import run_in_hint_event_loop
 from protostar.cheatable_starknet.controllers.contracts import ContractsController
 from protostar.starknet import RawAddress, Address, CairoData
 from protostar.starknet.selector import Selector
@@ -24,7 +24,7 @@ class SendMessageToL2HintLocal(CallableHintLocal):
             to_address: RawAddress,
             payload: Optional[CairoData] = None,
         ) -> None:
-            asyncio.run(
+            run_in_hint_event_loop(
                 self._contracts_controller.send_message_to_l2(
                     from_l1_address=Address.from_user_input(from_address),
                     to_l2_address=Address.from_user_input(to_address),
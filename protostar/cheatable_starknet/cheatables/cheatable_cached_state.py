@@ -19,11 +19,31 @@ from protostar.cheatable_starknet.controllers.expect_events_controller import Ev
 from protostar.starknet.address import Address
 from protostar.cheatable_starknet.controllers.block_info import BlockInfoController
 from protostar.starknet.selector import Selector
+from protostar.starknet.state_forking import fork_state_cache
 from protostar.starknet.types import ClassHashType
 from protostar.starknet.data_transformer import CairoData
 from protostar.cheatable_starknet.controllers.expect_call_controller import ExpectedCall
 
 
+# Flat dictionaries of cheats, copied on fork and merged into the parent state on apply
+_CHEAT_MAP_NAMES = (
+    "_target_address_to_pranked_address",
+    "event_selector_to_name_map",
+    "event_name_to_contract_abi_map",
+    "class_hash_to_contract_abi_map",
+    "contract_address_to_class_hash_map",
+    "contract_address_to_block_timestamp",
+    "contract_address_to_block_number",
+    "contract_address_to_version",
+    "contract_address_to_account_contract_address",
+    "contract_address_to_max_fee",
+    "contract_address_to_signature",
+    "contract_address_to_transaction_hash",
+    "contract_address_to_chain_id",
+    "contract_address_to_nonce",
+)
+
+
 # pylint: disable=too-many-instance-attributes
 class CheatableCachedState(CachedState):
     def __init__(
@@ -96,6 +116,30 @@ class CheatableCachedState(CachedState):
     async def get_contract_class(self, class_hash: int) -> CompiledClassBase:
         return await self.get_compiled_class(class_hash)
 
+    def fork(self) -> "CheatableCachedState":
+        """
+        Creates an independent copy of the state without deep copying classes
+        and without stacking another `CachedState` layer on top of this one.
+        """
+        state_reader, cache = fork_state_cache(self)
+        forked = CheatableCachedState(
+            block_info=self.block_info,
+            state_reader=state_reader,
+            # Classes are shared, but a class declared by one fork must not be visible in others
+            compiled_class_cache=dict(self.compiled_classes),
+        )
+        forked.cache = cache
+        self._copy_cheats_to(forked)
+        forked.mocked_calls = {
+            address: mocked_calls.copy()
+            for address, mocked_calls in self.mocked_calls.items()
+        }
+        forked.expected_contract_calls = {
+            address: expected_calls.copy()
+            for address, expected_calls in self.expected_contract_calls.items()
+        }
+        return forked
+
     def _copy(self):
         copied = CheatableCachedState(
             block_info=self.block_info,
@@ -103,131 +147,32 @@ class CheatableCachedState(CachedState):
             compiled_class_cache=self.compiled_classes,
         )
 
-        copied._target_address_to_pranked_address = (
-            self._target_address_to_pranked_address.copy()
-        )
-        copied.mocked_calls = self.mocked_calls.copy()
-
-        copied.event_selector_to_name_map = self.event_selector_to_name_map.copy()
-
-        copied.event_name_to_contract_abi_map = (
-            self.event_name_to_contract_abi_map.copy()
-        )
-        copied.class_hash_to_contract_abi_map = (
-            self.class_hash_to_contract_abi_map.copy()
-        )
-        copied.contract_address_to_class_hash_map = (
-            self.contract_address_to_class_hash_map.copy()
-        )
-        copied.expected_contract_calls = self.expected_contract_calls.copy()
-
-        copied.contract_address_to_block_timestamp = (
-            self.contract_address_to_block_timestamp.copy()
-        )
-        copied.contract_address_to_block_number = (
-            self.contract_address_to_block_number.copy()
-        )
-        copied.emitted_events = self.emitted_events.copy()
-
-        copied.contract_address_to_version = self.contract_address_to_version.copy()
-        copied.contract_address_to_account_contract_address = (
-            self.contract_address_to_account_contract_address.copy()
-        )
-        copied.contract_address_to_max_fee = self.contract_address_to_max_fee.copy()
-        copied.contract_address_to_signature = self.contract_address_to_signature.copy()
-        copied.contract_address_to_transaction_hash = (
-            self.contract_address_to_transaction_hash.copy()
-        )
-        copied.contract_address_to_chain_id = self.contract_address_to_chain_id.copy()
-        copied.contract_address_to_nonce = self.contract_address_to_nonce.copy()
-
+        self._copy_cheats_to(copied)
         return copied
 
+    def _copy_cheats_to(self, other: "CheatableCachedState"):
+        for name in _CHEAT_MAP_NAMES:
+            setattr(other, name, getattr(self, name).copy())
+        other.mocked_calls = self.mocked_calls.copy()
+        other.expected_contract_calls = self.expected_contract_calls.copy()
+        other.emitted_events = self.emitted_events.copy()
+
     def _apply(self, parent: Self):
         assert isinstance(parent, self.__class__)
         super()._apply(parent)
 
-        parent._target_address_to_pranked_address = {
-            **parent._target_address_to_pranked_address,
-            **self._target_address_to_pranked_address,
-        }
-
-        parent.mocked_calls = {**parent.mocked_calls}
-
-        # pylint: disable=consider-using-dict-items
-        for address in self.mocked_calls:
-            if address in parent.mocked_calls:
-                parent.mocked_calls[address] = {
-                    **parent.mocked_calls[address],
-                    **self.mocked_calls[address],
-                }
-            else:
-                parent.mocked_calls[address] = self.mocked_calls[address]
-
-        parent.event_selector_to_name_map = {
-            **parent.event_selector_to_name_map,
-            **self.event_selector_to_name_map,
-        }
+        for name in _CHEAT_MAP_NAMES:
+            getattr(parent, name).update(getattr(self, name))
 
-        parent.event_name_to_contract_abi_map = {
-            **parent.event_name_to_contract_abi_map,
-            **self.event_name_to_contract_abi_map,
-        }
+        for address, mocked_calls in self.mocked_calls.items():
+            parent.mocked_calls.setdefault(address, {}).update(mocked_calls)
 
-        parent.class_hash_to_contract_abi_map = {
-            **parent.class_hash_to_contract_abi_map,
-            **self.class_hash_to_contract_abi_map,
-        }
-        parent.contract_address_to_class_hash_map = {
-            **parent.contract_address_to_class_hash_map,
-            **self.contract_address_to_class_hash_map,
-        }
-        parent.expected_contract_calls = {
-            **parent.expected_contract_calls,
-            **self.expected_contract_calls,
-        }
-        parent.contract_address_to_block_timestamp = {
-            **parent.contract_address_to_block_timestamp,
-            **self.contract_address_to_block_timestamp,
-        }
-        parent.contract_address_to_block_number = {
-            **parent.contract_address_to_block_number,
-            **self.contract_address_to_block_number,
-        }
+        parent.expected_contract_calls.update(self.expected_contract_calls)
         parent.emitted_events = [
             *parent.emitted_events,
             *self.emitted_events,
         ]
 
-        parent.contract_address_to_version = {
-            **parent.contract_address_to_version,
-            **self.contract_address_to_version,
-        }
-        parent.contract_address_to_account_contract_address = {
-            **parent.contract_address_to_account_contract_address,
-            **self.contract_address_to_account_contract_address,
-        }
-        parent.contract_address_to_max_fee = {
-            **parent.contract_address_to_max_fee,
-            **self.contract_address_to_max_fee,
-        }
-        parent.contract_address_to_signature = {
-            **parent.contract_address_to_signature,
-            **self.contract_address_to_signature,
-        }
-        parent.contract_address_to_transaction_hash = {
-            **parent.contract_address_to_transaction_hash,
-            **self.contract_address_to_transaction_hash,
-        }
-        parent.contract_address_to_chain_id = {
-            **parent.contract_address_to_chain_id,
-            **self.contract_address_to_chain_id,
-        }
-        parent.contract_address_to_nonce = {
-            **parent.contract_address_to_nonce,
-            **self.contract_address_to_nonce,
-        }
-
     def update_event_selector_to_name_map(
         self, local_event_selector_to_name_map: Dict[int, str]
     ):
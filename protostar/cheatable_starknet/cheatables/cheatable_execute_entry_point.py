@@ -15,7 +15,6 @@ from starkware.starknet.business_logic.execution.objects import (
     TransactionExecutionContext,
     ExecutionResourcesManager,
 )
-from starkware.cairo.common.cairo_function_runner import CairoFunctionRunner
 from starkware.cairo.lang.vm.relocatable import RelocatableValue, MaybeRelocatable
 from starkware.python.utils import to_bytes, as_non_optional
 from starkware.starknet.business_logic.execution.execute_entry_point import (
@@ -45,6 +44,7 @@ from starkware.starknet.services.api.contract_class.contract_class import (
     CompiledClass,
 )
 
+from protostar.cairo.compiled_hint_cache import CachedHintsCairoFunctionRunner
 from protostar.starknet import Address
 from protostar.cheatable_starknet.controllers.transaction_revert_exception import (
     TransactionRevertException,
@@ -101,7 +101,7 @@ class CheatableExecuteEntryPoint(ExecuteEntryPoint):
 
         # Prepare runner.
         with wrap_with_stark_exception(code=StarknetErrorCode.SECURITY_ERROR):
-            runner = CairoFunctionRunner(
+            runner = CachedHintsCairoFunctionRunner(
                 program=compiled_class.program,
                 layout=STARKNET_LAYOUT_INSTANCE.layout_name,
             )
@@ -242,7 +242,7 @@ class CheatableExecuteEntryPoint(ExecuteEntryPoint):
             entrypoint_builtins=as_non_optional(entry_point.builtins)
         )
         with wrap_with_stark_exception(code=StarknetErrorCode.SECURITY_ERROR):
-            runner = CairoFunctionRunner(
+            runner = CachedHintsCairoFunctionRunner(
                 program=program,
                 layout=layout,
                 additional_builtin_factories=dict(
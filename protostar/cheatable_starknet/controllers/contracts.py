@@ -124,15 +124,18 @@ class ContractsController:
         self,
         contract_class: ContractClass,
         compiled_class: CompiledClass,
+        compiled_class_hash: Optional[int] = None,
     ) -> DeclaredSierraClass:
         """
         Declare a sierra contract.
 
         @param contract_class: sierra compiled contract to be declared
         @param compiled_class: casm compiled contract to be declared
+        @param compiled_class_hash: precomputed hash of the compiled_class
         @return: DeclaredSierraClass instance.
         """
-        compiled_class_hash = compute_compiled_class_hash(compiled_class)
+        if compiled_class_hash is None:
+            compiled_class_hash = compute_compiled_class_hash(compiled_class)
 
         starknet_config = StarknetGeneralConfig()
         tx = NonValidatedInternalDeclare.create(
@@ -1,6 +1,6 @@
 from typing import List, Optional, TYPE_CHECKING
 
-from protostar.starknet import calc_address, BreakingReportedException
+from protostar.starknet import calc_address_range, BreakingReportedException
 
 if TYPE_CHECKING:
     from protostar.cheatable_starknet.cheatables.cheatable_cached_state import (
@@ -19,11 +19,11 @@ class StorageController:
         value: List[int],
         key: Optional[List[int]] = None,
     ):
-        variable_address = calc_address(variable_name, key or [])
-        for i, val in enumerate(value):
+        addresses = calc_address_range(variable_name, key or [], len(value))
+        for address, val in zip(addresses, value):
             await self._cheatable_state.set_storage_at(
                 contract_address=target_contract_address,
-                key=variable_address + i,
+                key=address,
                 value=val,
             )
 
@@ -34,14 +34,14 @@ class StorageController:
         variable_type: str,
         key: Optional[List[int]] = None,
     ) -> List[int]:
-        variable_address = calc_address(variable_name, key or [])
         variable_size = self._get_variable_size(target_contract_address, variable_type)
+        addresses = calc_address_range(variable_name, key or [], variable_size)
 
         return [
             await self._cheatable_state.get_storage_at(
-                contract_address=target_contract_address, key=variable_address + i
+                contract_address=target_contract_address, key=address
             )
-            for i in range(variable_size)
+            for address in addresses
         ]
 
     def _get_variable_size(self, contract_address: int, variable_type: str) -> int:
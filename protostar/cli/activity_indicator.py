@@ -38,7 +38,7 @@ class ActivityIndicator:
             print("\r" + " " * cols, end="\r", flush=True)
 
     def __enter__(self):
-        self.start()
+        return self.start()
 
     def __exit__(self, *args: Any, **kwargs: Any):
         self.stop()
@@ -5,7 +5,7 @@ from starknet_py.net.gateway_client import GatewayClient
 from starknet_py.net.models import StarknetChainId
 
 from protostar.protostar_exception import ProtostarException
-from protostar.starknet_gateway import NetworkConfig
+from protostar.starknet_gateway import GatewayClientFactory, NetworkConfig
 from protostar.starknet_gateway.network_config import NETWORKS
 from .protostar_argument import ProtostarArgument
 
@@ -50,8 +50,9 @@ class NetworkCommandUtil:
         ),
     ]
 
-    def __init__(self, args: Any):
+    def __init__(self, args: Any, gateway_client_factory: GatewayClientFactory):
         self._args = args
+        self._gateway_client_factory = gateway_client_factory
 
     def validate_network_command_args(self):
         if self._args.network is None and self._args.gateway_url is None:
@@ -74,7 +75,7 @@ class NetworkCommandUtil:
 
     def get_gateway_client(self) -> GatewayClient:
         network_config = self.get_network_config()
-        return GatewayClient(network_config.gateway_url)
+        return self._gateway_client_factory.create(network_config.gateway_url)
 
     @staticmethod
     def _normalize_chain_id(
@@ -10,6 +10,7 @@ from protostar.cli.network_command_util import (
     NetworkCommandUtil,
 )
 from protostar.protostar_exception import ProtostarException
+from protostar.starknet_gateway import GatewayClientFactory
 
 
 class CreateNetworkCommandUtilFixture(Protocol):
@@ -28,7 +29,7 @@ def create_network_command_util_fixture() -> CreateNetworkCommandUtilFixture:
         args.network = network
         args.gateway_url = None
         args.chain_id = chain_id
-        return NetworkCommandUtil(args)
+        return NetworkCommandUtil(args, GatewayClientFactory())
 
     return create_network_command_util
 
@@ -46,7 +47,7 @@ def test_network_config_from_literal(network: str, result_gateway_url: str):
     args.network = network
     args.gateway_url = None
     args.chain_id = None
-    config = NetworkCommandUtil(args).get_network_config()
+    config = NetworkCommandUtil(args, GatewayClientFactory()).get_network_config()
     assert config.gateway_url == result_gateway_url
 
 
@@ -56,7 +57,7 @@ def test_mixin_throws_on_incorrect_network_name():
     args.gateway_url = None
     args.chain_id = None
     with pytest.raises(ProtostarException, match=re.escape("Unknown Starknet network")):
-        NetworkCommandUtil(args).get_network_config()
+        NetworkCommandUtil(args, GatewayClientFactory()).get_network_config()
 
 
 def test_mixin_throws_on_no_chain_id_with_custom_gateway_url():
@@ -67,7 +68,7 @@ def test_mixin_throws_on_no_chain_id_with_custom_gateway_url():
     with pytest.raises(
         ProtostarException, match=re.escape("Argument `chain-id` is required")
     ):
-        NetworkCommandUtil(args).get_network_config()
+        NetworkCommandUtil(args, GatewayClientFactory()).get_network_config()
 
 
 def test_mixin_throws_on_no_sufficient_args():
@@ -81,7 +82,7 @@ def test_mixin_throws_on_no_sufficient_args():
             f"Argument `{GATEWAY_URL_ARG_NAME}` or `{NETWORK_ARG_NAME}` is required"
         ),
     ):
-        NetworkCommandUtil(args).get_network_config()
+        NetworkCommandUtil(args, GatewayClientFactory()).get_network_config()
 
 
 def test_printing_invalid_chain_id(
@@ -10,7 +10,7 @@ from .legacy_commands import (
     InitCairo0Command,
 )
 from .calculate_account_address_command import CalculateAccountAddressCommand
-from .call import CallCommand
+from .call import CallCommand, BatchCallCommand
 from .legacy_commands.declare_cairo0 import DeclareCairo0Command
 from .deploy_account_command import DeployAccountCommand
 from .deploy_command import DeployCommand
@@ -1,8 +1,9 @@
 import logging
+import multiprocessing
 from dataclasses import dataclass
 from pathlib import Path
 from textwrap import dedent
-from typing import Optional, Any
+from typing import Iterator, Optional, Any, Tuple, Union
 
 from protostar.cli import ProtostarCommand, MessengerFactory
 from protostar.cli.common_arguments import (
@@ -13,15 +14,42 @@ from protostar.cairo.contract_class import (
     compute_class_hash_from_sierra_code,
     compute_compiled_class_hash_from_casm_code,
 )
+from protostar.cairo.bindings.cairo_bindings import PackageName
+from protostar.compiler import BuildManifest, compute_cairo1_contract_inputs_hash
 from protostar.compiler.cairo1_contract_compiler import Cairo1ContractCompiler
 from protostar.configuration_file.configuration_file import ConfigurationFile
 from protostar.io import StructuredMessage, LogColorProvider, Messenger
+from protostar.protostar_exception import ProtostarException
 
 from protostar.commands.cairo1_commands.fetch_from_scarb import (
     fetch_linked_libraries_from_scarb,
 )
 
 
+ClassHashes = Tuple[int, int]
+CompilationTask = Tuple[str, Path, list[Tuple[Path, PackageName]], Path]
+
+
+# Note: This function has to be top-level function, because it is being pickled by multiprocessing.
+def _compile_contract(
+    task: CompilationTask,
+) -> Union[ClassHashes, ProtostarException]:
+    contract_name, contract_path, linked_libraries, output_dir = task
+    try:
+        sierra_compiled, casm_compiled = Cairo1ContractCompiler.compile_contract(
+            contract_name=contract_name,
+            contract_path=contract_path,
+            linked_libraries=linked_libraries,
+            output_dir=output_dir,
+        )
+    except ProtostarException as ex:
+        return ex
+    return (
+        compute_class_hash_from_sierra_code(sierra_compiled),
+        compute_compiled_class_hash_from_casm_code(casm_compiled),
+    )
+
+
 @dataclass
 class SuccessfulBuildCairo1Message(StructuredMessage):
     contract_name: str
@@ -91,12 +119,7 @@ class BuildCommand(ProtostarCommand):
             logging.error("Build failed")
             raise ex
 
-    async def _build_contract(
-        self,
-        contract_name: str,
-        output_dir: Path,
-        messenger: Messenger,
-    ):
+    def _get_contract_path(self, contract_name: str) -> Path:
         contract_paths = self._configuration_file.get_contract_source_paths(
             contract_name
         )
@@ -106,19 +129,25 @@ class BuildCommand(ProtostarCommand):
             f"Multiple files found for contract {contract_name}, "
             f"only one file per contract is supported in cairo1!"
         )
+        return contract_paths[0]
 
-        sierra_compiled, casm_compiled = Cairo1ContractCompiler.compile_contract(
-            contract_name=contract_name,
-            contract_path=contract_paths[0],
-            linked_libraries=fetch_linked_libraries_from_scarb(
-                package_root_path=self._project_root_path,
-            ),
-            output_dir=output_dir,
-        )
-
-        class_hash = compute_class_hash_from_sierra_code(sierra_compiled)
-        compiled_class_hash = compute_compiled_class_hash_from_casm_code(casm_compiled)
+    @staticmethod
+    def _get_output_paths(contract_name: str, output_dir: Path) -> list[Path]:
+        return [
+            (output_dir / contract_name).with_suffix(suffix)
+            for suffix in (
+                ".sierra.json",
+                ".casm.json",
+                ".class_hash",
+                ".compiled_class_hash",
+            )
+        ]
 
+    @staticmethod
+    def _write_class_hashes(
+        contract_name: str, output_dir: Path, class_hashes: ClassHashes
+    ):
+        class_hash, compiled_class_hash = class_hashes
         with open(
             output_dir / (contract_name + ".class_hash"), mode="w", encoding="utf-8"
         ) as output_file:
@@ -131,9 +160,20 @@ class BuildCommand(ProtostarCommand):
         ) as output_file:
             output_file.write(f"{hex(compiled_class_hash)}")
 
-        messenger(
-            SuccessfulBuildCairo1Message(contract_name, class_hash, compiled_class_hash)
-        )
+    @staticmethod
+    def _compile_contracts(
+        tasks: list[CompilationTask],
+    ) -> Iterator[Union[ClassHashes, ProtostarException]]:
+        """
+        Compiles independent contracts in parallel, yielding results in the order of `tasks`.
+        """
+        if len(tasks) < 2:
+            yield from map(_compile_contract, tasks)
+            return
+        with multiprocessing.Pool(
+            processes=min(multiprocessing.cpu_count(), len(tasks))
+        ) as pool:
+            yield from pool.imap(_compile_contract, tasks)
 
     async def build(
         self,
@@ -144,16 +184,62 @@ class BuildCommand(ProtostarCommand):
         if not output_dir.is_absolute():
             output_dir = self._project_root_path / output_dir
 
-        if target_contract_name:
-            await self._build_contract(
-                contract_name=target_contract_name,
-                output_dir=output_dir,
-                messenger=messenger,
+        contract_names = (
+            [target_contract_name]
+            if target_contract_name
+            else self._configuration_file.get_contract_names()
+        )
+        linked_libraries = fetch_linked_libraries_from_scarb(
+            package_root_path=self._project_root_path,
+        )
+        manifest = BuildManifest(self._project_root_path, output_dir)
+
+        inputs_hashes: dict[str, str] = {}
+        up_to_date_outputs: dict[str, dict] = {}
+        tasks: list[CompilationTask] = []
+        for contract_name in contract_names:
+            contract_path = self._get_contract_path(contract_name)
+            inputs_hashes[contract_name] = compute_cairo1_contract_inputs_hash(
+                contract_path, linked_libraries
             )
-            return
-        for contract_name in self._configuration_file.get_contract_names():
-            await self._build_contract(
-                contract_name=contract_name,
-                output_dir=output_dir,
-                messenger=messenger,
+            outputs = manifest.get_outputs(
+                contract_name,
+                inputs_hashes[contract_name],
+                self._get_output_paths(contract_name, output_dir),
             )
+            if outputs:
+                up_to_date_outputs[contract_name] = outputs
+            else:
+                tasks.append(
+                    (contract_name, contract_path, linked_libraries, output_dir)
+                )
+
+        compilation_results = self._compile_contracts(tasks)
+        try:
+            for contract_name in contract_names:
+                outputs = up_to_date_outputs.get(contract_name)
+                if outputs:
+                    class_hashes = (
+                        int(outputs["class_hash"], 16),
+                        int(outputs["compiled_class_hash"], 16),
+                    )
+                else:
+                    result = next(compilation_results)
+                    if isinstance(result, ProtostarException):
+                        raise result
+                    class_hashes = result
+                    self._write_class_hashes(contract_name, output_dir, class_hashes)
+                    manifest.set_outputs(
+                        contract_name,
+                        inputs_hashes[contract_name],
+                        {
+                            "class_hash": hex(class_hashes[0]),
+                            "compiled_class_hash": hex(class_hashes[1]),
+                        },
+                        self._get_output_paths(contract_name, output_dir),
+                    )
+
+                messenger(SuccessfulBuildCairo1Message(contract_name, *class_hashes))
+        finally:
+            compilation_results.close()
+            manifest.save()
@@ -30,6 +30,7 @@ from protostar.compiler.cairo1_contract_compiler import Cairo1ContractCompiler
 from protostar.contract_path_resolver import ContractPathResolver
 from protostar.starknet import Address
 from protostar.starknet_gateway import (
+    GatewayClientFactory,
     SuccessfulDeclareResponse,
     create_block_explorer,
     Fee,
@@ -42,9 +43,11 @@ class DeclareCommand(ProtostarCommand):
         self,
         contract_path_resolver: ContractPathResolver,
         gateway_facade_factory: GatewayFacadeFactory,
+        gateway_client_factory: GatewayClientFactory,
         messenger_factory: MessengerFactory,
     ):
         self._gateway_facade_factory = gateway_facade_factory
+        self._gateway_client_factory = gateway_client_factory
         self._messenger_factory = messenger_factory
         self._contract_path_resolver = contract_path_resolver
 
@@ -90,7 +93,7 @@ class DeclareCommand(ProtostarCommand):
         assert args.token is None or isinstance(args.token, str)
         assert isinstance(args.wait_for_acceptance, bool)
 
-        network_command_util = NetworkCommandUtil(args)
+        network_command_util = NetworkCommandUtil(args, self._gateway_client_factory)
         network_config = network_command_util.get_network_config()
         gateway_client = network_command_util.get_gateway_client()
         signer = get_signer(args, network_config, args.account_address)
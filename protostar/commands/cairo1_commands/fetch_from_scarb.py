@@ -11,6 +11,11 @@ import logging
 from protostar.protostar_exception import ProtostarException
 from protostar.cairo.bindings.cairo_bindings import PackageName
 
+SCARB_MANIFEST_FILE_NAMES = ("Scarb.toml", "Scarb.lock")
+
+# (manifest path, manifest fingerprint) -> metadata
+_scarb_metadata_cache: Dict[Tuple[Path, Tuple], Dict] = {}
+
 
 class ScarbMetadataFetchException(ProtostarException):
     def __init__(self, message: str, details: Optional[str] = None):
@@ -19,7 +24,31 @@ class ScarbMetadataFetchException(ProtostarException):
         )
 
 
+def get_scarb_manifest_fingerprint(package_root_path: Path) -> Tuple:
+    fingerprint = []
+    for file_name in SCARB_MANIFEST_FILE_NAMES:
+        try:
+            stat = (package_root_path / file_name).stat()
+            fingerprint.append((file_name, stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            fingerprint.append((file_name, None, None))
+    return tuple(fingerprint)
+
+
 def read_scarb_metadata(scarb_toml_path: Path) -> Dict:
+    """
+    Runs `scarb metadata` once per process for each version of Scarb.toml and Scarb.lock.
+    """
+    cache_key = (
+        scarb_toml_path.resolve(),
+        get_scarb_manifest_fingerprint(scarb_toml_path.parent),
+    )
+    if cache_key not in _scarb_metadata_cache:
+        _scarb_metadata_cache[cache_key] = _run_scarb_metadata(scarb_toml_path)
+    return _scarb_metadata_cache[cache_key]
+
+
+def _run_scarb_metadata(scarb_toml_path: Path) -> Dict:
     scarb_path = shutil.which("scarb")
     if not scarb_path:
         raise ProtostarException(
@@ -0,0 +1,29 @@
+import os
+from pathlib import Path
+
+from pytest_mock import MockerFixture
+
+from .fetch_from_scarb import read_scarb_metadata
+
+
+def test_scarb_metadata_is_cached_until_manifest_changes(
+    tmp_path: Path, mocker: MockerFixture
+):
+    run_scarb_metadata = mocker.patch(
+        "protostar.commands.cairo1_commands.fetch_from_scarb._run_scarb_metadata",
+        return_value={"workspace": {}},
+    )
+    scarb_toml_path = tmp_path / "Scarb.toml"
+    scarb_toml_path.write_text("[package]", encoding="utf-8")
+
+    read_scarb_metadata(scarb_toml_path)
+    read_scarb_metadata(scarb_toml_path)
+    assert run_scarb_metadata.call_count == 1
+
+    (tmp_path / "Scarb.lock").write_text("version = 1", encoding="utf-8")
+    read_scarb_metadata(scarb_toml_path)
+    assert run_scarb_metadata.call_count == 2
+
+    os.utime(scarb_toml_path, ns=(1, 1))
+    read_scarb_metadata(scarb_toml_path)
+    assert run_scarb_metadata.call_count == 3
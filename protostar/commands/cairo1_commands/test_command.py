@@ -2,13 +2,19 @@ from argparse import Namespace
 from pathlib import Path
 from typing import Optional, Tuple
 
-from protostar.cli import ProtostarArgument, ProtostarCommand, MessengerFactory
+from protostar.cli import (
+    ActivityIndicator,
+    ProtostarArgument,
+    ProtostarCommand,
+    MessengerFactory,
+)
 from protostar.io.log_color_provider import LogColorProvider
 from protostar.self.cache_io import CacheIO
 from protostar.self.protostar_directory import ProtostarDirectory
 from protostar.testing import (
     TestingSummary,
     TestScheduler,
+    TestDurations,
     determine_testing_seed,
 )
 from protostar.io.output import Messenger
@@ -102,6 +108,15 @@ A glob or globs to a directory or a test suite, for example:
                 description="Print the slowest tests at the end.",
                 default=0,
             ),
+            ProtostarArgument(
+                name="shard-size",
+                type="int",
+                description=(
+                    "Split test suites with more test cases than this number into shards, "
+                    "which idle workers run in parallel. "
+                    "Each shard compiles its test cases to CASM separately."
+                ),
+            ),
             ProtostarArgument(
                 name="last-failed",
                 short_name="lf",
@@ -114,8 +129,11 @@ A glob or globs to a directory or a test suite, for example:
         if not vars(args).get("json"):
             args.json = None
         messenger = self._messenger_factory.from_args(args)
-        cache = TestCommandCache(CacheIO(self._project_root_path))
+        cache = TestCommandCache(
+            CacheIO(self._project_root_path), project_root_path=self._project_root_path
+        )
 
+        test_durations = cache.obtain_test_durations()
         summary = await self.test(
             targets=cache.obtain_targets(args.target, args.last_failed),
             ignored_targets=args.ignore,
@@ -125,9 +143,12 @@ A glob or globs to a directory or a test suite, for example:
             no_progress_bar=args.no_progress_bar,
             exit_first=args.exit_first,
             slowest_tests_to_report_count=args.report_slowest_tests,
+            shard_size=args.shard_size,
+            test_durations=test_durations,
             messenger=messenger,
         )
         cache.write_failed_tests_to_cache(summary)
+        cache.write_test_durations_to_cache(summary, test_durations)
 
         summary.assert_all_passed()
         return summary
@@ -141,15 +162,33 @@ A glob or globs to a directory or a test suite, for example:
         no_progress_bar: bool = False,
         exit_first: bool = False,
         slowest_tests_to_report_count: int = 0,
+        shard_size: Optional[int] = None,
+        test_durations: Optional[TestDurations] = None,
     ) -> TestingSummary:
         testing_seed = determine_testing_seed(seed=None)
 
-        test_collector = Cairo1TestCollector(linked_libraries or [])
-        test_collector_result = test_collector.collect(
-            targets=targets,
-            ignored_targets=ignored_targets,
-            default_test_suite_glob=str(self._project_root_path),
+        collecting_message = self._log_color_provider.colorize(
+            "GRAY", "Collecting tests"
         )
+        with ActivityIndicator(collecting_message) as activity_indicator:
+
+            def report_progress(collected_count: int, total_count: int):
+                activity_indicator.message = (
+                    f"{collecting_message} ({collected_count}/{total_count})"
+                )
+
+            test_collector = Cairo1TestCollector(
+                linked_libraries or [],
+                on_progress=report_progress,
+                collection_index=Cairo1TestCollector.create_collection_index(
+                    self._project_root_path
+                ),
+            )
+            test_collector_result = test_collector.collect(
+                targets=targets,
+                ignored_targets=ignored_targets,
+                default_test_suite_glob=str(self._project_root_path),
+            )
 
         messenger(TestCollectorResultMessage(test_collector_result))
 
@@ -168,9 +207,11 @@ A glob or globs to a directory or a test suite, for example:
                 project_root_path=self._project_root_path,
                 write=messenger,
             )
-            worker = Cairo1TestRunner.worker
-
-            TestScheduler(live_logger=live_logger, worker=worker).run(
+            TestScheduler(
+                live_logger=live_logger,
+                worker=Cairo1TestRunner.worker,
+                prewarm=Cairo1TestRunner.prewarm,
+            ).run(
                 include_paths=[
                     str(package_path)
                     for package_path, package_name in linked_libraries or []
@@ -185,6 +226,9 @@ A glob or globs to a directory or a test suite, for example:
                 active_profile_name=self._active_profile_name,
                 cwd=self._cwd,
                 gas_estimation_enabled=False,
+                linked_libraries=linked_libraries,
+                shard_size=shard_size,
+                test_durations=test_durations,
                 on_exit_first=lambda: messenger(
                     TestingSummaryResultMessage(
                         test_collector_result=test_collector_result,
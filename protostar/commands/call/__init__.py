@@ -1 +1,2 @@
 from .call_command import CallCommand
+from .batch_call_command import BatchCallCommand
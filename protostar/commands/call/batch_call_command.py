@@ -0,0 +1,139 @@
+import sys
+from pathlib import Path
+from typing import Any, Optional
+
+from starknet_py.net.gateway_client import GatewayClient
+
+from protostar.cli import (
+    NetworkCommandUtil,
+    ProtostarArgument,
+    ProtostarCommand,
+    MessengerFactory,
+)
+from protostar.io import Messenger
+from protostar.protostar_exception import ProtostarException
+from protostar.starknet_gateway import (
+    GatewayClientFactory,
+    GatewayFacadeFactory,
+    AbiResolver,
+    AbiResolutionCache,
+    DataTransformerPolicy,
+)
+from protostar.starknet_gateway.call import (
+    BatchCallResult,
+    BatchCallUseCase,
+    CallInput,
+    CallUseCase,
+    interpret_batch_call_file_content,
+)
+
+from .call_command_messages import BatchCallResultMessage
+
+BATCH_CALL_FILE_EXAMPLE = """[[call]]
+contract-address = "0x0123"
+function = "get_balance"
+
+[[call]]
+contract-address = "0x0123"
+function = "get_balance_of"
+# inputs accept felts or a mapping of argument names to values
+inputs = { user = 42 }"""
+
+
+class BatchCallCommand(ProtostarCommand):
+    DEFAULT_MAX_CONCURRENCY = 16
+
+    def __init__(
+        self,
+        project_root_path: Path,
+        messenger_factory: MessengerFactory,
+        gateway_facade_factory: GatewayFacadeFactory,
+        gateway_client_factory: GatewayClientFactory,
+    ):
+        self._project_root_path = project_root_path
+        self._messenger_factory = messenger_factory
+        self._gateway_facade_factory = gateway_facade_factory
+        self._gateway_client_factory = gateway_client_factory
+
+    @property
+    def name(self) -> str:
+        return "batch-call"
+
+    @property
+    def description(self) -> str:
+        return "Call many contracts on Starknet concurrently and print results as JSON lines."
+
+    @property
+    def example(self) -> Optional[str]:
+        return None
+
+    @property
+    def arguments(self):
+        return [
+            *NetworkCommandUtil.network_arguments,
+            ProtostarArgument(
+                name="file",
+                description=(
+                    "Path to a TOML file with call declarations, or `-` to read them from the standard input. "
+                    f"File example:\n\n```toml\n{BATCH_CALL_FILE_EXAMPLE}\n```"
+                ),
+                type="path",
+                is_required=True,
+                is_positional=True,
+            ),
+            ProtostarArgument(
+                name="max-concurrency",
+                description="The maximum number of calls sent at the same time.",
+                type="int",
+                default=self.DEFAULT_MAX_CONCURRENCY,
+            ),
+        ]
+
+    async def run(self, args: Any) -> list[BatchCallResult]:
+        write = self._messenger_factory.json()
+        network_command_util = NetworkCommandUtil(args, self._gateway_client_factory)
+        gateway_client = network_command_util.get_gateway_client()
+        file_content = (
+            sys.stdin.read() if str(args.file) == "-" else args.file.read_text()
+        )
+        results = await self.batch_call(
+            call_inputs=interpret_batch_call_file_content(file_content),
+            gateway_client=gateway_client,
+            write=write,
+            max_concurrency=args.max_concurrency,
+        )
+        failed_results_count = len([result for result in results if result.error])
+        if failed_results_count:
+            raise ProtostarException(
+                f"{failed_results_count} of {len(results)} calls failed"
+            )
+        return results
+
+    async def batch_call(
+        self,
+        call_inputs: list[CallInput],
+        gateway_client: GatewayClient,
+        write: Messenger,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> list[BatchCallResult]:
+        # All calls share the gateway client and resolved ABIs
+        gateway_facade = self._gateway_facade_factory.create(gateway_client)
+        abi_resolver = AbiResolver(
+            client=gateway_client,
+            abi_cache=AbiResolutionCache(
+                project_root_path=self._project_root_path,
+                network=str(gateway_client.net),
+            ),
+        )
+        call_use_case = CallUseCase(
+            gateway_facade=gateway_facade,
+            data_transformer_policy=DataTransformerPolicy(abi_resolver=abi_resolver),
+        )
+        batch_call_use_case = BatchCallUseCase(
+            call_use_case=call_use_case, max_concurrency=max_concurrency
+        )
+        results: list[BatchCallResult] = []
+        async for result in batch_call_use_case.execute(call_inputs):
+            write(BatchCallResultMessage(result))
+            results.append(result)
+        return results
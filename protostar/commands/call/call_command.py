@@ -17,8 +17,10 @@ from protostar.cli.common_arguments import (
 from protostar.starknet import Address, Selector
 from protostar.starknet.contract_abi import ContractAbi
 from protostar.starknet_gateway import (
+    GatewayClientFactory,
     GatewayFacadeFactory,
     AbiResolver,
+    AbiResolutionCache,
     DataTransformerPolicy,
 )
 from protostar.starknet_gateway.call import CallUseCase, CallInput, CairoOrPythonData
@@ -32,10 +34,12 @@ class CallCommand(ProtostarCommand):
         project_root_path: Path,
         messenger_factory: MessengerFactory,
         gateway_facade_factory: GatewayFacadeFactory,
+        gateway_client_factory: GatewayClientFactory,
     ):
         self._project_root_path = project_root_path
         self._messenger_factory = messenger_factory
         self._gateway_facade_factory = gateway_facade_factory
+        self._gateway_client_factory = gateway_client_factory
 
     @property
     def name(self) -> str:
@@ -62,7 +66,7 @@ class CallCommand(ProtostarCommand):
 
     async def run(self, args: Any) -> SuccessfulCallMessage:
         write = self._messenger_factory.from_args(args)
-        network_command_util = NetworkCommandUtil(args)
+        network_command_util = NetworkCommandUtil(args, self._gateway_client_factory)
         gateway_client = network_command_util.get_gateway_client()
         response = await self.call(
             contract_address=args.contract_address,
@@ -88,7 +92,13 @@ class CallCommand(ProtostarCommand):
             else None
         )
         gateway_facade = self._gateway_facade_factory.create(gateway_client)
-        abi_resolver = AbiResolver(client=gateway_client)
+        abi_resolver = AbiResolver(
+            client=gateway_client,
+            abi_cache=AbiResolutionCache(
+                project_root_path=self._project_root_path,
+                network=str(gateway_client.net),
+            ),
+        )
         data_transformer_policy = DataTransformerPolicy(abi_resolver=abi_resolver)
         call_use_case = CallUseCase(
             gateway_facade=gateway_facade,
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 
 from protostar.io.log_color_provider import LogColorProvider
 from protostar.io.output import StructuredMessage
-from protostar.starknet_gateway.call import CallOutput
+from protostar.starknet_gateway.call import BatchCallResult, CallOutput
 
 
 @dataclass
@@ -27,3 +27,31 @@ class SuccessfulCallMessage(StructuredMessage):
 
     def _get_response_as_json(self) -> str:
         return json.dumps(self.call_output.human_data, indent=4)
+
+
+@dataclass
+class BatchCallResultMessage(StructuredMessage):
+    result: BatchCallResult
+
+    def format_human(self, fmt: LogColorProvider) -> str:
+        call_input = self.result.call_input
+        header = f"[{self.result.index}] {call_input.address} {call_input.selector}"
+        if self.result.error is not None:
+            return f"{header}: " + fmt.colorize("RED", self.result.error.message)
+        assert self.result.call_output is not None
+        return f"{header}: " + fmt.bold(str(self.result.call_output.cairo_data))
+
+    def format_dict(self) -> dict:
+        call_input = self.result.call_input
+        result: dict = {
+            "index": self.result.index,
+            "contract_address": str(call_input.address),
+            "function": str(call_input.selector),
+        }
+        if self.result.error is not None:
+            result["error"] = self.result.error.message
+            return result
+        assert self.result.call_output is not None
+        result["raw_output"] = self.result.call_output.cairo_data
+        result["transformed_output"] = self.result.call_output.human_data
+        return result
@@ -22,7 +22,7 @@ from protostar.cli.common_arguments import (
 from protostar.cli.network_command_util import NetworkArgs
 from protostar.io import StructuredMessage, LogColorProvider
 from protostar.protostar_exception import ProtostarException
-from protostar.starknet_gateway import GatewayFacadeFactory
+from protostar.starknet_gateway import GatewayClientFactory, GatewayFacadeFactory
 from protostar.starknet_gateway.gateway_facade import DeployAccountArgs
 from protostar.starknet_gateway.type import ClassHash, Fee
 from protostar.starknet_gateway.gateway_response import SuccessfulDeployAccountResponse
@@ -40,8 +40,8 @@ class DeployAccountCommandArgs(NetworkArgs):
     max_fee: Fee
 
     @classmethod
-    def from_args(cls, args: Namespace):
-        network_util = NetworkCommandUtil(args)
+    def from_args(cls, args: Namespace, gateway_client_factory: GatewayClientFactory):
+        network_util = NetworkCommandUtil(args, gateway_client_factory)
         network_config = network_util.get_network_config()
         gateway_client = network_util.get_gateway_client()
 
@@ -96,9 +96,11 @@ class DeployAccountCommand(ProtostarCommand):
     def __init__(
         self,
         gateway_facade_factory: GatewayFacadeFactory,
+        gateway_client_factory: GatewayClientFactory,
         messenger_factory: MessengerFactory,
     ) -> None:
         self._gateway_facade_factory = gateway_facade_factory
+        self._gateway_client_factory = gateway_client_factory
         self._messenger_factory = messenger_factory
 
     @property
@@ -140,7 +142,9 @@ class DeployAccountCommand(ProtostarCommand):
     async def run(self, args: Namespace):
         write = self._messenger_factory.from_args(args)
 
-        typed_args = DeployAccountCommandArgs.from_args(args)
+        typed_args = DeployAccountCommandArgs.from_args(
+            args, self._gateway_client_factory
+        )
         deploy_account_args = self._map_typed_args_to_deploy_account_args(typed_args)
 
         response = await self._send_deploy_account_tx(
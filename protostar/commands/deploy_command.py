@@ -21,6 +21,7 @@ from protostar.cli.common_arguments import (
 from protostar.cli.network_command_util import NetworkCommandUtil
 from protostar.io import StructuredMessage, LogColorProvider
 from protostar.starknet_gateway import (
+    GatewayClientFactory,
     GatewayFacadeFactory,
     SuccessfulDeployResponse,
     BlockExplorer,
@@ -64,9 +65,11 @@ class DeployCommand(ProtostarCommand):
     def __init__(
         self,
         gateway_facade_factory: GatewayFacadeFactory,
+        gateway_client_factory: GatewayClientFactory,
         messenger_factory: MessengerFactory,
     ) -> None:
         self._gateway_facade_factory = gateway_facade_factory
+        self._gateway_client_factory = gateway_client_factory
         self._messenger_factory = messenger_factory
 
     @property
@@ -114,7 +117,7 @@ class DeployCommand(ProtostarCommand):
         ]
 
     async def run(self, args: Namespace):
-        network_command_util = NetworkCommandUtil(args)
+        network_command_util = NetworkCommandUtil(args, self._gateway_client_factory)
 
         network_config = network_command_util.get_network_config()
         gateway_client = network_command_util.get_gateway_client()
@@ -1,3 +1,4 @@
+from pathlib import Path
 from typing import Any, Optional
 
 from starknet_py.net.gateway_client import GatewayClient
@@ -23,12 +24,14 @@ from protostar.cli.common_arguments import (
 from protostar.io.output import Messenger
 from protostar.starknet import Address, CairoOrPythonData, Selector
 from protostar.starknet_gateway import (
+    GatewayClientFactory,
     Fee,
     GatewayFacadeFactory,
     create_block_explorer,
     AccountManager,
     DataTransformerPolicy,
     AbiResolver,
+    AbiResolutionCache,
     AccountConfig,
 )
 from protostar.starknet_gateway.block_explorer.block_explorer import BlockExplorer
@@ -45,10 +48,14 @@ from .messages import (
 class InvokeCommand(ProtostarCommand):
     def __init__(
         self,
+        project_root_path: Path,
         gateway_facade_factory: GatewayFacadeFactory,
+        gateway_client_factory: GatewayClientFactory,
         messenger_factory: MessengerFactory,
     ):
+        self._project_root_path = project_root_path
         self._gateway_facade_factory = gateway_facade_factory
+        self._gateway_client_factory = gateway_client_factory
         self._messenger_factory = messenger_factory
 
     @property
@@ -81,7 +88,7 @@ class InvokeCommand(ProtostarCommand):
 
     async def run(self, args: Any):
         write = self._messenger_factory.from_args(args)
-        network_command_util = NetworkCommandUtil(args)
+        network_command_util = NetworkCommandUtil(args, self._gateway_client_factory)
         network_config = network_command_util.get_network_config()
         gateway_client = network_command_util.get_gateway_client()
         signer = get_signer(args, network_config, args.account_address)
@@ -125,8 +132,15 @@ class InvokeCommand(ProtostarCommand):
             ),
             client=gateway_facade,
             gateway_url=gateway_url,
+            gateway_client_factory=self._gateway_client_factory,
+        )
+        abi_resolver = AbiResolver(
+            client=gateway_client,
+            abi_cache=AbiResolutionCache(
+                project_root_path=self._project_root_path,
+                network=str(gateway_client.net),
+            ),
         )
-        abi_resolver = AbiResolver(client=gateway_client)
         data_transformer_policy = DataTransformerPolicy(abi_resolver=abi_resolver)
         use_case_input = InvokeInput(
             address=contract_address,
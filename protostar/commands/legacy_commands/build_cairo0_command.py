@@ -105,5 +105,6 @@ class BuildCairo0Command(ProtostarCommand):
                 relative_cairo_path=relative_cairo_path or [],
             ),
             target_contract_name=contract_name or None,
+            parallel=True,
         )
         return class_hashes
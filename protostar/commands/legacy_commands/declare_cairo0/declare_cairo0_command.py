@@ -28,6 +28,7 @@ from protostar.commands.legacy_commands.declare_cairo0.declare_messages import (
 
 from protostar.starknet import Address
 from protostar.starknet_gateway import (
+    GatewayClientFactory,
     SuccessfulDeclareResponse,
     GatewayFacadeFactory,
     create_block_explorer,
@@ -42,9 +43,11 @@ class DeclareCairo0Command(ProtostarCommand):
     def __init__(
         self,
         gateway_facade_factory: GatewayFacadeFactory,
+        gateway_client_factory: GatewayClientFactory,
         messenger_factory: MessengerFactory,
     ):
         self._gateway_facade_factory = gateway_facade_factory
+        self._gateway_client_factory = gateway_client_factory
         self._messenger_factory = messenger_factory
 
     @property
@@ -89,7 +92,7 @@ class DeclareCairo0Command(ProtostarCommand):
         assert args.token is None or isinstance(args.token, str)
         assert isinstance(args.wait_for_acceptance, bool)
 
-        network_command_util = NetworkCommandUtil(args)
+        network_command_util = NetworkCommandUtil(args, self._gateway_client_factory)
         network_config = network_command_util.get_network_config()
         gateway_client = network_command_util.get_gateway_client()
         signer = get_signer(args, network_config, args.account_address)
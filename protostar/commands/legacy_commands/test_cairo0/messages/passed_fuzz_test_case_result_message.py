@@ -37,6 +37,10 @@ class PassedFuzzTestCaseResultMessage(StructuredMessage):
             info_items.append(
                 f"fuzz_runs={fmt.bold(self.passed_fuzz_test_case_result.fuzz_runs_count)}"
             )
+        if self.passed_fuzz_test_case_result.fuzz_examples_per_second is not None:
+            info_items.append(
+                f"fuzz_runs_per_second={fmt.bold(round(self.passed_fuzz_test_case_result.fuzz_examples_per_second))}"
+            )
 
         if self.passed_fuzz_test_case_result.execution_resources:
             if (
@@ -111,4 +115,8 @@ class PassedFuzzTestCaseResultMessage(StructuredMessage):
         }
         if self.passed_fuzz_test_case_result.fuzz_runs_count:
             result["fuzz_runs"] = str(self.passed_fuzz_test_case_result.fuzz_runs_count)
+        if self.passed_fuzz_test_case_result.fuzz_examples_per_second is not None:
+            result["fuzz_runs_per_second"] = str(
+                round(self.passed_fuzz_test_case_result.fuzz_examples_per_second)
+            )
         return result
@@ -9,21 +9,25 @@ from protostar.cli.common_arguments import CAIRO_PATH
 from protostar.compiler import LinkedLibrariesBuilder
 from protostar.io.log_color_provider import LogColorProvider
 from protostar.protostar_exception import ProtostarException
+from protostar.self.artifact_cache import hash_strings
 from protostar.self.cache_io import CacheIO
 from protostar.self.protostar_directory import ProtostarDirectory
 from protostar.starknet.pass_managers import (
     StarknetPassManagerFactory,
     TestCollectorPassManagerFactory,
 )
-from protostar.starknet import StarknetCompiler
+from protostar.starknet import StarknetCompiler, get_cairo_lang_version
 from protostar.cairo import CairoCompilerConfig
 from protostar.testing import (
     TestCollector,
     TestingSummary,
     TestRunner,
     TestScheduler,
+    TestDurations,
+    TestCollectionIndex,
     determine_testing_seed,
 )
+from protostar.testing.test_suite import TestCase
 from protostar.io.output import Messenger
 
 from .messages import TestCollectorResultMessage, TestingSummaryResultMessage
@@ -131,6 +135,22 @@ A glob or globs to a directory or a test suite, for example:
                 description="Print the slowest tests at the end.",
                 default=0,
             ),
+            ProtostarArgument(
+                name="shard-size",
+                type="int",
+                description=(
+                    "Split test suites with more test cases than this number into shards, "
+                    "which idle workers run in parallel."
+                ),
+            ),
+            ProtostarArgument(
+                name="fuzz-workers",
+                type="int",
+                description=(
+                    "Split examples of each fuzz test between this number of workers. "
+                    "Workers stop as soon as one of them finds a failure."
+                ),
+            ),
             ProtostarArgument(
                 name="last-failed",
                 short_name="lf",
@@ -152,7 +172,10 @@ A glob or globs to a directory or a test suite, for example:
             "Legacy cairo 0 test runner is deprecated, and will be removed in future versions. "
             "Usage of cairo 1 runner is recommended.",
         )
-        cache = TestCommandCache(CacheIO(self._project_root_path))
+        cache = TestCommandCache(
+            CacheIO(self._project_root_path), project_root_path=self._project_root_path
+        )
+        test_durations = cache.obtain_test_durations()
         summary = await self.test(
             targets=cache.obtain_targets(args.target, args.last_failed),
             ignored_targets=args.ignore,
@@ -164,10 +187,14 @@ A glob or globs to a directory or a test suite, for example:
             seed=args.seed,
             max_steps=args.max_steps,
             slowest_tests_to_report_count=args.report_slowest_tests,
+            shard_size=args.shard_size,
+            fuzz_workers=args.fuzz_workers,
+            test_durations=test_durations,
             gas_estimation_enabled=args.estimate_gas,
             messenger=messenger,
         )
         cache.write_failed_tests_to_cache(summary)
+        cache.write_test_durations_to_cache(summary, test_durations)
 
         summary.assert_all_passed()
         return summary
@@ -186,7 +213,10 @@ A glob or globs to a directory or a test suite, for example:
         seed: Optional[int] = None,
         max_steps: Optional[int] = None,
         slowest_tests_to_report_count: int = 0,
+        shard_size: Optional[int] = None,
+        fuzz_workers: Optional[int] = None,
         gas_estimation_enabled: bool = False,
+        test_durations: Optional[TestDurations] = None,
     ) -> TestingSummary:
         include_paths = [
             str(path)
@@ -219,8 +249,39 @@ A glob or globs to a directory or a test suite, for example:
                 config=compiler_config,
                 pass_manager_factory=factory,
             )
+            collection_index = TestCollectionIndex(
+                project_root_path=self._project_root_path,
+                namespace="cairo0_test_collection",
+                # Collected values changed from function names to parameters counts
+                fingerprint=hash_strings(
+                    "parameters_counts",
+                    get_cairo_lang_version(),
+                    factory.__name__,
+                    *include_paths,
+                ),
+            )
+            parameterized_function_names: set[tuple[Path, str]] = set()
+
+            def get_suite_function_names(file_path: Path) -> list[str]:
+                parameters_counts: dict[str, int] = collection_index.get_or_collect(
+                    file_path,
+                    starknet_compiler.get_function_parameters_counts_and_dependencies,
+                )
+                parameterized_function_names.update(
+                    (file_path, function_name)
+                    for function_name, parameters_count in parameters_counts.items()
+                    if parameters_count > 0
+                )
+                return list(parameters_counts)
+
+            def is_parameterized(test_case: TestCase) -> bool:
+                return (
+                    test_case.test_path,
+                    test_case.test_fn_name,
+                ) in parameterized_function_names
+
             test_collector = TestCollector(
-                get_suite_function_names=starknet_compiler.get_function_names
+                get_suite_function_names=get_suite_function_names
             )
 
             test_collector_result = test_collector.collect(
@@ -265,6 +326,10 @@ A glob or globs to a directory or a test suite, for example:
                 active_profile_name=self._active_profile_name,
                 cwd=self._cwd,
                 gas_estimation_enabled=gas_estimation_enabled,
+                shard_size=shard_size,
+                fuzz_shards_count=fuzz_workers,
+                is_parameterized=is_parameterized,
+                test_durations=test_durations,
                 on_exit_first=lambda: messenger(
                     TestingSummaryResultMessage(
                         test_collector_result=test_collector_result,
@@ -1,18 +1,21 @@
 import logging
+from pathlib import Path
 from typing import List
 
 from protostar.self.cache_io import CacheIO
-from protostar.testing import TestingSummary
+from protostar.testing import TestingSummary, TestDurations
 from protostar.testing.test_results import (
     FailedTestCaseResult,
     BrokenTestCaseResult,
     BrokenTestSuiteResult,
+    TimedTestCaseResult,
 )
 
 
 class TestCommandCache:
-    def __init__(self, cache_io: CacheIO):
+    def __init__(self, cache_io: CacheIO, project_root_path: Path):
         self.cache_io = cache_io
+        self._project_root_path = project_root_path.resolve()
 
     def obtain_targets(
         self, targets: List[str], last_failed: bool = False
@@ -41,3 +44,47 @@ class TestCommandCache:
             "last_failed_tests",
             {"targets": last_failed_targets},
         )
+
+    def obtain_test_durations(self) -> TestDurations:
+        durations_from_cache = self.cache_io.read("test_durations") or {}
+        suites = durations_from_cache.get("suites", {})
+        if not isinstance(suites, dict):
+            return {}
+        # Suites are stored relative to the project root, so a cache restored on CI still matches
+        return {
+            str(self._project_root_path / suite_path): suite_durations
+            for suite_path, suite_durations in suites.items()
+            if isinstance(suite_durations, dict)
+        }
+
+    def write_test_durations_to_cache(
+        self, summary: TestingSummary, previous_test_durations: TestDurations
+    ):
+        test_durations = {
+            suite_path: dict(suite_durations)
+            for suite_path, suite_durations in previous_test_durations.items()
+            # Suites that were removed or renamed are forgotten
+            if Path(suite_path).exists()
+        }
+        for test_result in summary.test_results:
+            if isinstance(test_result, TimedTestCaseResult):
+                suite_path = str(Path(test_result.file_path).resolve())
+                test_durations.setdefault(suite_path, {})[
+                    test_result.test_case_name
+                ] = test_result.execution_time
+        self.cache_io.write(
+            "test_durations",
+            {
+                "suites": {
+                    self._make_path_relative_if_possible(suite_path): suite_durations
+                    for suite_path, suite_durations in test_durations.items()
+                }
+            },
+        )
+
+    def _make_path_relative_if_possible(self, suite_path: str) -> str:
+        try:
+            return Path(suite_path).relative_to(self._project_root_path).as_posix()
+        except ValueError:
+            # Suites outside of the project are kept under their absolute paths
+            return suite_path
@@ -0,0 +1,64 @@
+from pathlib import Path
+from typing import cast
+
+from protostar.self.cache_io import CacheIO
+from protostar.testing import TestingSummary
+from protostar.testing.test_results import PassedTestCaseResult
+
+from .test_command_cache import TestCommandCache
+
+
+def make_summary(test_path: Path, test_case_name: str, execution_time: float):
+    summary = cast(TestingSummary, type("Summary", (), {})())
+    summary.test_results = [
+        PassedTestCaseResult(
+            file_path=test_path,
+            test_case_name=test_case_name,
+            captured_stdout={},
+            execution_time=execution_time,
+            execution_resources=None,
+        )
+    ]
+    return summary
+
+
+def test_test_durations_are_found_in_moved_project(tmp_path: Path):
+    for project_name in ["a", "b"]:
+        (tmp_path / project_name / "tests").mkdir(parents=True)
+    test_path = tmp_path / "a" / "tests" / "test_main.cairo"
+    test_path.touch()
+    TestCommandCache(
+        CacheIO(tmp_path / "a"), project_root_path=tmp_path / "a"
+    ).write_test_durations_to_cache(make_summary(test_path, "test_a", 2.0), {})
+    (tmp_path / "a" / ".protostar_cache").rename(tmp_path / "b" / ".protostar_cache")
+
+    test_durations = TestCommandCache(
+        CacheIO(tmp_path / "b"), project_root_path=tmp_path / "b"
+    ).obtain_test_durations()
+
+    assert test_durations == {
+        str((tmp_path / "b" / "tests" / "test_main.cairo").resolve()): {"test_a": 2.0}
+    }
+
+
+def test_removed_test_suites_are_forgotten(tmp_path: Path):
+    test_path = tmp_path / "test_main.cairo"
+    test_path.touch()
+    cache = TestCommandCache(CacheIO(tmp_path), project_root_path=tmp_path)
+
+    cache.write_test_durations_to_cache(
+        make_summary(test_path, "test_a", 1.0),
+        {str(tmp_path / "removed_test.cairo"): {"test_a": 1.0}},
+    )
+
+    assert list(cache.obtain_test_durations()) == [str(test_path.resolve())]
+
+
+def test_malformed_test_durations_are_ignored(tmp_path: Path):
+    cache_io = CacheIO(tmp_path)
+    cache_io.write("test_durations", {"durations": {}})
+
+    assert (
+        TestCommandCache(cache_io, project_root_path=tmp_path).obtain_test_durations()
+        == {}
+    )
@@ -43,6 +43,7 @@ def format_test_result(test_result: TestResult) -> StructuredMessage:
                 execution_time=test_result.execution_time,
                 test_case_name=test_result.test_case_name,
                 fuzz_runs_count=None,
+                fuzz_examples_per_second=None,
             )
         )
     if isinstance(test_result, FailedTestCaseResult):
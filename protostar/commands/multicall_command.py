@@ -22,6 +22,7 @@ from protostar.cli.common_arguments import BLOCK_EXPLORER_ARG, MAX_FEE_ARG
 from protostar.io import Messenger, StructuredMessage, format_as_table
 from protostar.io.log_color_provider import LogColorProvider
 from protostar.starknet_gateway import (
+    GatewayClientFactory,
     AccountManager,
     GatewayFacadeFactory,
     BlockExplorer,
@@ -75,10 +76,12 @@ class MulticallCommand(ProtostarCommand):
     def __init__(
         self,
         gateway_facade_factory: GatewayFacadeFactory,
+        gateway_client_factory: GatewayClientFactory,
         messenger_factory: MessengerFactory,
     ) -> None:
         super().__init__()
         self._gateway_facade_factory = gateway_facade_factory
+        self._gateway_client_factory = gateway_client_factory
         self._messenger_factory = messenger_factory
 
     @property
@@ -117,7 +120,7 @@ class MulticallCommand(ProtostarCommand):
 
     async def run(self, args: Namespace):
         write = self._messenger_factory.from_args(args)
-        network_util = NetworkCommandUtil(args)
+        network_util = NetworkCommandUtil(args, self._gateway_client_factory)
         network_config = network_util.get_network_config()
         gateway_client = network_util.get_gateway_client()
         signer = get_signer(
@@ -151,7 +154,10 @@ class MulticallCommand(ProtostarCommand):
     ):
         gateway_facade = self._gateway_facade_factory.create(gateway_client)
         account_manager = AccountManager(
-            account, client=gateway_facade, gateway_url=gateway_url
+            account,
+            client=gateway_facade,
+            gateway_url=gateway_url,
+            gateway_client_factory=self._gateway_client_factory,
         )
         multicall_use_case = MulticallUseCase(
             account_manager=account_manager, client=gateway_facade
@@ -1,6 +1,11 @@
 from .compiled_contract_writer import CompiledContractWriter
 from .project_cairo_path_builder import ProjectCairoPathBuilder
 from .cairo0_project_compiler import Cairo0ProjectCompiler
+from .cairo1_contract_compilation_cache import (
+    Cairo1ContractCompilationCache,
+    compute_cairo1_contract_inputs_hash,
+)
+from .build_manifest import BuildManifest
 from .project_cairo_path_builder import LinkedLibrariesBuilder
 from .project_compiler_exceptions import CompilationException
 from .project_compiler_types import ProjectCompilerConfig
@@ -0,0 +1,89 @@
+import json
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from protostar.self.artifact_cache import ArtifactCache, hash_strings
+
+
+class BuildManifest:
+    """
+    Records inputs hashes of contracts built into an output directory, together with
+    values derived from the outputs and the size and modification time of each output file,
+    so unchanged contracts are not rebuilt.
+    The manifest is kept in `.protostar_cache`, so the output directory contains only the build artifacts.
+    """
+
+    CACHE_NAMESPACE = "build_manifests"
+
+    def __init__(self, project_root_path: Path, output_dir: Path):
+        self._artifact_cache = ArtifactCache(
+            project_root_path=project_root_path,
+            namespace=self.CACHE_NAMESPACE,
+            max_entries=32,
+        )
+        self._key = hash_strings(str(output_dir.resolve()))
+        self._entries: dict[str, dict[str, Any]] = self._load()
+
+    def get_outputs(
+        self,
+        contract_name: str,
+        inputs_hash: str,
+        output_paths: Iterable[Path],
+    ) -> Optional[dict[str, Any]]:
+        """
+        @return: recorded outputs, if the contract was built from the same inputs and its output files were not modified since
+        """
+        entry = self._entries.get(contract_name)
+        if not entry or entry.get("inputs_hash") != inputs_hash:
+            return None
+        output_files = entry.get("output_files")
+        if not isinstance(output_files, dict):
+            return None
+        for output_path in output_paths:
+            fingerprint = self._fingerprint_output(output_path)
+            if fingerprint is None or output_files.get(str(output_path)) != fingerprint:
+                return None
+        return entry.get("outputs")
+
+    def set_outputs(
+        self,
+        contract_name: str,
+        inputs_hash: str,
+        outputs: dict[str, Any],
+        output_paths: Iterable[Path],
+    ):
+        """
+        Must be called after the output files are written.
+        """
+        self._entries[contract_name] = {
+            "inputs_hash": inputs_hash,
+            "outputs": outputs,
+            "output_files": {
+                str(output_path): self._fingerprint_output(output_path)
+                for output_path in output_paths
+            },
+        }
+
+    def save(self):
+        self._artifact_cache.write(
+            self._key, json.dumps(self._entries, indent=2).encode("utf-8")
+        )
+
+    @staticmethod
+    def _fingerprint_output(output_path: Path) -> Optional[list[int]]:
+        # A list, so it compares equal to the fingerprint loaded from JSON
+        try:
+            stat = output_path.stat()
+        except OSError:
+            return None
+        return [stat.st_mtime_ns, stat.st_size]
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        manifest = self._artifact_cache.read(self._key)
+        if manifest is None:
+            return {}
+        try:
+            entries = json.loads(manifest)
+        except ValueError:
+            return {}
+        return entries if isinstance(entries, dict) else {}
@@ -0,0 +1,39 @@
+from pathlib import Path
+
+from .build_manifest import BuildManifest
+
+
+def test_outputs_are_reused_only_for_the_same_inputs(tmp_path: Path):
+    output_dir = tmp_path / "build"
+    output_dir.mkdir()
+    output_path = output_dir / "main.sierra.json"
+    output_path.write_text("{}", encoding="utf-8")
+
+    manifest = BuildManifest(tmp_path, output_dir)
+    manifest.set_outputs("main", "inputs", {"class_hash": "0x1"}, [output_path])
+    manifest.save()
+
+    manifest = BuildManifest(tmp_path, output_dir)
+    assert manifest.get_outputs("main", "inputs", [output_path]) == {
+        "class_hash": "0x1"
+    }
+    assert manifest.get_outputs("main", "other inputs", [output_path]) is None
+    assert list(output_dir.iterdir()) == [output_path]
+
+    output_path.unlink()
+    assert manifest.get_outputs("main", "inputs", [output_path]) is None
+
+
+def test_modified_outputs_are_not_reused(tmp_path: Path):
+    output_dir = tmp_path / "build"
+    output_dir.mkdir()
+    output_path = output_dir / "main.sierra.json"
+    output_path.write_text("{}", encoding="utf-8")
+
+    manifest = BuildManifest(tmp_path, output_dir)
+    manifest.set_outputs("main", "inputs", {"class_hash": "0x1"}, [output_path])
+    manifest.save()
+
+    output_path.write_text("{", encoding="utf-8")
+    manifest = BuildManifest(tmp_path, output_dir)
+    assert manifest.get_outputs("main", "inputs", [output_path]) is None
@@ -1,5 +1,7 @@
+import multiprocessing
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple, Union
 
 from starkware.cairo.lang.compiler.preprocessor.preprocessor_error import (
     PreprocessorError,
@@ -13,6 +15,7 @@ from starkware.starknet.services.api.contract_class.contract_class import (
 )
 from starkware.starkware_utils.error_handling import StarkException
 
+from protostar.compiler.build_manifest import BuildManifest
 from protostar.compiler.project_compiler_exceptions import (
     CompilationException,
 )
@@ -23,12 +26,71 @@ from protostar.compiler.project_compiler_types import (
     ProjectCompilerConfig,
 )
 from protostar.configuration_file.configuration_file import ConfigurationFile
+from protostar.protostar_exception import ProtostarException
+from protostar.self.dependency_index import DependencyIndex
+from protostar.self.artifact_cache import hash_strings
 from protostar.starknet import (
     StarknetPassManagerFactory,
     StarknetCompiler,
     StarknetCompilerConfig,
+    get_cairo_lang_version,
 )
 
+ClassHashAndDependencies = Tuple[int, List[Path]]
+
+
+@dataclass(frozen=True)
+class ContractCompilationTask:
+    contract_name: str
+    contract_paths: List[Path]
+    include_paths: List[str]
+    config: ProjectCompilerConfig
+    output_dir: Path
+    written_class_hash: Optional[int]
+    """Class hash of the artifact already present in the output directory"""
+
+
+# (include paths, hint validation disabled) -> compiler, reused by all contracts compiled in a process
+_starknet_compilers: dict[Tuple[Tuple[str, ...], bool], StarknetCompiler] = {}
+
+
+def compile_contract_task(task: ContractCompilationTask) -> ClassHashAndDependencies:
+    compiler_key = (tuple(task.include_paths), task.config.hint_validation_disabled)
+    if compiler_key not in _starknet_compilers:
+        _starknet_compilers[compiler_key] = StarknetCompiler(
+            config=StarknetCompilerConfig(
+                include_paths=task.include_paths,
+                disable_hint_validation=task.config.hint_validation_disabled,
+            ),
+            pass_manager_factory=StarknetPassManagerFactory,
+        )
+    try:
+        contract, dependencies = _starknet_compilers[
+            compiler_key
+        ].compile_contract_and_get_dependencies(
+            *task.contract_paths, add_debug_info=task.config.debugging_info_attached
+        )
+    except (StarkException, VmException, PreprocessorError) as err:
+        raise CompilationException(task.contract_name, err) from err
+
+    class_hash = compute_deprecated_class_hash(contract_class=contract)
+    # Debug info is not a part of the class hash
+    if class_hash != task.written_class_hash or task.config.debugging_info_attached:
+        CompiledContractWriter(contract, task.contract_name).save(
+            output_dir=task.output_dir
+        )
+    return class_hash, dependencies
+
+
+# Note: This function has to be top-level function, because it is being pickled by multiprocessing.
+def _compile_contract_task_in_worker(
+    task: ContractCompilationTask,
+) -> Union[ClassHashAndDependencies, ProtostarException]:
+    try:
+        return compile_contract_task(task)
+    except ProtostarException as ex:
+        return ex
+
 
 class Cairo0ProjectCompiler:
     def __init__(
@@ -45,39 +107,117 @@ class Cairo0ProjectCompiler:
             relative_cairo_path=[]
         )
 
-    def _compile_contract(
-        self,
-        contract_name: str,
-        output_dir: Path,
-        config: Optional[ProjectCompilerConfig] = None,
-    ):
-        contract = self.compile_contract_from_contract_name(contract_name, config)
-        class_hash = compute_deprecated_class_hash(contract_class=contract)
-        CompiledContractWriter(contract, contract_name).save(
-            output_dir=self.get_compilation_output_dir(output_dir)
-        )
-        return class_hash
-
     def compile_project(
         self,
         output_dir: Path,
         config: Optional[ProjectCompilerConfig] = None,
         target_contract_name: Optional[str] = None,
+        parallel: bool = False,
     ) -> dict[str, int]:
-        class_hashes = {}
-        if target_contract_name:
-            return {
-                target_contract_name: self._compile_contract(
-                    contract_name=target_contract_name,
+        """
+        Contracts whose sources and imported modules haven't changed since the last build are not compiled again.
+        Artifacts are written only if the class hash of the contract changes.
+        @param parallel: compile contracts in a process pool
+        """
+        current_config = config or self._default_config
+        output_dir = self.get_compilation_output_dir(output_dir)
+        include_paths = self._build_str_cairo_path_list(
+            current_config.relative_cairo_path
+        )
+        contract_names = (
+            [target_contract_name]
+            if target_contract_name
+            else self.configuration_file.get_contract_names()
+        )
+        manifest = BuildManifest(self._project_root_path, output_dir)
+        artifact_fingerprint = hash_strings(
+            get_cairo_lang_version(), str(current_config.debugging_info_attached)
+        )
+
+        class_hashes: dict[str, int] = {}
+        tasks: list[ContractCompilationTask] = []
+        indexes: dict[str, Tuple[DependencyIndex, Path]] = {}
+        for contract_name in contract_names:
+            contract_paths = self.configuration_file.get_contract_source_paths(
+                contract_name
+            )
+            assert contract_paths, f"No contract paths found for {contract_name}!"
+            index = DependencyIndex(
+                project_root_path=self._project_root_path,
+                namespace="cairo0_contracts",
+                fingerprint=hash_strings(
+                    artifact_fingerprint,
+                    str(current_config.hint_validation_disabled),
+                    contract_name,
+                    *(str(path.resolve()) for path in contract_paths),
+                    *include_paths,
+                ),
+            )
+            indexes[contract_name] = (index, contract_paths[0])
+            written_outputs = manifest.get_outputs(
+                contract_name,
+                artifact_fingerprint,
+                CompiledContractWriter.get_output_paths(output_dir, contract_name),
+            )
+            written_class_hash = (
+                int(written_outputs["class_hash"], 16) if written_outputs else None
+            )
+            indexed_class_hash = index.read(contract_paths[0])
+            if (
+                written_class_hash is not None
+                and indexed_class_hash is not None
+                and int(indexed_class_hash, 16) == written_class_hash
+            ):
+                class_hashes[contract_name] = written_class_hash
+                continue
+            tasks.append(
+                ContractCompilationTask(
+                    contract_name=contract_name,
+                    contract_paths=contract_paths,
+                    include_paths=include_paths,
+                    config=current_config,
                     output_dir=output_dir,
-                    config=config,
+                    written_class_hash=written_class_hash,
                 )
-            }
-        for contract_name in self.configuration_file.get_contract_names():
-            class_hashes[contract_name] = self._compile_contract(
-                contract_name=contract_name, output_dir=output_dir, config=config
             )
-        return class_hashes
+
+        try:
+            for task, (class_hash, dependencies) in zip(
+                tasks, self._compile_contract_tasks(tasks, parallel)
+            ):
+                index, source_path = indexes[task.contract_name]
+                index.write(source_path, dependencies, hex(class_hash))
+                manifest.set_outputs(
+                    task.contract_name,
+                    artifact_fingerprint,
+                    {"class_hash": hex(class_hash)},
+                    CompiledContractWriter.get_output_paths(
+                        output_dir, task.contract_name
+                    ),
+                )
+                class_hashes[task.contract_name] = class_hash
+        finally:
+            manifest.save()
+
+        return {
+            contract_name: class_hashes[contract_name]
+            for contract_name in contract_names
+        }
+
+    @staticmethod
+    def _compile_contract_tasks(
+        tasks: list[ContractCompilationTask], parallel: bool
+    ) -> Iterator[ClassHashAndDependencies]:
+        if not parallel or len(tasks) < 2:
+            yield from map(compile_contract_task, tasks)
+            return
+        with multiprocessing.Pool(
+            processes=min(multiprocessing.cpu_count(), len(tasks))
+        ) as pool:
+            for result in pool.imap(_compile_contract_task_in_worker, tasks):
+                if isinstance(result, ProtostarException):
+                    raise result
+                yield result
 
     def compile_contract_from_contract_identifier(
         self,
@@ -0,0 +1,185 @@
+import json
+import pickle
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional, Tuple
+
+from starkware.starknet.core.os.contract_class.compiled_class_hash import (
+    compute_compiled_class_hash,
+)
+from starkware.starknet.services.api.contract_class.contract_class import (
+    ContractClass,
+    CompiledClass,
+)
+
+from protostar.cairo.bindings.cairo_bindings import (
+    PackageName,
+    get_bindings_fingerprint,
+)
+from protostar.cairo.contract_class import make_contract_class, make_compiled_class
+from protostar.self.artifact_cache import ArtifactCache, hash_file_tree, hash_strings
+
+from .cairo1_contract_compiler import Cairo1ContractCompiler
+
+
+def compute_cairo1_contract_inputs_hash(
+    contract_path: Path,
+    linked_libraries: list[Tuple[Path, PackageName]],
+    hash_tree: Callable[[Path], str] = hash_file_tree,
+) -> str:
+    """
+    Hashes everything that affects compilation of a contract: its sources,
+    the linked libraries and the compiler build.
+    """
+    return hash_strings(
+        get_bindings_fingerprint(),
+        str(contract_path.resolve()),
+        hash_tree(contract_path),
+        *(
+            f"{package_name}:{hash_tree(package_path)}"
+            for package_path, package_name in sorted(
+                linked_libraries, key=lambda library: library[1]
+            )
+        ),
+    )
+
+
+@dataclass(frozen=True)
+class PrebuiltContractClasses:
+    contract_class: ContractClass
+    compiled_class: CompiledClass
+    compiled_class_hash: int
+
+
+class Cairo1ContractCompilationCache:
+    """
+    Caches Sierra and CASM outputs of Cairo 1 contracts under the project's `.protostar_cache`.
+    Entries are keyed by the hash of the contract sources, the linked libraries and the compiler build,
+    so a changed input never yields a stale class.
+    """
+
+    CACHE_NAMESPACE = "cairo1_contracts"
+    SNAPSHOT_NAMESPACE = "declared_classes_snapshots"
+    DEFAULT_MAX_ENTRIES = 256
+    MAX_LOADED_CLASSES = 256
+
+    # Shared by all cache instances in the process, so the classes are parsed once per worker.
+    # The least recently used classes are dropped once `MAX_LOADED_CLASSES` is exceeded.
+    _loaded_classes: "OrderedDict[str, PrebuiltContractClasses]" = OrderedDict()
+    _loaded_snapshot_keys: set[str] = set()
+
+    def __init__(self, project_root_path: Path, max_entries: int = DEFAULT_MAX_ENTRIES):
+        # Sources are not expected to change during a run, so each tree is hashed once per instance
+        self._tree_hashes: dict[Path, str] = {}
+        self._inputs_hashes: dict[
+            Tuple[Path, Tuple[Tuple[Path, PackageName], ...]], str
+        ] = {}
+        self._artifact_cache = ArtifactCache(
+            project_root_path=project_root_path,
+            namespace=self.CACHE_NAMESPACE,
+            max_entries=max_entries,
+        )
+        self._snapshot_cache = ArtifactCache(
+            project_root_path=project_root_path,
+            namespace=self.SNAPSHOT_NAMESPACE,
+            max_entries=8,
+        )
+
+    def compile_contract(
+        self,
+        contract_name: str,
+        contract_path: Path,
+        linked_libraries: Optional[list[Tuple[Path, PackageName]]] = None,
+    ) -> PrebuiltContractClasses:
+        key = self._get_inputs_hash(contract_path, linked_libraries or [])
+
+        if key in self._loaded_classes:
+            self._loaded_classes.move_to_end(key)
+            return self._loaded_classes[key]
+
+        compiled = self._read(key)
+        if compiled is None:
+            compiled = Cairo1ContractCompiler.compile_contract(
+                contract_name, contract_path, linked_libraries=linked_libraries
+            )
+            self._artifact_cache.write(
+                key,
+                json.dumps({"sierra": compiled[0], "casm": compiled[1]}).encode(
+                    "utf-8"
+                ),
+            )
+
+        sierra_compiled, casm_compiled = compiled
+        compiled_class = make_compiled_class(casm_compiled)
+        classes = PrebuiltContractClasses(
+            contract_class=make_contract_class(sierra_compiled),
+            compiled_class=compiled_class,
+            compiled_class_hash=compute_compiled_class_hash(compiled_class),
+        )
+        self._store_loaded_classes(key, classes)
+        return classes
+
+    def save_snapshot(self) -> Optional[str]:
+        """
+        Saves all classes loaded in this process, so other processes can load them at once.
+        @return: key of the snapshot, or None if there is nothing to save.
+        """
+        if not self._loaded_classes:
+            return None
+        snapshot_key = hash_strings(*sorted(self._loaded_classes))
+        self._loaded_snapshot_keys.add(snapshot_key)
+        if self._snapshot_cache.touch(snapshot_key):
+            # Keys identify the classes, so a snapshot with the same key has the same content
+            return snapshot_key
+        self._snapshot_cache.write(
+            snapshot_key,
+            pickle.dumps(self._loaded_classes, protocol=pickle.HIGHEST_PROTOCOL),
+        )
+        return snapshot_key
+
+    def load_snapshot(self, snapshot_key: str) -> None:
+        if snapshot_key in self._loaded_snapshot_keys:
+            return
+        self._loaded_snapshot_keys.add(snapshot_key)
+        snapshot = self._snapshot_cache.read(snapshot_key)
+        if snapshot is None:
+            return
+        try:
+            loaded_classes: dict[str, PrebuiltContractClasses] = pickle.loads(snapshot)
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            # A broken snapshot only means that the classes are loaded one by one
+            return
+        for key, classes in loaded_classes.items():
+            self._store_loaded_classes(key, classes)
+
+    def _get_inputs_hash(
+        self, contract_path: Path, linked_libraries: list[Tuple[Path, PackageName]]
+    ) -> str:
+        memo_key = (contract_path, tuple(linked_libraries))
+        if memo_key not in self._inputs_hashes:
+            self._inputs_hashes[memo_key] = compute_cairo1_contract_inputs_hash(
+                contract_path, linked_libraries, hash_tree=self._hash_file_tree
+            )
+        return self._inputs_hashes[memo_key]
+
+    def _hash_file_tree(self, root: Path) -> str:
+        if root not in self._tree_hashes:
+            self._tree_hashes[root] = hash_file_tree(root)
+        return self._tree_hashes[root]
+
+    def _store_loaded_classes(self, key: str, classes: PrebuiltContractClasses):
+        self._loaded_classes[key] = classes
+        self._loaded_classes.move_to_end(key)
+        while len(self._loaded_classes) > self.MAX_LOADED_CLASSES:
+            self._loaded_classes.popitem(last=False)
+
+    def _read(self, key: str) -> Optional[Tuple[str, str]]:
+        entry = self._artifact_cache.read(key)
+        if entry is None:
+            return None
+        try:
+            entry_dict = json.loads(entry)
+            return entry_dict["sierra"], entry_dict["casm"]
+        except (ValueError, KeyError):
+            return None
@@ -0,0 +1,175 @@
+from collections import OrderedDict
+from pathlib import Path
+
+from pytest_mock import MockerFixture
+
+from protostar.self.artifact_cache import ArtifactCache
+
+from .cairo1_contract_compilation_cache import (
+    Cairo1ContractCompilationCache,
+    PrebuiltContractClasses,
+)
+
+MODULE = "protostar.compiler.cairo1_contract_compilation_cache"
+
+
+def test_compilation_is_reused_until_sources_change(
+    tmp_path: Path, mocker: MockerFixture
+):
+    mocker.patch(f"{MODULE}.get_bindings_fingerprint", return_value="compiler")
+    mocker.patch(f"{MODULE}.make_contract_class", side_effect=lambda code: code)
+    mocker.patch(f"{MODULE}.make_compiled_class", side_effect=lambda code: code)
+    mocker.patch(f"{MODULE}.compute_compiled_class_hash", return_value=0)
+    compile_contract = mocker.patch(
+        f"{MODULE}.Cairo1ContractCompiler.compile_contract",
+        return_value=("sierra", "casm"),
+    )
+    mocker.patch.object(
+        Cairo1ContractCompilationCache, "_loaded_classes", OrderedDict()
+    )
+    source_path = tmp_path / "src" / "lib.cairo"
+    source_path.parent.mkdir()
+    source_path.write_text("mod a;", encoding="utf-8")
+
+    cache = Cairo1ContractCompilationCache(project_root_path=tmp_path)
+    expected_classes = PrebuiltContractClasses(
+        contract_class="sierra",  # type: ignore
+        compiled_class="casm",  # type: ignore
+        compiled_class_hash=0,
+    )
+    assert cache.compile_contract("main", source_path) == expected_classes
+    assert cache.compile_contract("main", source_path) == expected_classes
+    assert compile_contract.call_count == 1
+
+    # simulates another worker process, which only sees the on-disk cache
+    mocker.patch.object(
+        Cairo1ContractCompilationCache, "_loaded_classes", OrderedDict()
+    )
+    cache = Cairo1ContractCompilationCache(project_root_path=tmp_path)
+    assert cache.compile_contract("main", source_path) == expected_classes
+    assert compile_contract.call_count == 1
+
+    # sources are hashed once per run, so a change is picked up by the next run
+    source_path.write_text("mod b;", encoding="utf-8")
+    cache = Cairo1ContractCompilationCache(project_root_path=tmp_path)
+    cache.compile_contract("main", source_path)
+    assert compile_contract.call_count == 2
+
+
+def test_sources_are_hashed_once_per_run(tmp_path: Path, mocker: MockerFixture):
+    mocker.patch(f"{MODULE}.get_bindings_fingerprint", return_value="compiler")
+    mocker.patch(f"{MODULE}.make_contract_class", side_effect=lambda code: code)
+    mocker.patch(f"{MODULE}.make_compiled_class", side_effect=lambda code: code)
+    mocker.patch(f"{MODULE}.compute_compiled_class_hash", return_value=0)
+    mocker.patch(
+        f"{MODULE}.Cairo1ContractCompiler.compile_contract",
+        return_value=("sierra", "casm"),
+    )
+    hash_file_tree = mocker.patch(f"{MODULE}.hash_file_tree", return_value="hash")
+    mocker.patch.object(
+        Cairo1ContractCompilationCache, "_loaded_classes", OrderedDict()
+    )
+    library_path = tmp_path / "library"
+    cache = Cairo1ContractCompilationCache(project_root_path=tmp_path)
+
+    for _ in range(3):
+        for contract_name in ["a", "b"]:
+            cache.compile_contract(
+                contract_name,
+                tmp_path / contract_name,
+                linked_libraries=[(library_path, "library")],
+            )
+
+    hashed_trees = [call.args[0] for call in hash_file_tree.call_args_list]
+    assert sorted(hashed_trees) == sorted(
+        [tmp_path / "a", tmp_path / "b", library_path]
+    )
+
+
+def test_loaded_classes_are_bounded(tmp_path: Path, mocker: MockerFixture):
+    mocker.patch(f"{MODULE}.get_bindings_fingerprint", return_value="compiler")
+    mocker.patch(f"{MODULE}.make_contract_class", side_effect=lambda code: code)
+    mocker.patch(f"{MODULE}.make_compiled_class", side_effect=lambda code: code)
+    mocker.patch(f"{MODULE}.compute_compiled_class_hash", return_value=0)
+    mocker.patch(
+        f"{MODULE}.Cairo1ContractCompiler.compile_contract",
+        return_value=("sierra", "casm"),
+    )
+    mocker.patch(f"{MODULE}.hash_file_tree", side_effect=str)
+    mocker.patch.object(
+        Cairo1ContractCompilationCache, "_loaded_classes", OrderedDict()
+    )
+    mocker.patch.object(Cairo1ContractCompilationCache, "MAX_LOADED_CLASSES", 2)
+    cache = Cairo1ContractCompilationCache(project_root_path=tmp_path)
+
+    for contract_name in ["a", "b", "a", "c"]:
+        cache.compile_contract(contract_name, tmp_path / contract_name)
+
+    assert len(Cairo1ContractCompilationCache._loaded_classes) == 2
+
+
+def test_snapshot_shares_loaded_classes_between_processes(
+    tmp_path: Path, mocker: MockerFixture
+):
+    mocker.patch(f"{MODULE}.get_bindings_fingerprint", return_value="compiler")
+    mocker.patch(f"{MODULE}.make_contract_class", side_effect=lambda code: code)
+    mocker.patch(f"{MODULE}.make_compiled_class", side_effect=lambda code: code)
+    mocker.patch(f"{MODULE}.compute_compiled_class_hash", return_value=0)
+    compile_contract = mocker.patch(
+        f"{MODULE}.Cairo1ContractCompiler.compile_contract",
+        return_value=("sierra", "casm"),
+    )
+    mocker.patch.object(
+        Cairo1ContractCompilationCache, "_loaded_classes", OrderedDict()
+    )
+    mocker.patch.object(Cairo1ContractCompilationCache, "_loaded_snapshot_keys", set())
+    source_path = tmp_path / "src" / "lib.cairo"
+    source_path.parent.mkdir()
+    source_path.write_text("mod a;", encoding="utf-8")
+
+    cache = Cairo1ContractCompilationCache(project_root_path=tmp_path)
+    cache.compile_contract("main", source_path)
+    snapshot_key = cache.save_snapshot()
+    assert snapshot_key
+
+    mocker.patch.object(
+        Cairo1ContractCompilationCache, "_loaded_classes", OrderedDict()
+    )
+    mocker.patch.object(Cairo1ContractCompilationCache, "_loaded_snapshot_keys", set())
+    mocker.patch.object(
+        Cairo1ContractCompilationCache, "_read", side_effect=AssertionError
+    )
+    cache = Cairo1ContractCompilationCache(project_root_path=tmp_path)
+    cache.load_snapshot(snapshot_key)
+
+    assert cache.compile_contract("main", source_path).contract_class == "sierra"
+    assert compile_contract.call_count == 1
+
+
+def test_unchanged_snapshot_is_not_written_again(tmp_path: Path, mocker: MockerFixture):
+    mocker.patch(f"{MODULE}.get_bindings_fingerprint", return_value="compiler")
+    mocker.patch(f"{MODULE}.make_contract_class", side_effect=lambda code: code)
+    mocker.patch(f"{MODULE}.make_compiled_class", side_effect=lambda code: code)
+    mocker.patch(f"{MODULE}.compute_compiled_class_hash", return_value=0)
+    mocker.patch(
+        f"{MODULE}.Cairo1ContractCompiler.compile_contract",
+        return_value=("sierra", "casm"),
+    )
+    mocker.patch.object(
+        Cairo1ContractCompilationCache, "_loaded_classes", OrderedDict()
+    )
+    mocker.patch.object(Cairo1ContractCompilationCache, "_loaded_snapshot_keys", set())
+    source_path = tmp_path / "src" / "lib.cairo"
+    source_path.parent.mkdir()
+    source_path.write_text("mod a;", encoding="utf-8")
+    cache = Cairo1ContractCompilationCache(project_root_path=tmp_path)
+    cache.compile_contract("main", source_path)
+    write = mocker.spy(ArtifactCache, "write")
+
+    snapshot_key = cache.save_snapshot()
+    assert cache.save_snapshot() == snapshot_key
+
+    snapshot_writes = [
+        call for call in write.call_args_list if call.args[1] == snapshot_key
+    ]
+    assert len(snapshot_writes) == 1
@@ -27,16 +27,23 @@ class CompiledContractWriter:
             compiled_contract_path, compiled_contract_path_abi
         )
 
+    @staticmethod
+    def get_output_paths(output_dir: Path, contract_name: str) -> list[Path]:
+        return [
+            output_dir / f"{contract_name}.json",
+            output_dir / f"{contract_name}_abi.json",
+        ]
+
     def save_compiled_contract(self, output_dir: Path) -> Path:
         self._create_output_dir(output_dir)
         serialized_contract = self._contract.Schema().dump(self._contract)
-        file_path = output_dir / f"{self._contract_name}.json"
+        file_path = self.get_output_paths(output_dir, self._contract_name)[0]
         self._save_as_json(data=serialized_contract, path=file_path)
         return file_path
 
     def save_compiled_contract_abi(self, output_dir: Path) -> Path:
         self._create_output_dir(output_dir)
-        file_path = output_dir / f"{self._contract_name}_abi.json"
+        file_path = self.get_output_paths(output_dir, self._contract_name)[1]
         self._save_as_json(data=self._contract.abi or "", path=file_path)
         return file_path
 
@@ -15,6 +15,7 @@ from protostar.commands import (
     BuildCairo0Command,
     CalculateAccountAddressCommand,
     CallCommand,
+    BatchCallCommand,
     DeclareCairo0Command,
     DeployAccountCommand,
     DeployCommand,
@@ -53,7 +54,7 @@ from protostar.io import InputRequester, log_color_provider
 from protostar.protostar_cli import ProtostarCLI
 from protostar.self import ProtostarCompatibilityWithProjectChecker
 from protostar.self.protostar_directory import ProtostarDirectory, VersionManager
-from protostar.starknet_gateway import GatewayFacadeFactory
+from protostar.starknet_gateway import GatewayClientFactory, GatewayFacadeFactory
 from protostar.upgrader import (
     LatestVersionCacheTOML,
     LatestVersionChecker,
@@ -115,6 +116,7 @@ def build_di_container(
     gateway_facade_factory = GatewayFacadeFactory(
         project_root_path=project_root_path,
     )
+    gateway_client_factory = GatewayClientFactory()
 
     lib_path_resolver = LibPathResolver(
         configuration_file=configuration_file,
@@ -159,6 +161,7 @@ def build_di_container(
     )
     multicall_command = MulticallCommand(
         gateway_facade_factory=gateway_facade_factory,
+        gateway_client_factory=gateway_client_factory,
         messenger_factory=messenger_factory,
     )
     commands: list[ProtostarCommand] = [
@@ -218,15 +221,18 @@ def build_di_container(
         ),
         DeployCommand(
             gateway_facade_factory=gateway_facade_factory,
+            gateway_client_factory=gateway_client_factory,
             messenger_factory=messenger_factory,
         ),
         DeclareCairo0Command(
             gateway_facade_factory=gateway_facade_factory,
+            gateway_client_factory=gateway_client_factory,
             messenger_factory=messenger_factory,
         ),
         DeclareCommand(
             contract_path_resolver=contract_path_resolver,
             gateway_facade_factory=gateway_facade_factory,
+            gateway_client_factory=gateway_client_factory,
             messenger_factory=messenger_factory,
         ),
         FormatCommand(
@@ -235,16 +241,26 @@ def build_di_container(
         ),
         CairoMigrateCommand(script_root=script_root),
         InvokeCommand(
+            project_root_path=project_root_path,
             gateway_facade_factory=gateway_facade_factory,
+            gateway_client_factory=gateway_client_factory,
             messenger_factory=messenger_factory,
         ),
         CallCommand(
             project_root_path=project_root_path,
             gateway_facade_factory=gateway_facade_factory,
+            gateway_client_factory=gateway_client_factory,
+            messenger_factory=messenger_factory,
+        ),
+        BatchCallCommand(
+            project_root_path=project_root_path,
+            gateway_facade_factory=gateway_facade_factory,
+            gateway_client_factory=gateway_client_factory,
             messenger_factory=messenger_factory,
         ),
         DeployAccountCommand(
             gateway_facade_factory=gateway_facade_factory,
+            gateway_client_factory=gateway_client_factory,
             messenger_factory=messenger_factory,
         ),
         migrate_configuration_file_command,
@@ -266,6 +282,7 @@ def build_di_container(
         configuration_file=configuration_file,
         compatibility_checker=compatibility_checker,
         start_time=start_time,
+        gateway_client_factory=gateway_client_factory,
     )
     if configuration_file:
         configuration_file.set_command_names_provider(protostar_cli)
@@ -23,6 +23,7 @@ from protostar.self import (
     ProtostarCompatibilityWithProjectCheckerProtocol,
     VersionManager,
 )
+from protostar.starknet_gateway import GatewayClientFactory
 from protostar.upgrader import LatestVersionChecker
 
 
@@ -45,6 +46,7 @@ class ProtostarCLI(CLIApp, CommandNamesProviderProtocol):
         configuration_file: ConfigurationFile,
         compatibility_checker: ProtostarCompatibilityWithProjectCheckerProtocol,
         start_time: float = 0,
+        gateway_client_factory: Optional[GatewayClientFactory] = None,
     ) -> None:
         self._latest_version_checker = latest_version_checker
         self._log_color_provider = log_color_provider
@@ -53,6 +55,7 @@ class ProtostarCLI(CLIApp, CommandNamesProviderProtocol):
         self._configuration_file = configuration_file
         self._project_cairo_path_builder = project_cairo_path_builder
         self._compatibility_checker = compatibility_checker
+        self._gateway_client_factory = gateway_client_factory
         super().__init__(
             commands=commands,
             root_args=[
@@ -89,6 +92,9 @@ class ProtostarCLI(CLIApp, CommandNamesProviderProtocol):
         except ProtostarException as err:
             has_failed = True
             self._print_protostar_exception(err)
+        finally:
+            if self._gateway_client_factory:
+                await self._gateway_client_factory.close()
         self._print_execution_time()
         if has_failed:
             sys.exit(1)
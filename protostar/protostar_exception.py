@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Any, Optional
 
 UNEXPECTED_PROTOSTAR_ERROR_MSG = (
     "Unexpected Protostar error. Report it here:\n"
@@ -16,6 +16,17 @@ class ProtostarException(Exception):
         self.details = details
         super().__init__(message)
 
+    def __reduce__(self):
+        # Subclasses with custom constructors are restored without calling them,
+        # so they can be raised in other processes, e.g. by multiprocessing workers
+        return _restore_exception, (type(self), self.args), self.__dict__
+
+
+def _restore_exception(
+    exception_type: type[ProtostarException], args: tuple[Any, ...]
+) -> ProtostarException:
+    return exception_type.__new__(exception_type, *args)
+
 
 class ProtostarExceptionSilent(ProtostarException):
     """This exception isn't printed but results in non-zero exit code."""
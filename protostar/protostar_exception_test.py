@@ -0,0 +1,25 @@
+import pickle
+
+from protostar.compiler.project_compiler_exceptions import CompilationException
+
+from .protostar_exception import ProtostarException
+
+
+def test_exceptions_with_custom_constructors_are_picklable():
+    exception = CompilationException("main", ValueError("syntax error"))
+
+    restored = pickle.loads(pickle.dumps(exception))
+
+    assert isinstance(restored, CompilationException)
+    assert restored.message == exception.message
+    assert restored.details is None
+    assert str(restored) == str(exception)
+
+
+def test_exception_details_are_pickled():
+    restored = pickle.loads(
+        pickle.dumps(ProtostarException("message", details="details"))
+    )
+
+    assert restored.message == "message"
+    assert restored.details == "details"
@@ -0,0 +1,117 @@
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Iterable, Optional
+
+from .cache_io import CACHE_DIR_NAME
+
+# (path, mtime_ns, size) -> content digest
+_file_digests: dict[tuple[str, int, int], str] = {}
+
+
+def hash_file(path: Path) -> str:
+    stat = path.stat()
+    memo_key = (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+    if memo_key not in _file_digests:
+        _file_digests[memo_key] = hashlib.sha256(path.read_bytes()).hexdigest()
+    return _file_digests[memo_key]
+
+
+def hash_file_tree(root: Path, suffixes: Iterable[str] = (".cairo",)) -> str:
+    """
+    Hashes the contents and relative paths of all files with given suffixes under `root`.
+    If `root` is a file, the directory containing it is hashed.
+    """
+    root = root if root.is_dir() else root.parent
+    suffixes = tuple(suffixes)
+    hasher = hashlib.sha256()
+    for path in sorted(root.rglob("*")):
+        if path.suffix not in suffixes or not path.is_file():
+            continue
+        hasher.update(path.relative_to(root).as_posix().encode("utf-8"))
+        hasher.update(hash_file(path).encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def hash_strings(*values: str) -> str:
+    hasher = hashlib.sha256()
+    for value in values:
+        hasher.update(value.encode("utf-8"))
+        hasher.update(b"\0")
+    return hasher.hexdigest()
+
+
+class ArtifactCache:
+    """
+    Stores binary artifacts under `.protostar_cache/<namespace>`, one file per key.
+    Writes are atomic, so the cache can be shared by the test worker processes.
+    The least recently used entries are removed once `max_entries` is exceeded.
+    """
+
+    _TMP_PREFIX = ".tmp-"
+
+    def __init__(self, project_root_path: Path, namespace: str, max_entries: int):
+        self._root_cache_path = project_root_path / CACHE_DIR_NAME
+        self._cache_path = self._root_cache_path / namespace
+        self._max_entries = max_entries
+
+    def read(self, key: str) -> Optional[bytes]:
+        entry_path = self._cache_path / key
+        try:
+            value = entry_path.read_bytes()
+            # mtime is used as the last access time by the eviction
+            os.utime(entry_path)
+        except OSError:
+            return None
+        return value
+
+    def touch(self, key: str) -> bool:
+        """
+        Marks the entry as recently used without reading it.
+        @return: False if there is no such entry.
+        """
+        try:
+            os.utime(self._cache_path / key)
+        except OSError:
+            return False
+        return True
+
+    def write(self, key: str, value: bytes) -> None:
+        try:
+            self._ensure_cache_dir()
+            file_descriptor, tmp_path = tempfile.mkstemp(
+                prefix=self._TMP_PREFIX, dir=self._cache_path
+            )
+            try:
+                with os.fdopen(file_descriptor, "wb") as tmp_file:
+                    tmp_file.write(value)
+                os.replace(tmp_path, self._cache_path / key)
+            except BaseException:
+                Path(tmp_path).unlink(missing_ok=True)
+                raise
+            self._evict()
+        except OSError:
+            # The cache is an optimization — an unwritable cache must not break the command.
+            pass
+
+    def _ensure_cache_dir(self):
+        self._cache_path.mkdir(parents=True, exist_ok=True)
+        gitignore_path = self._root_cache_path / ".gitignore"
+        if not gitignore_path.exists():
+            gitignore_path.write_text("*\n", encoding="utf-8")
+
+    def _evict(self):
+        entries: list[tuple[int, Path]] = []
+        for entry_path in self._cache_path.iterdir():
+            if entry_path.name.startswith(self._TMP_PREFIX):
+                continue
+            try:
+                entries.append((entry_path.stat().st_mtime_ns, entry_path))
+            except FileNotFoundError:
+                continue
+        if len(entries) <= self._max_entries:
+            return
+        entries.sort()
+        for _, entry_path in entries[: len(entries) - self._max_entries]:
+            entry_path.unlink(missing_ok=True)
@@ -0,0 +1,62 @@
+import os
+from pathlib import Path
+
+from .artifact_cache import ArtifactCache, hash_file_tree
+
+
+def test_artifact_cache_read_write(tmp_path: Path):
+    cache = ArtifactCache(tmp_path, namespace="test", max_entries=2)
+
+    assert cache.read("key") is None
+
+    cache.write("key", b"value")
+
+    assert cache.read("key") == b"value"
+    assert (tmp_path / ".protostar_cache" / ".gitignore").read_text(
+        encoding="utf-8"
+    ) == "*\n"
+
+
+def test_artifact_cache_evicts_least_recently_used_entries(tmp_path: Path):
+    cache = ArtifactCache(tmp_path, namespace="test", max_entries=2)
+    cache_path = tmp_path / ".protostar_cache" / "test"
+
+    cache.write("a", b"a")
+    cache.write("b", b"b")
+    os.utime(cache_path / "a", ns=(1, 1))
+    os.utime(cache_path / "b", ns=(2, 2))
+
+    cache.write("c", b"c")
+
+    assert cache.read("a") is None
+    assert cache.read("b") == b"b"
+    assert cache.read("c") == b"c"
+
+
+def test_artifact_cache_touch(tmp_path: Path):
+    cache = ArtifactCache(tmp_path, namespace="test", max_entries=2)
+
+    assert not cache.touch("key")
+
+    cache.write("key", b"value")
+    os.utime(tmp_path / ".protostar_cache" / "test" / "key", ns=(1, 1))
+
+    assert cache.touch("key")
+    assert (tmp_path / ".protostar_cache" / "test" / "key").stat().st_mtime_ns > 1
+
+
+def test_hash_file_tree_tracks_content_changes(tmp_path: Path):
+    (tmp_path / "src").mkdir()
+    source_path = tmp_path / "src" / "lib.cairo"
+    source_path.write_text("mod a;", encoding="utf-8")
+    (tmp_path / "src" / "notes.md").write_text("notes", encoding="utf-8")
+
+    initial_hash = hash_file_tree(tmp_path / "src")
+    (tmp_path / "src" / "notes.md").write_text("other notes", encoding="utf-8")
+
+    assert hash_file_tree(tmp_path / "src") == initial_hash
+    assert hash_file_tree(source_path) == initial_hash
+
+    source_path.write_text("mod b;", encoding="utf-8")
+
+    assert hash_file_tree(tmp_path / "src") != initial_hash
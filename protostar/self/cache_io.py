@@ -2,9 +2,11 @@ from typing import Optional
 import json
 from pathlib import Path
 
+CACHE_DIR_NAME = ".protostar_cache"
+
 
 class CacheIO:
-    _CACHE_DIR_NAME = ".protostar_cache"
+    _CACHE_DIR_NAME = CACHE_DIR_NAME
     _EXTENSION = ".json"
 
     def __init__(self, project_root_path: Path):
@@ -0,0 +1,90 @@
+import json
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional, Tuple
+
+from .artifact_cache import ArtifactCache, hash_file, hash_file_tree, hash_strings
+
+ResultWithDependencies = Tuple[Any, Iterable[Path]]
+
+
+class DependencyIndex:
+    """
+    Persists results computed from a source file between runs, e.g. collected tests or class hashes.
+    An entry is valid as long as the source file and all of its recorded dependencies
+    (files or whole directories) have the same content as when the entry was written.
+    """
+
+    DEFAULT_MAX_ENTRIES = 2048
+
+    def __init__(
+        self,
+        project_root_path: Path,
+        namespace: str,
+        fingerprint: str,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        """
+        @param fingerprint: identifies everything else the result depends on, e.g. compiler version
+        """
+        self._artifact_cache = ArtifactCache(
+            project_root_path=project_root_path,
+            namespace=namespace,
+            max_entries=max_entries,
+        )
+        self._fingerprint = fingerprint
+
+    def read(self, source_path: Path) -> Optional[Any]:
+        entry = self._artifact_cache.read(self._get_key(source_path))
+        if entry is None:
+            return None
+        try:
+            entry_dict = json.loads(entry)
+            dependencies: dict[str, str] = entry_dict["dependencies"]
+            value = entry_dict["value"]
+        except (ValueError, KeyError):
+            return None
+
+        for dependency_path, digest in dependencies.items():
+            if _hash_dependency(Path(dependency_path)) != digest:
+                return None
+        return value
+
+    def write(self, source_path: Path, dependencies: Iterable[Path], value: Any):
+        dependency_digests: dict[str, str] = {}
+        for dependency_path in [source_path, *dependencies]:
+            digest = _hash_dependency(dependency_path)
+            if digest is None:
+                # An entry that cannot be validated later is useless
+                return
+            dependency_digests[str(dependency_path.resolve())] = digest
+
+        self._artifact_cache.write(
+            self._get_key(source_path),
+            json.dumps({"dependencies": dependency_digests, "value": value}).encode(
+                "utf-8"
+            ),
+        )
+
+    def get_or_collect(
+        self,
+        source_path: Path,
+        collect: Callable[[Path], ResultWithDependencies],
+    ) -> Any:
+        cached_value = self.read(source_path)
+        if cached_value is not None:
+            return cached_value
+        value, dependencies = collect(source_path)
+        self.write(source_path, dependencies, value)
+        return value
+
+    def _get_key(self, source_path: Path) -> str:
+        return hash_strings(self._fingerprint, str(source_path.resolve()))
+
+
+def _hash_dependency(path: Path) -> Optional[str]:
+    try:
+        if path.is_dir():
+            return hash_file_tree(path)
+        return hash_file(path)
+    except OSError:
+        return None
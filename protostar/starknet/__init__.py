@@ -8,7 +8,7 @@ from .cheatable_starknet_exceptions import (
     SimpleReportedException,
 )
 from .cheatcode import Cheatcode
-from .storage_var import calc_address
+from .storage_var import calc_address, calc_address_range
 from .types import ClassHashType, SelectorType, Wei, Hash, TransactionHash
 from .address import Address, RawAddress
 from .selector import Selector
@@ -21,7 +21,11 @@ from .data_transformer import (
     CairoOrPythonData,
     PythonData,
 )
-from .starknet_compiler import StarknetCompiler, StarknetCompilerConfig
+from .starknet_compiler import (
+    StarknetCompiler,
+    StarknetCompilerConfig,
+    get_cairo_lang_version,
+)
 from .pass_managers import StarknetPassManagerFactory
 from .contract_abi import ContractAbi
 from .contract_data_transformer import ContractDataTransformer
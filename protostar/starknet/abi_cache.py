@@ -0,0 +1,56 @@
+import json
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, TypeVar
+
+from starknet_py.abi import Abi, AbiParser
+from starkware.starknet.public.abi import AbiType
+
+T = TypeVar("T")
+
+MAX_CACHED_ABIS = 256
+
+
+class ParsedAbi:
+    """
+    ABI model parsed from ABI entries, together with serializers prepared for its functions and events.
+    """
+
+    def __init__(self, abi: Abi):
+        self.abi = abi
+        self._serializers: dict[Hashable, Any] = {}
+
+    def get_serializer(self, key: Hashable, create: Callable[[], T]) -> T:
+        if key not in self._serializers:
+            self._serializers[key] = create()
+        return self._serializers[key]
+
+
+# ABI entries are usually the same objects for all calls to a contract, so they are looked up
+# by identity first. Entries hold a reference to the ABI, so its id is not reused while cached.
+_parsed_abis_by_id: "OrderedDict[int, tuple[AbiType, ParsedAbi]]" = OrderedDict()
+_parsed_abis_by_content: "OrderedDict[str, ParsedAbi]" = OrderedDict()
+
+
+def get_parsed_abi(abi_entries: AbiType) -> ParsedAbi:
+    """
+    @raise AbiParsingError, ValidationError: if the ABI is invalid
+    """
+    cached = _parsed_abis_by_id.get(id(abi_entries))
+    if cached is not None and cached[0] is abi_entries:
+        _parsed_abis_by_id.move_to_end(id(abi_entries))
+        return cached[1]
+
+    content_key = json.dumps(abi_entries, sort_keys=True)
+    parsed_abi = _parsed_abis_by_content.get(content_key)
+    if parsed_abi is None:
+        parsed_abi = ParsedAbi(AbiParser(abi_entries).parse())
+        _parsed_abis_by_content[content_key] = parsed_abi
+        if len(_parsed_abis_by_content) > MAX_CACHED_ABIS:
+            _parsed_abis_by_content.popitem(last=False)
+    else:
+        _parsed_abis_by_content.move_to_end(content_key)
+
+    _parsed_abis_by_id[id(abi_entries)] = (abi_entries, parsed_abi)
+    if len(_parsed_abis_by_id) > MAX_CACHED_ABIS:
+        _parsed_abis_by_id.popitem(last=False)
+    return parsed_abi
@@ -0,0 +1,27 @@
+from pytest_mock import MockerFixture
+
+from . import abi_cache
+from .abi_cache import get_parsed_abi
+
+ABI = [{"type": "function", "name": "foo", "inputs": [], "outputs": []}]
+
+
+def test_abi_is_parsed_once(mocker: MockerFixture):
+    mocker.patch.object(abi_cache, "_parsed_abis_by_id", abi_cache.OrderedDict())
+    mocker.patch.object(abi_cache, "_parsed_abis_by_content", abi_cache.OrderedDict())
+    abi_parser = mocker.patch.object(abi_cache, "AbiParser")
+
+    parsed_abi = get_parsed_abi(ABI)
+
+    assert get_parsed_abi(ABI) is parsed_abi
+    assert get_parsed_abi([dict(entry) for entry in ABI]) is parsed_abi
+    assert abi_parser.call_count == 1
+
+
+def test_serializers_are_created_once(mocker: MockerFixture):
+    parsed_abi = abi_cache.ParsedAbi(mocker.MagicMock())
+    create = mocker.MagicMock(return_value="serializer")
+
+    assert parsed_abi.get_serializer(("function", "foo"), create) == "serializer"
+    assert parsed_abi.get_serializer(("function", "foo"), create) == "serializer"
+    assert create.call_count == 1
@@ -1,3 +1,4 @@
+from copy import deepcopy
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -24,6 +25,17 @@ from protostar.starknet.types import ClassHashType, SelectorType
 from protostar.starknet.data_transformer import CairoOrPythonData
 
 from protostar.starknet.address import Address
+from protostar.starknet.state_forking import fork_state_cache
+
+# Flat dictionaries of cheats, copied on fork and merged into the parent state on apply
+_CHEAT_MAP_NAMES = (
+    "pranked_contracts_map",
+    "event_selector_to_name_map",
+    "event_name_to_contract_abi_map",
+    "class_hash_to_contract_abi_map",
+    "class_hash_to_contract_path_map",
+    "contract_address_to_class_hash_map",
+)
 
 
 # pylint: disable=too-many-instance-attributes
@@ -56,6 +68,27 @@ class CheatableCachedState(CachedState):
             block_info=BlockInfoCheater(self.block_info),
         )
 
+    def fork(self) -> "CheatableCachedState":
+        """
+        Creates an independent copy of the state without deep copying classes
+        and without stacking another `CachedState` layer on top of this one.
+        """
+        state_reader, cache = fork_state_cache(self)
+        forked = CheatableCachedState(
+            block_info=self.block_info,
+            state_reader=state_reader,
+            # Classes are shared, but a class declared by one fork must not be visible in others
+            compiled_class_cache=dict(self.compiled_classes),
+        )
+        forked.cache = cache
+        self._copy_cheats_to(forked)
+        forked.expected_contract_calls = {
+            address: expected_calls.copy()
+            for address, expected_calls in self.expected_contract_calls.items()
+        }
+        forked.cheaters = deepcopy(self.cheaters)
+        return forked
+
     def _copy(self):
         copied = CheatableCachedState(
             block_info=self.block_info,
@@ -63,75 +96,32 @@ class CheatableCachedState(CachedState):
             compiled_class_cache=self.compiled_classes,
         )
 
-        copied.pranked_contracts_map = self.pranked_contracts_map.copy()
-        copied.mocked_calls_map = self.mocked_calls_map.copy()
-        copied.event_selector_to_name_map = self.event_selector_to_name_map.copy()
-
-        copied.event_name_to_contract_abi_map = (
-            self.event_name_to_contract_abi_map.copy()
-        )
-        copied.class_hash_to_contract_abi_map = (
-            self.class_hash_to_contract_abi_map.copy()
-        )
-        copied.class_hash_to_contract_path_map = (
-            self.class_hash_to_contract_path_map.copy()
-        )
-        copied.contract_address_to_class_hash_map = (
-            self.contract_address_to_class_hash_map.copy()
-        )
-        copied.expected_contract_calls = self.expected_contract_calls.copy()
-
+        self._copy_cheats_to(copied)
         copied.cheaters = self.cheaters.copy()
 
         return copied
 
+    def _copy_cheats_to(self, other: "CheatableCachedState"):
+        for name in _CHEAT_MAP_NAMES:
+            setattr(other, name, getattr(self, name).copy())
+        # Mocks of an address are merged into the parent on apply, so they cannot be shared
+        other.mocked_calls_map = {
+            address: mocked_calls.copy()
+            for address, mocked_calls in self.mocked_calls_map.items()
+        }
+        other.expected_contract_calls = self.expected_contract_calls.copy()
+
     def _apply(self, parent: Self):
         assert isinstance(parent, self.__class__)
         super()._apply(parent)
 
-        parent.pranked_contracts_map = {
-            **parent.pranked_contracts_map,
-            **self.pranked_contracts_map,
-        }
+        for name in _CHEAT_MAP_NAMES:
+            getattr(parent, name).update(getattr(self, name))
 
-        parent.mocked_calls_map = {**parent.mocked_calls_map}
-
-        # pylint: disable=consider-using-dict-items
-        for address in self.mocked_calls_map:
-            if address in parent.mocked_calls_map:
-                parent.mocked_calls_map[address] = {
-                    **parent.mocked_calls_map[address],
-                    **self.mocked_calls_map[address],
-                }
-            else:
-                parent.mocked_calls_map[address] = self.mocked_calls_map[address]
-
-        parent.event_selector_to_name_map = {
-            **parent.event_selector_to_name_map,
-            **self.event_selector_to_name_map,
-        }
+        for address, mocked_calls in self.mocked_calls_map.items():
+            parent.mocked_calls_map.setdefault(address, {}).update(mocked_calls)
 
-        parent.event_name_to_contract_abi_map = {
-            **parent.event_name_to_contract_abi_map,
-            **self.event_name_to_contract_abi_map,
-        }
-
-        parent.class_hash_to_contract_path_map = {
-            **parent.class_hash_to_contract_path_map,
-            **self.class_hash_to_contract_path_map,
-        }
-        parent.class_hash_to_contract_abi_map = {
-            **parent.class_hash_to_contract_abi_map,
-            **self.class_hash_to_contract_abi_map,
-        }
-        parent.contract_address_to_class_hash_map = {
-            **parent.contract_address_to_class_hash_map,
-            **self.contract_address_to_class_hash_map,
-        }
-        parent.expected_contract_calls = {
-            **parent.expected_contract_calls,
-            **self.expected_contract_calls,
-        }
+        parent.expected_contract_calls.update(self.expected_contract_calls)
 
         parent.cheaters.apply(self.cheaters)
 
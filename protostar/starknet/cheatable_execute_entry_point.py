@@ -4,7 +4,6 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Optional, cast
 from copy import deepcopy
 
-from starkware.cairo.common.cairo_function_runner import CairoFunctionRunner
 from starkware.cairo.lang.vm.relocatable import RelocatableValue
 
 from starkware.python.utils import to_bytes
@@ -36,6 +35,7 @@ from starkware.starkware_utils.error_handling import (
     wrap_with_stark_exception,
 )
 
+from protostar.cairo.compiled_hint_cache import CachedHintsCairoFunctionRunner
 from protostar.starknet.cheatable_cached_state import CheatableCachedState
 from protostar.starknet.cheatable_syscall_handler import CheatableSysCallHandler
 from protostar.starknet.cheatcode import Cheatcode
@@ -90,7 +90,7 @@ class CheatableExecuteEntryPoint(ExecuteEntryPoint):
 
         # Prepare runner.
         with wrap_with_stark_exception(code=StarknetErrorCode.SECURITY_ERROR):
-            runner = CairoFunctionRunner(
+            runner = CachedHintsCairoFunctionRunner(
                 program=compiled_class.program,
                 layout=STARKNET_LAYOUT_INSTANCE.layout_name,
             )
@@ -27,6 +27,7 @@ from protostar.starknet.cheatable_execute_entry_point import CheatableExecuteEnt
 from protostar.starknet.cheatable_invoke_function import (
     create_cheatable_invoke_function,
 )
+from protostar.starknet.state_forking import fork_starknet_state
 
 
 class CheatableStarknetState(StarknetState):
@@ -133,4 +134,7 @@ class CheatableStarknetState(StarknetState):
         return cls(state=state, general_config=general_config)
 
     def copy(self) -> "CheatableStarknetState":
-        return cast(CheatableStarknetState, super().copy())
+        return cast(
+            CheatableStarknetState,
+            fork_starknet_state(self, self.cheatable_state.fork()),
+        )
@@ -3,12 +3,13 @@ from pathlib import Path
 from typing import Union, cast
 
 from marshmallow import ValidationError
-from starknet_py.abi import Abi, AbiParsingError, AbiParser
+from starknet_py.abi import Abi, AbiParsingError
 from starknet_py.abi.shape import AbiDictList
 from starkware.starknet.public.abi import AbiType
 
 from protostar.protostar_exception import ProtostarException
 
+from .abi_cache import get_parsed_abi
 from .selector import Selector
 
 
@@ -28,7 +29,7 @@ class ContractAbi:
     def from_abi_entries(cls, abi_entries: Union[AbiType, AbiDictList]):
         abi_entries = cast(AbiType, abi_entries)
         try:
-            contract_abi_model = AbiParser(abi_entries).parse()
+            contract_abi_model = get_parsed_abi(abi_entries).abi
             return cls(abi_entries=abi_entries, contract_abi_model=contract_abi_model)
         except (AbiParsingError, ValidationError) as ex:
             raise ProtostarException("Invalid ABI") from ex
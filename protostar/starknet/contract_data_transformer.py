@@ -7,6 +7,7 @@ from starknet_py.serialization import CairoSerializerException
 
 from protostar.protostar_exception import ProtostarException
 
+from .abi_cache import get_parsed_abi
 from .selector import Selector
 from .contract_abi import ContractAbi
 from .data_transformer import CairoData, PythonData
@@ -31,8 +32,12 @@ class ContractDataTransformer:
             return serializer.deserialize(cairo_data).as_dict()
 
     def _create_entrypoint_serializer(self, selector: Selector):
-        return create_function_serializer(
-            self._contract_abi.unwrap_entrypoint_model(selector)
+        parsed_abi = get_parsed_abi(self._contract_abi.to_abi_type())
+        return parsed_abi.get_serializer(
+            ("function_adapter", str(selector)),
+            lambda: create_function_serializer(
+                self._contract_abi.unwrap_entrypoint_model(selector)
+            ),
         )
 
 
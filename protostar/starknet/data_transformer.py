@@ -4,12 +4,14 @@ from typing_extensions import Literal
 from marshmallow import ValidationError
 
 from starknet_py.serialization import serializer_for_payload, CairoSerializerException
-from starknet_py.abi import Abi, AbiParsingError, AbiParser
+from starknet_py.abi import Abi, AbiParsingError
 
 from starkware.starknet.public.abi import AbiType
 
 from protostar.protostar_exception import ProtostarException
 
+from .abi_cache import ParsedAbi, get_parsed_abi
+
 
 class DataTransformerException(ProtostarException):
     pass
@@ -32,21 +34,45 @@ def get_function_from_abi(abi: Abi, fn_name: str) -> Abi.Function:
     raise DataTransformerException(f"`{fn_name}` not found in ABI")
 
 
+def _parse_abi(contract_abi: AbiType) -> ParsedAbi:
+    try:
+        return get_parsed_abi(contract_abi)
+    except (AbiParsingError, ValidationError) as ex:
+        raise DataTransformerException("Invalid ABI") from ex
+
+
+def _get_function_serializer(
+    parsed_abi: ParsedAbi, fn_name: str, mode: Literal["inputs", "outputs"]
+):
+    def create():
+        function = get_function_from_abi(parsed_abi.abi, fn_name)
+        if mode == "inputs":
+            return serializer_for_payload(function.inputs)
+        return serializer_for_payload(function.outputs)
+
+    return parsed_abi.get_serializer(("function", fn_name, mode), create)
+
+
+def _get_event_serializer(parsed_abi: ParsedAbi, event_name: str):
+    def create():
+        try:
+            event = parsed_abi.abi.events[event_name]
+        except KeyError as ex:
+            raise DataTransformerException(
+                f"Event name `{event_name}` not in ABI"
+            ) from ex
+        return serializer_for_payload(event.data)
+
+    return parsed_abi.get_serializer(("event", event_name), create)
+
+
 def from_python_transformer(
     contract_abi: AbiType, fn_name: str, mode: Literal["inputs", "outputs"]
 ) -> FromPythonTransformer:
     def transform(data: PythonData):
-        try:
-            abi = AbiParser(contract_abi).parse()
-        except (AbiParsingError, ValidationError) as ex:
-            raise DataTransformerException("Invalid ABI") from ex
+        parsed_abi = _parse_abi(contract_abi)
 
-        function = get_function_from_abi(abi, fn_name)
-
-        if mode == "inputs":
-            serializer = serializer_for_payload(function.inputs)
-        else:
-            serializer = serializer_for_payload(function.outputs)
+        serializer = _get_function_serializer(parsed_abi, fn_name, mode)
 
         try:
             return serializer.serialize(data)
@@ -60,19 +86,9 @@ def from_python_events_transformer(
     contract_abi: AbiType, event_name: str
 ) -> FromPythonTransformer:
     def transform(data: PythonData):
-        try:
-            abi = AbiParser(contract_abi).parse()
-        except (AbiParsingError, ValidationError) as ex:
-            raise DataTransformerException("Invalid ABI") from ex
+        parsed_abi = _parse_abi(contract_abi)
 
-        try:
-            event = abi.events[event_name]
-        except KeyError as ex:
-            raise DataTransformerException(
-                f"Event name `{event_name}` not in ABI"
-            ) from ex
-
-        serializer = serializer_for_payload(event.data)
+        serializer = _get_event_serializer(parsed_abi, event_name)
 
         try:
             return serializer.serialize(data)
@@ -86,17 +102,9 @@ def to_python_transformer(
     contract_abi: AbiType, fn_name: str, mode: Literal["inputs", "outputs"]
 ) -> ToPythonTransformer:
     def transform(data: CairoData):
-        try:
-            abi = AbiParser(contract_abi).parse()
-        except (AbiParsingError, ValidationError) as ex:
-            raise DataTransformerException("Invalid ABI") from ex
+        parsed_abi = _parse_abi(contract_abi)
 
-        function = get_function_from_abi(abi, fn_name)
-
-        if mode == "inputs":
-            serializer = serializer_for_payload(function.inputs)
-        else:
-            serializer = serializer_for_payload(function.outputs)
+        serializer = _get_function_serializer(parsed_abi, fn_name, mode)
 
         try:
             return serializer.deserialize(data).as_dict()
@@ -110,19 +118,9 @@ def to_python_events_transformer(
     contract_abi: AbiType, event_name: str
 ) -> ToPythonTransformer:
     def transform(data: CairoData):
-        try:
-            abi = AbiParser(contract_abi).parse()
-        except (AbiParsingError, ValidationError) as ex:
-            raise DataTransformerException("Invalid ABI") from ex
-
-        try:
-            event = abi.events[event_name]
-        except KeyError as ex:
-            raise DataTransformerException(
-                f"Event name `{event_name}` not in ABI"
-            ) from ex
+        parsed_abi = _parse_abi(contract_abi)
 
-        serializer = serializer_for_payload(event.data)
+        serializer = _get_event_serializer(parsed_abi, event_name)
 
         try:
             return serializer.deserialize(data).as_dict()
@@ -41,6 +41,15 @@ class ForkableStarknet(Starknet):
             ),
         )
 
+    def bind_contract(self, deployed_contract: StarknetContract) -> StarknetContract:
+        """
+        Cheaper `copy_and_adapt_contract`, which shares the ABI and the structures parsed from it
+        with the given contract instead of rebuilding them.
+        """
+        contract = copy.copy(deployed_contract)
+        contract.state = self.cheatable_state
+        return contract
+
     def fork(self):
         return ForkableStarknet(state=self.cheatable_state.copy())
 
@@ -1,26 +1,68 @@
-from dataclasses import dataclass
-from typing import Union
+from typing import Any, ClassVar, Union
 
 from starkware.starknet.public.abi import get_selector_from_name
 
 
-@dataclass
 class Selector:
-    def __init__(self, value: Union[str, int]) -> None:
-        self._value = value
+    """
+    Immutable entry point selector created from a name or an integer.
+    Instances are interned and the integer value is computed once, so selectors can be
+    cheaply used as dictionary keys and compared in syscall handlers.
+    """
+
+    __slots__ = ("_value", "_int_value")
+
+    _selectors_by_name: ClassVar[dict[str, "Selector"]] = {}
+    _selectors_by_int: ClassVar[dict[int, "Selector"]] = {}
+
+    _value: Union[str, int]
+    _int_value: int
+
+    def __new__(cls, value: Union[str, int]) -> "Selector":
+        if isinstance(value, str):
+            selector = cls._selectors_by_name.get(value)
+            if selector is None:
+                selector = cls._create(value, get_selector_from_name(value))
+                cls._selectors_by_name[value] = selector
+            return selector
+        selector = cls._selectors_by_int.get(value)
+        if selector is None:
+            selector = cls._create(value, value)
+            cls._selectors_by_int[value] = selector
+        return selector
+
+    @classmethod
+    def _create(cls, value: Union[str, int], int_value: int) -> "Selector":
+        selector = super().__new__(cls)
+        object.__setattr__(selector, "_value", value)
+        object.__setattr__(selector, "_int_value", int_value)
+        return selector
 
     def __int__(self) -> int:
-        if isinstance(self._value, int):
-            return self._value
-        return get_selector_from_name(self._value)
+        return self._int_value
 
     def __str__(self) -> str:
         return str(self._value)
 
+    def __repr__(self) -> str:
+        return f"Selector({self._value!r})"
+
     def __eq__(self, __o: object) -> bool:
         if isinstance(__o, Selector):
-            return int(self) == int(__o)
+            return self._int_value == __o._int_value
         return False
 
     def __hash__(self) -> int:
-        return int(self)
+        return hash(self._int_value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("Selector is immutable")
+
+    def __reduce__(self):
+        return (Selector, (self._value,))
+
+    def __copy__(self) -> "Selector":
+        return self
+
+    def __deepcopy__(self, memo: Any) -> "Selector":
+        return self
@@ -4,3 +4,13 @@ from .selector import Selector
 def test_comparison():
     assert Selector("A") == Selector("A")
     assert Selector("A") != Selector("B")
+
+
+def test_selectors_are_interned():
+    selector = Selector("transfer")
+
+    assert Selector("transfer") is selector
+    assert Selector(int(selector)) == selector
+    assert hash(Selector(int(selector))) == hash(selector)
+    assert {selector: 1}.get(Selector(int(selector))) == 1
+    assert str(selector) == "transfer"
@@ -1,5 +1,6 @@
+from importlib import metadata
 from pathlib import Path
-from typing import List, Type, Union
+from typing import Dict, List, Tuple, Type, Union
 
 from starkware.cairo.lang.compiler.constants import MAIN_SCOPE
 from starkware.cairo.lang.compiler.identifier_manager import IdentifierManager
@@ -23,6 +24,13 @@ from .pass_managers import TestCollectorPreprocessedProgram
 StarknetCompilerConfig = PassManagerConfig
 
 
+def get_cairo_lang_version() -> str:
+    try:
+        return metadata.version("cairo-lang")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
 class StarknetCompiler:
     def __init__(
         self,
@@ -40,6 +48,9 @@ class StarknetCompiler:
     def preprocess_contract(
         self, *cairo_file_paths: Path
     ) -> Union[StarknetPreprocessedProgram, TestCollectorPreprocessedProgram]:
+        return self._run_pass_manager(*cairo_file_paths).preprocessed_program
+
+    def _run_pass_manager(self, *cairo_file_paths: Path) -> PassManagerContext:
         try:
             codes = [
                 (cairo_file_path.read_text("utf-8"), str(cairo_file_path))
@@ -56,7 +67,7 @@ class StarknetCompiler:
                 context.preprocessed_program,
                 (StarknetPreprocessedProgram, TestCollectorPreprocessedProgram),
             )
-            return context.preprocessed_program
+            return context
         except FileNotFoundError as err:
             raise StarknetCompiler.FileNotFoundException(
                 message=f"Couldn't find file '{err.filename}'"
@@ -100,9 +111,64 @@ class StarknetCompiler:
         assembled = self.compile_preprocessed_contract(preprocessed, add_debug_info)
         return assembled
 
+    def compile_contract_and_get_dependencies(
+        self,
+        *sources: Path,
+        add_debug_info: bool = False,
+    ) -> Tuple[DeprecatedCompiledClass, List[Path]]:
+        """
+        @return: compiled contract and paths of all modules imported, directly or not, by the sources
+        """
+        context = self._run_pass_manager(*sources)
+        preprocessed = context.preprocessed_program
+        assert isinstance(preprocessed, StarknetPreprocessedProgram)
+        assembled = self.compile_preprocessed_contract(preprocessed, add_debug_info)
+        return assembled, self._get_module_paths(context)
+
     def get_function_names(
         self,
         file_path: Path,
     ) -> List[str]:
-        preprocessed = self.preprocess_contract(file_path)
-        return [el["name"] for el in preprocessed.abi if el["type"] == "function"]
+        return self.get_function_names_and_dependencies(file_path)[0]
+
+    def get_function_names_and_dependencies(
+        self,
+        file_path: Path,
+    ) -> Tuple[List[str], List[Path]]:
+        """
+        @return: function names and paths of all modules imported, directly or not, by the file
+        """
+        (
+            parameters_counts,
+            dependencies,
+        ) = self.get_function_parameters_counts_and_dependencies(file_path)
+        return list(parameters_counts), dependencies
+
+    def get_function_parameters_counts_and_dependencies(
+        self,
+        file_path: Path,
+    ) -> Tuple[Dict[str, int], List[Path]]:
+        """
+        @return: numbers of parameters of functions by their names
+            and paths of all modules imported, directly or not, by the file
+        """
+        context = self._run_pass_manager(file_path)
+        preprocessed = context.preprocessed_program
+        assert isinstance(
+            preprocessed,
+            (StarknetPreprocessedProgram, TestCollectorPreprocessedProgram),
+        )
+        parameters_counts = {
+            el["name"]: len(el["inputs"])
+            for el in preprocessed.abi
+            if el["type"] == "function"
+        }
+        return parameters_counts, self._get_module_paths(context)
+
+    @staticmethod
+    def _get_module_paths(context: PassManagerContext) -> List[Path]:
+        return [
+            Path(module.cairo_file.filename)
+            for module in context.modules or []
+            if Path(module.cairo_file.filename).is_file()
+        ]
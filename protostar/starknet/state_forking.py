@@ -0,0 +1,59 @@
+# pylint: disable=protected-access
+from typing import Tuple
+
+from starkware.starknet.business_logic.state.state import CachedState, StateCache
+from starkware.starknet.business_logic.state.state_api import StateReader
+from starkware.starknet.testing.starknet import Starknet
+from starkware.starknet.testing.state import StarknetState
+
+
+def fork_state_cache(state: CachedState) -> Tuple[StateReader, StateCache]:
+    """
+    Squashes `state` and the `CachedState` layers below it into a single, independent cache.
+    Returns the first reader which is not a `CachedState` — it is never written to,
+    so it can be shared between forks.
+    """
+    layers: list[CachedState] = []
+    reader: StateReader = state
+    while isinstance(reader, CachedState):
+        layers.append(reader)
+        reader = reader.state_reader
+
+    forked_cache = StateCache()
+    for layer in reversed(layers):
+        forked_cache._class_hash_initial_values.update(
+            layer.cache._class_hash_initial_values
+        )
+        forked_cache._compiled_class_hash_initial_values.update(
+            layer.cache._compiled_class_hash_initial_values
+        )
+        forked_cache._nonce_initial_values.update(layer.cache._nonce_initial_values)
+        forked_cache._storage_initial_values.update(layer.cache._storage_initial_values)
+        forked_cache.update_writes_from_other(layer.cache)
+    return reader, forked_cache
+
+
+def fork_starknet_state(
+    starknet_state: StarknetState, forked_state: CachedState
+) -> StarknetState:
+    """
+    Replaces `StarknetState.copy`, which deep copies the whole state including all classes.
+    """
+    forked = type(starknet_state)(
+        state=forked_state,  # type: ignore
+        general_config=starknet_state.general_config,
+    )
+    forked._l2_to_l1_messages = dict(starknet_state._l2_to_l1_messages)
+    forked.l2_to_l1_messages_log = starknet_state.l2_to_l1_messages_log.copy()
+    forked.events = starknet_state.events.copy()
+    return forked
+
+
+def fork_starknet(starknet: Starknet, forked_state: CachedState) -> Starknet:
+    forked = Starknet(
+        state=fork_starknet_state(starknet.state, forked_state),
+        default_account_address=starknet._default_account_address,
+    )
+    forked.l1_to_l2_nonce = starknet.l1_to_l2_nonce
+    forked.class_hash_to_abi = dict(starknet.class_hash_to_abi)
+    return forked
@@ -0,0 +1,97 @@
+import pytest
+from starkware.starknet.business_logic.state.state import CachedState
+from starkware.starknet.business_logic.state.state_api_objects import BlockInfo
+from starkware.starknet.business_logic.state.state_api import StateReader
+
+from protostar.cheatable_starknet.cheatables.cheatable_cached_state import (
+    CheatableCachedState,
+)
+
+from .cheatable_cached_state import (
+    CheatableCachedState as LegacyCheatableCachedState,
+)
+from .state_forking import fork_state_cache
+
+
+class StorageReader(StateReader):
+    def __init__(self, storage: dict[tuple[int, int], int]):
+        self.storage = storage
+
+    async def get_compiled_class(self, compiled_class_hash: int):
+        raise NotImplementedError()
+
+    async def get_compiled_class_hash(self, class_hash: int) -> int:
+        return 0
+
+    async def get_class_hash_at(self, contract_address: int) -> int:
+        return 0
+
+    async def get_nonce_at(self, contract_address: int) -> int:
+        return 0
+
+    async def get_storage_at(self, contract_address: int, key: int) -> int:
+        return self.storage.get((contract_address, key), 0)
+
+
+async def test_forked_cache_is_flat_and_independent():
+    reader = StorageReader({(1, 1): 10, (1, 2): 20})
+    state = CachedState(
+        block_info=BlockInfo.empty(sequencer_address=None),
+        state_reader=reader,
+        compiled_class_cache={},
+    )
+    await state.get_storage_at(1, 1)
+    with state.copy_and_apply() as state_copy:
+        await state_copy.set_storage_at(1, 2, 21)
+        await state_copy.increment_nonce(1)
+
+        forked_reader, forked_cache = fork_state_cache(state_copy)
+
+        assert forked_reader is reader
+        assert forked_cache.storage_view[(1, 1)] == 10
+        assert forked_cache.storage_view[(1, 2)] == 21
+        assert forked_cache.address_to_nonce[1] == 1
+
+    forked_cache._storage_writes[(1, 1)] = 11  # pylint: disable=protected-access
+
+    assert await state.get_storage_at(1, 1) == 10
+    assert await state.get_storage_at(1, 2) == 21
+
+
+@pytest.mark.parametrize(
+    "state_class", [CheatableCachedState, LegacyCheatableCachedState]
+)
+async def test_classes_declared_in_fork_are_not_visible_in_other_states(
+    state_class: type,
+):
+    state = state_class(
+        block_info=BlockInfo.empty(sequencer_address=None),
+        state_reader=StorageReader({}),
+        compiled_class_cache={1: "setup_class"},
+    )
+    forked_state = state.fork()
+    sibling_state = state.fork()
+
+    forked_state.compiled_classes[2] = "declared_class"
+
+    assert forked_state.compiled_classes == {1: "setup_class", 2: "declared_class"}
+    assert state.compiled_classes == {1: "setup_class"}
+    assert sibling_state.compiled_classes == {1: "setup_class"}
+
+
+def test_mocks_applied_to_discarded_copy_are_not_visible_in_state():
+    state = LegacyCheatableCachedState(
+        block_info=BlockInfo.empty(sequencer_address=None),
+        state_reader=StorageReader({}),
+    )
+    state.mocked_calls_map = {1: {10: [1]}}
+
+    with pytest.raises(RuntimeError):
+        with state.copy_and_apply() as state_copy:
+            with state_copy.copy_and_apply() as nested_state_copy:
+                nested_state_copy.mocked_calls_map[1][11] = [2]
+
+            assert state_copy.mocked_calls_map == {1: {10: [1], 11: [2]}}
+            raise RuntimeError()
+
+    assert state.mocked_calls_map == {1: {10: [1]}}
@@ -1,18 +1,39 @@
-from typing import List
+from functools import lru_cache
+from typing import List, Sequence, Tuple
+
 from starkware.starknet.public.abi import get_storage_var_address
 from starkware.crypto.signature.fast_pedersen_hash import pedersen_hash
 
 ADDR_BOUND = 2**251 - 256
 
 
-def calc_address(variable_name: str, key: List[int]) -> int:
-    res = get_storage_var_address(variable_name)
-    for i in key:
-        res = pedersen_hash(res, i)
+def calc_address(variable_name: str, key: Sequence[int]) -> int:
+    res = _hash_key(variable_name, tuple(key))
     if len(key) > 0:
         res = normalize_address(res)
     return res
 
 
+def calc_address_range(variable_name: str, key: Sequence[int], size: int) -> List[int]:
+    """
+    Returns addresses of `size` consecutive felts of the variable, computing the base address once.
+    """
+    address = calc_address(variable_name, key)
+    return [address + i for i in range(size)]
+
+
 def normalize_address(addr: int) -> int:
     return addr if addr < ADDR_BOUND else addr - ADDR_BOUND
+
+
+@lru_cache(maxsize=1024)
+def _get_base_address(variable_name: str) -> int:
+    return get_storage_var_address(variable_name)
+
+
+@lru_cache(maxsize=65536)
+def _hash_key(variable_name: str, key: Tuple[int, ...]) -> int:
+    # Keys sharing a prefix (e.g. entries of a nested map) reuse its cached hash
+    if not key:
+        return _get_base_address(variable_name)
+    return pedersen_hash(_hash_key(variable_name, key[:-1]), key[-1])
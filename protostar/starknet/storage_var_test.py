@@ -0,0 +1,20 @@
+from starkware.crypto.signature.fast_pedersen_hash import pedersen_hash
+from starkware.starknet.public.abi import get_storage_var_address
+
+from .storage_var import calc_address, calc_address_range, normalize_address
+
+
+def test_calc_address_matches_starknet_storage_layout():
+    expected = normalize_address(
+        pedersen_hash(pedersen_hash(get_storage_var_address("balances"), 1), 2)
+    )
+
+    assert calc_address("balances", [1, 2]) == expected
+    assert calc_address("balances", [1, 2]) == expected
+    assert calc_address("balances", []) == get_storage_var_address("balances")
+
+
+def test_calc_address_range():
+    address = calc_address("balances", [3])
+
+    assert calc_address_range("balances", [3], 3) == [address, address + 1, address + 2]
@@ -19,7 +19,9 @@ from .block_explorer import (
     BlockExplorer,
     FakeBlockExplorer,
 )
+from .gateway_client_factory import GatewayClientFactory
 from .gateway_facade_factory import GatewayFacadeFactory
 from .account_manager import AccountManager, AccountConfig
+from .abi_resolution_cache import AbiResolutionCache
 from .abi_resolver import AbiResolver
 from .data_transformer_policy import DataTransformerPolicy
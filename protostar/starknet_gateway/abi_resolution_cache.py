@@ -0,0 +1,75 @@
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from protostar.protostar_exception import ProtostarException
+from protostar.self.artifact_cache import ArtifactCache, hash_strings
+from protostar.starknet import Address, ContractAbi
+
+
+@dataclass(frozen=True)
+class CachedAbi:
+    abi: ContractAbi
+    implementation: Optional[int]
+    """Class hash or address of the implementation, if the contract is a proxy"""
+
+
+class AbiResolutionCache:
+    """
+    Persists ABIs resolved from a network, so repeated commands skip the proxy resolution.
+    An entry is used only while the contract has the same class hash.
+    A proxy can be pointed to a new implementation without changing its own class hash,
+    so the caller must also compare the recorded implementation with the current one.
+    """
+
+    CACHE_NAMESPACE = "resolved_abis"
+
+    def __init__(
+        self,
+        project_root_path: Path,
+        network: str,
+    ):
+        self._artifact_cache = ArtifactCache(
+            project_root_path=project_root_path,
+            namespace=self.CACHE_NAMESPACE,
+            max_entries=1024,
+        )
+        self._network = network
+
+    def read(self, address: Address, class_hash: int) -> Optional[CachedAbi]:
+        raw_entry = self._artifact_cache.read(self._get_key(address))
+        if raw_entry is None:
+            return None
+        try:
+            entry = json.loads(raw_entry)
+            if entry["class_hash"] != class_hash:
+                return None
+            implementation = entry["implementation"]
+            if implementation is not None and not isinstance(implementation, int):
+                return None
+            return CachedAbi(
+                abi=ContractAbi.from_abi_entries(entry["abi"]),
+                implementation=implementation,
+            )
+        except (ValueError, KeyError, TypeError, ProtostarException):
+            return None
+
+    def write(
+        self,
+        address: Address,
+        class_hash: int,
+        abi: ContractAbi,
+        implementation: Optional[int],
+    ) -> None:
+        entry = {
+            "class_hash": class_hash,
+            "implementation": implementation,
+            "abi": abi.to_abi_type(),
+        }
+        self._artifact_cache.write(
+            self._get_key(address), json.dumps(entry).encode("utf-8")
+        )
+
+    def _get_key(self, address: Address) -> str:
+        return hash_strings(self._network, str(int(address)))
@@ -0,0 +1,48 @@
+from pathlib import Path
+
+from protostar.starknet import Address, ContractAbi
+
+from .abi_resolution_cache import AbiResolutionCache
+
+ABI = [{"type": "function", "name": "get", "inputs": [], "outputs": []}]
+ADDRESS = Address(123)
+
+
+def test_abi_is_reused_while_class_hash_does_not_change(tmp_path: Path):
+    cache = AbiResolutionCache(project_root_path=tmp_path, network="testnet")
+    cache.write(
+        ADDRESS,
+        class_hash=1,
+        abi=ContractAbi.from_abi_entries(ABI),
+        implementation=None,
+    )
+
+    cached_abi = cache.read(ADDRESS, class_hash=1)
+
+    assert cached_abi is not None
+    assert cached_abi.abi.to_abi_type() == ABI
+    assert cached_abi.implementation is None
+    assert cache.read(ADDRESS, class_hash=2) is None
+    assert (
+        AbiResolutionCache(project_root_path=tmp_path, network="mainnet").read(
+            ADDRESS, class_hash=1
+        )
+        is None
+    )
+
+
+def test_proxy_implementation_is_recorded(tmp_path: Path):
+    cache = AbiResolutionCache(project_root_path=tmp_path, network="testnet")
+    cache.write(
+        ADDRESS,
+        class_hash=1,
+        abi=ContractAbi.from_abi_entries(ABI),
+        implementation=2,
+    )
+
+    cached_abi = AbiResolutionCache(project_root_path=tmp_path, network="testnet").read(
+        ADDRESS, class_hash=1
+    )
+
+    assert cached_abi is not None
+    assert cached_abi.implementation == 2
@@ -1,3 +1,4 @@
+import asyncio
 from typing import Optional
 
 from starknet_py.proxy.contract_abi_resolver import (
@@ -6,6 +7,7 @@ from starknet_py.proxy.contract_abi_resolver import (
     ProxyConfig,
 )
 from starknet_py.net.client import Client
+from starknet_py.net.client_errors import ClientError
 from starknet_py.proxy.proxy_check import (
     OpenZeppelinProxyCheck,
     ArgentProxyCheck,
@@ -14,18 +16,79 @@ from starknet_py.proxy.proxy_check import (
 
 from protostar.starknet import Address, ContractAbi
 
+from .abi_resolution_cache import AbiResolutionCache
+
 
 class AbiResolver:
-    def __init__(self, client: Client) -> None:
+    def __init__(
+        self, client: Client, abi_cache: Optional[AbiResolutionCache] = None
+    ) -> None:
         self._client = client
+        self._abi_cache = abi_cache
+        self._resolutions: dict[int, "asyncio.Future[Optional[ContractAbi]]"] = {}
+        self._proxy_checks: list[ProxyCheck] = [
+            OpenZeppelinProxyCheck(),
+            ArgentProxyCheck(),
+        ]
 
     async def resolve(self, address: Address) -> Optional[ContractAbi]:
+        # Concurrent calls to the same contract share a single resolution
+        if int(address) not in self._resolutions:
+            self._resolutions[int(address)] = asyncio.ensure_future(
+                self._resolve_with_cache(address)
+            )
+        return await self._resolutions[int(address)]
+
+    async def _resolve_with_cache(self, address: Address) -> Optional[ContractAbi]:
+        if self._abi_cache is None:
+            return await self._resolve_from_network(address)
+
+        # A single request, while the proxy resolution takes several
+        class_hash = await self._get_class_hash(address)
+        if class_hash is None:
+            return await self._resolve_from_network(address)
+        cached_abi = self._abi_cache.read(address, class_hash)
+        # Implementations are checked only for proxies, since a contract can't become a proxy
+        # without changing its class hash
+        if cached_abi and (
+            cached_abi.implementation is None
+            or cached_abi.implementation == await self._get_implementation(address)
+        ):
+            return cached_abi.abi
+        abi = await self._resolve_from_network(address)
+        if abi:
+            self._abi_cache.write(
+                address, class_hash, abi, await self._get_implementation(address)
+            )
+        return abi
+
+    async def _get_class_hash(self, address: Address) -> Optional[int]:
+        try:
+            return await self._client.get_class_hash_at(int(address))
+        except ClientError:
+            return None
+
+    async def _get_implementation(self, address: Address) -> Optional[int]:
+        """
+        @return: class hash or address of the implementation, if the contract is a proxy
+        """
+        for proxy_check in self._proxy_checks:
+            try:
+                implementation = await proxy_check.implementation_hash(
+                    int(address), self._client
+                ) or await proxy_check.implementation_address(
+                    int(address), self._client
+                )
+            except ClientError:
+                continue
+            if implementation:
+                return implementation
+        return None
+
+    async def _resolve_from_network(self, address: Address) -> Optional[ContractAbi]:
         abi = await self._resolve(
             address=address,
-            proxy_checks=[
-                OpenZeppelinProxyCheck(),
-                ArgentProxyCheck(),
-            ],
+            proxy_checks=self._proxy_checks,
         )
         if abi:
             return abi
@@ -0,0 +1,74 @@
+from pathlib import Path
+from typing import Optional
+
+from pytest_mock import MockerFixture
+
+from protostar.starknet import Address, ContractAbi
+
+from .abi_resolution_cache import AbiResolutionCache
+from .abi_resolver import AbiResolver
+
+ADDRESS = Address(123)
+OLD_ABI = [{"type": "function", "name": "get", "inputs": [], "outputs": []}]
+NEW_ABI = [{"type": "function", "name": "set", "inputs": [], "outputs": []}]
+
+
+class FakeProxyCheck:
+    def __init__(self, implementation: Optional[int]):
+        self.implementation = implementation
+
+    async def implementation_hash(self, _address: int, _client) -> Optional[int]:
+        return self.implementation
+
+    async def implementation_address(self, _address: int, _client) -> Optional[int]:
+        return None
+
+
+async def resolve_abi_entries(abi_resolver: AbiResolver):
+    abi = await abi_resolver.resolve(ADDRESS)
+    assert abi is not None
+    return abi.to_abi_type()
+
+
+def create_abi_resolver(
+    tmp_path: Path, mocker: MockerFixture, proxy_check: FakeProxyCheck
+) -> AbiResolver:
+    client = mocker.MagicMock()
+    client.get_class_hash_at = mocker.AsyncMock(return_value=1)
+    abi_resolver = AbiResolver(
+        client=client,
+        abi_cache=AbiResolutionCache(project_root_path=tmp_path, network="testnet"),
+    )
+    abi_resolver._proxy_checks = [proxy_check]  # pylint: disable=protected-access
+    return abi_resolver
+
+
+async def test_proxy_abi_is_resolved_again_after_upgrade(
+    tmp_path: Path, mocker: MockerFixture
+):
+    proxy_check = FakeProxyCheck(implementation=2)
+    abi_resolver = create_abi_resolver(tmp_path, mocker, proxy_check)
+    mocker.patch.object(
+        abi_resolver,
+        "_resolve_from_network",
+        mocker.AsyncMock(return_value=ContractAbi.from_abi_entries(OLD_ABI)),
+    )
+    assert await resolve_abi_entries(abi_resolver) == OLD_ABI
+
+    abi_resolver = create_abi_resolver(tmp_path, mocker, proxy_check)
+    resolve_from_network = mocker.patch.object(
+        abi_resolver,
+        "_resolve_from_network",
+        mocker.AsyncMock(return_value=ContractAbi.from_abi_entries(NEW_ABI)),
+    )
+    assert await resolve_abi_entries(abi_resolver) == OLD_ABI
+    resolve_from_network.assert_not_called()
+
+    proxy_check.implementation = 3
+    abi_resolver = create_abi_resolver(tmp_path, mocker, proxy_check)
+    mocker.patch.object(
+        abi_resolver,
+        "_resolve_from_network",
+        mocker.AsyncMock(return_value=ContractAbi.from_abi_entries(NEW_ABI)),
+    )
+    assert await resolve_abi_entries(abi_resolver) == NEW_ABI
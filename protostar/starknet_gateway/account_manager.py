@@ -2,7 +2,6 @@ from dataclasses import dataclass
 
 from starknet_py.net.account.account import Account
 from starknet_py.net.signer import BaseSigner
-from starknet_py.net.gateway_client import GatewayClient
 from starknet_py.net.client_models import Call as SNCall
 from starknet_py.net.client_errors import ClientError
 
@@ -17,6 +16,7 @@ from protostar.starknet_gateway.multicall import (
 
 from .type import Fee
 from .gateway_facade import GatewayFacade
+from .gateway_client_factory import GatewayClientFactory
 
 
 @dataclass
@@ -31,9 +31,10 @@ class AccountManager(MulticallAccountManagerProtocol):
         account_config: AccountConfig,
         gateway_url: str,
         client: GatewayFacade,
+        gateway_client_factory: GatewayClientFactory,
     ):
         self._account_config = account_config
-        gateway_client = GatewayClient(gateway_url)
+        gateway_client = gateway_client_factory.create(gateway_url)
 
         self._client = client
         self._account = Account(
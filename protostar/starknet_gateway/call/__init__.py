@@ -1,2 +1,4 @@
 from .call_use_case import CallUseCase
 from .call_structs import CallInput, CallOutput, CairoOrPythonData
+from .batch_call_use_case import BatchCallUseCase, BatchCallResult
+from .batch_call_file_interpreter import interpret_batch_call_file_content
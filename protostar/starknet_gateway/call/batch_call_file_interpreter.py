@@ -0,0 +1,45 @@
+from typing import Any
+
+import tomlkit as toml
+from tomlkit.exceptions import TOMLKitError
+from tomlkit.items import AoT
+
+from protostar.protostar_exception import ProtostarException
+from protostar.starknet import Address, Selector, CairoOrPythonData
+
+from .call_structs import CallInput
+
+
+def interpret_batch_call_file_content(toml_content: str) -> list[CallInput]:
+    try:
+        doc = toml.loads(toml_content)
+    except TOMLKitError as ex:
+        raise ProtostarException("Invalid batch call file", details=str(ex)) from ex
+    call_aot = doc.get("call")
+    if not isinstance(call_aot, AoT):
+        raise ProtostarException("Batch call file must define `[[call]]` entries")
+    return [map_raw_call_to_call_input(raw_call) for raw_call in call_aot.value]
+
+
+def map_raw_call_to_call_input(raw_call: Any) -> CallInput:
+    try:
+        raw_address = raw_call["contract-address"]
+        function_name = raw_call["function"]
+    except KeyError as ex:
+        raise ProtostarException(
+            f"Batch call entry is missing the `{ex.args[0]}` key"
+        ) from ex
+    return CallInput(
+        address=Address.from_user_input(raw_address),
+        selector=Selector(str(function_name)),
+        inputs=_parse_inputs(raw_call.get("inputs")),
+        contract_abi=None,
+    )
+
+
+def _parse_inputs(raw_inputs: Any) -> CairoOrPythonData:
+    if raw_inputs is None:
+        return []
+    if isinstance(raw_inputs, dict):
+        return dict(raw_inputs)
+    return [int(raw_input) for raw_input in raw_inputs]
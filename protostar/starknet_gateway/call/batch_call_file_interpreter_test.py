@@ -0,0 +1,48 @@
+from textwrap import dedent
+
+import pytest
+
+from protostar.protostar_exception import ProtostarException
+from protostar.starknet import Address, Selector
+
+from .batch_call_file_interpreter import interpret_batch_call_file_content
+
+
+def test_parsing():
+    file_content = dedent(
+        """
+        [[call]]
+        contract-address = "0x123"
+        function = "get_balance"
+
+        [[call]]
+        contract-address = "0x123"
+        function = "add"
+        inputs = [1, 2]
+
+        [[call]]
+        contract-address = 291
+        function = "add"
+        inputs = { a = 1, b = 2 }
+        """
+    )
+
+    call_inputs = interpret_batch_call_file_content(file_content)
+
+    assert [call_input.address for call_input in call_inputs] == [Address(0x123)] * 3
+    assert call_inputs[0].selector == Selector("get_balance")
+    assert call_inputs[0].inputs == []
+    assert call_inputs[1].inputs == [1, 2]
+    assert call_inputs[2].inputs == {"a": 1, "b": 2}
+
+
+def test_missing_function():
+    file_content = dedent(
+        """
+        [[call]]
+        contract-address = "0x123"
+        """
+    )
+
+    with pytest.raises(ProtostarException, match="function"):
+        interpret_batch_call_file_content(file_content)
@@ -0,0 +1,69 @@
+import asyncio
+from dataclasses import dataclass
+from typing import AsyncIterator, Optional, Sequence
+
+import aiohttp
+from starknet_py.net.client_errors import ClientError
+
+from protostar.protostar_exception import ProtostarException
+
+from .call_structs import CallInput, CallOutput
+from .call_use_case import CallUseCase
+
+
+@dataclass
+class BatchCallResult:
+    index: int
+    call_input: CallInput
+    call_output: Optional[CallOutput]
+    error: Optional[ProtostarException]
+
+
+class BatchCallUseCase:
+    """
+    Executes calls concurrently, at most `max_concurrency` at a time.
+    Results are yielded in the order of inputs, as soon as all preceding calls finished.
+    A failed call, including a network error, doesn't stop the remaining ones.
+    """
+
+    def __init__(self, call_use_case: CallUseCase, max_concurrency: int) -> None:
+        self._call_use_case = call_use_case
+        self._max_concurrency = max(1, max_concurrency)
+
+    async def execute(
+        self, call_inputs: Sequence[CallInput]
+    ) -> AsyncIterator[BatchCallResult]:
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def execute_call(index: int, call_input: CallInput) -> BatchCallResult:
+            async with semaphore:
+                try:
+                    call_output = await self._call_use_case.execute(call_input)
+                except ProtostarException as ex:
+                    return BatchCallResult(
+                        index=index, call_input=call_input, call_output=None, error=ex
+                    )
+                except (ClientError, aiohttp.ClientError, asyncio.TimeoutError) as ex:
+                    return BatchCallResult(
+                        index=index,
+                        call_input=call_input,
+                        call_output=None,
+                        error=ProtostarException(str(ex) or type(ex).__name__),
+                    )
+                return BatchCallResult(
+                    index=index,
+                    call_input=call_input,
+                    call_output=call_output,
+                    error=None,
+                )
+
+        tasks = [
+            asyncio.ensure_future(execute_call(index, call_input))
+            for index, call_input in enumerate(call_inputs)
+        ]
+        try:
+            for task in tasks:
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
@@ -0,0 +1,103 @@
+import asyncio
+
+import aiohttp
+from starknet_py.net.client_errors import ClientError
+
+from protostar.protostar_exception import ProtostarException
+from protostar.starknet import Address, Selector
+
+from .batch_call_use_case import BatchCallUseCase
+from .call_structs import CallInput, CallOutput
+
+
+class StandInCallUseCase:
+    def __init__(self):
+        self.running_calls_count = 0
+        self.max_running_calls_count = 0
+
+    async def execute(self, input_data: CallInput) -> CallOutput:
+        self.running_calls_count += 1
+        self.max_running_calls_count = max(
+            self.max_running_calls_count, self.running_calls_count
+        )
+        # later calls finish first
+        await asyncio.sleep(0.01 / (int(input_data.address) + 1))
+        self.running_calls_count -= 1
+        if str(input_data.selector) == "fail":
+            raise ProtostarException("Call failed")
+        if str(input_data.selector) == "reject":
+            raise ClientError("Contract not found")
+        if str(input_data.selector) == "disconnect":
+            raise aiohttp.ServerDisconnectedError()
+        return CallOutput(cairo_data=[int(input_data.address)], human_data=None)
+
+
+def create_call_input(address: int, function_name: str = "get") -> CallInput:
+    return CallInput(
+        address=Address(address),
+        selector=Selector(function_name),
+        inputs=None,
+        contract_abi=None,
+    )
+
+
+async def test_results_are_yielded_in_order_with_bounded_concurrency():
+    call_use_case = StandInCallUseCase()
+    batch_call_use_case = BatchCallUseCase(
+        call_use_case=call_use_case, max_concurrency=3  # type: ignore
+    )
+
+    results = [
+        result
+        async for result in batch_call_use_case.execute(
+            [create_call_input(address) for address in range(10)]
+        )
+    ]
+
+    assert [result.index for result in results] == list(range(10))
+    assert [
+        result.call_output.cairo_data for result in results if result.call_output
+    ] == [[address] for address in range(10)]
+    assert call_use_case.max_running_calls_count == 3
+
+
+async def test_failed_call_does_not_stop_other_calls():
+    batch_call_use_case = BatchCallUseCase(
+        call_use_case=StandInCallUseCase(), max_concurrency=2  # type: ignore
+    )
+
+    results = [
+        result
+        async for result in batch_call_use_case.execute(
+            [create_call_input(0, "fail"), create_call_input(1)]
+        )
+    ]
+
+    assert results[0].error is not None
+    assert results[0].error.message == "Call failed"
+    assert results[1].call_output is not None
+    assert results[1].call_output.cairo_data == [1]
+
+
+async def test_network_errors_are_reported_per_call():
+    batch_call_use_case = BatchCallUseCase(
+        call_use_case=StandInCallUseCase(), max_concurrency=3  # type: ignore
+    )
+
+    results = [
+        result
+        async for result in batch_call_use_case.execute(
+            [
+                create_call_input(0, "reject"),
+                create_call_input(1, "disconnect"),
+                create_call_input(2),
+            ]
+        )
+    ]
+
+    assert results[0].error is not None
+    assert "Contract not found" in results[0].error.message
+    assert results[1].error is not None
+    assert results[1].error.message
+    assert results[2].call_output is not None
+    assert results[2].call_output.cairo_data == [2]
@@ -0,0 +1,87 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import aiohttp
+from starknet_py.net.gateway_client import GatewayClient
+
+
+@dataclass
+class ConnectionStats:
+    created: int = 0
+    reused: int = 0
+
+
+class GatewayClientFactory:
+    """
+    Creates gateway clients sharing one HTTP session per gateway URL, so connections are kept alive
+    and reused by all clients talking to the same network.
+    Sessions belong to the event loop they were created in and are closed by `close`.
+    """
+
+    def __init__(
+        self,
+        connection_limit: int = 32,
+        keepalive_timeout_s: float = 30,
+    ) -> None:
+        self._connection_limit = connection_limit
+        self._keepalive_timeout_s = keepalive_timeout_s
+        self._sessions: dict[str, aiohttp.ClientSession] = {}
+        self._connection_stats: dict[str, ConnectionStats] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def create(self, gateway_url: str) -> GatewayClient:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # A session can't outlive its event loop, so clients created outside one don't share it
+            return GatewayClient(gateway_url)
+        if loop is not self._loop:
+            # Sessions of a previous event loop can't be used or closed anymore
+            self._sessions = {}
+            self._connection_stats = {}
+            self._loop = loop
+        return GatewayClient(gateway_url, session=self._get_session(gateway_url))
+
+    async def close(self) -> None:
+        sessions = self._sessions
+        self._sessions = {}
+        for gateway_url, session in sessions.items():
+            await session.close()
+            stats = self._connection_stats[gateway_url]
+            logging.debug(
+                "Connections to %s: %d opened, %d reused",
+                gateway_url,
+                stats.created,
+                stats.reused,
+            )
+        self._connection_stats = {}
+
+    def _get_session(self, gateway_url: str) -> aiohttp.ClientSession:
+        session = self._sessions.get(gateway_url)
+        if session is None or session.closed:
+            stats = ConnectionStats()
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self._connection_limit,
+                    keepalive_timeout=self._keepalive_timeout_s,
+                ),
+                trace_configs=[self._create_trace_config(stats)],
+            )
+            self._sessions[gateway_url] = session
+            self._connection_stats[gateway_url] = stats
+        return session
+
+    @staticmethod
+    def _create_trace_config(stats: ConnectionStats) -> aiohttp.TraceConfig:
+        async def on_connection_create_end(*_args: Any):
+            stats.created += 1
+
+        async def on_connection_reuseconn(*_args: Any):
+            stats.reused += 1
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        return trace_config
@@ -0,0 +1,36 @@
+from pytest_mock import MockerFixture
+
+from .gateway_client_factory import GatewayClientFactory
+
+
+async def test_clients_of_the_same_gateway_share_a_session(mocker: MockerFixture):
+    gateway_client_mock = mocker.patch(
+        "protostar.starknet_gateway.gateway_client_factory.GatewayClient"
+    )
+    factory = GatewayClientFactory()
+
+    factory.create("http://localhost:5050")
+    factory.create("http://localhost:5050")
+    factory.create("http://localhost:5051")
+
+    sessions = [call.kwargs["session"] for call in gateway_client_mock.call_args_list]
+    assert sessions[0] is sessions[1]
+    assert sessions[0] is not sessions[2]
+
+    await factory.close()
+
+    assert all(session.closed for session in sessions)
+    factory.create("http://localhost:5050")
+    assert gateway_client_mock.call_args.kwargs["session"] is not sessions[0]
+
+
+def test_clients_created_outside_event_loop_do_not_share_a_session(
+    mocker: MockerFixture,
+):
+    gateway_client_mock = mocker.patch(
+        "protostar.starknet_gateway.gateway_client_factory.GatewayClient"
+    )
+
+    GatewayClientFactory().create("http://localhost:5050")
+
+    gateway_client_mock.assert_called_once_with("http://localhost:5050")
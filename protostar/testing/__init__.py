@@ -22,7 +22,8 @@ from .test_results import (
 )
 from .test_runner import TestRunner
 from .testing_summary import TestingSummary
-from .test_scheduler import TestScheduler
+from .test_scheduler import TestScheduler, TestDurations
+from .test_collection_index import TestCollectionIndex
 from .test_shared_tests_state import SharedTestsState
 from .testing_seed import determine_testing_seed
 from .hook import Hook
@@ -1,4 +1,3 @@
-import asyncio
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Protocol
@@ -11,6 +10,7 @@ from starkware.starknet.services.api.gateway.transaction import (
 from starkware.starknet.testing.contract import DeclaredClass
 from starkware.starknet.testing.contract_utils import EventManager
 
+from protostar.cairo.hint_event_loop import run_in_hint_event_loop
 from protostar.compiler import Cairo0ProjectCompiler
 from protostar.starknet import Cheatcode, KeywordOnlyArgumentCheatcodeException
 
@@ -53,7 +53,7 @@ class DeclareCheatcode(Cheatcode):
         if len(args) > 0:
             raise KeywordOnlyArgumentCheatcodeException(self.name, ["config"])
 
-        declared_class = asyncio.run(self._declare_contract(contract))
+        declared_class = run_in_hint_event_loop(self._declare_contract(contract))
         assert declared_class
         class_hash = declared_class.class_hash
 
@@ -1,9 +1,10 @@
 import asyncio
-import dataclasses
+import time
+import unittest
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, List, Optional
 
-from hypothesis import example, given, seed, settings
+from hypothesis import example, given, settings
 from hypothesis.database import ExampleDatabase, InMemoryExampleDatabase
 from hypothesis.errors import InvalidArgument
 from hypothesis.reporting import with_reporter
@@ -21,8 +22,10 @@ from protostar.testing.environments.contract_based_test_execution_environment im
 )
 from protostar.testing.environments.execution_environment import TestExecutionResult
 from protostar.testing.fuzzing.exceptions import FuzzingError, HypothesisRejectException
+from protostar.testing.fuzzing.fuzz_shard import FuzzShard
 from protostar.testing.fuzzing.fuzz_input_exception_metadata import (
     FuzzInputExceptionMetadata,
+    FuzzShardSeedExceptionMetadata,
 )
 from protostar.testing.fuzzing.hypothesis.aio import wrap_in_sync
 from protostar.testing.fuzzing.hypothesis.reporter import (
@@ -30,6 +33,7 @@ from protostar.testing.fuzzing.hypothesis.reporter import (
     protostar_reporter,
 )
 from protostar.testing.fuzzing.hypothesis.runs_counter import RunsCounter
+from protostar.testing.fuzzing.hypothesis.seeding import seed_keeping_database
 from protostar.testing.fuzzing.strategy_collector import collect_search_strategies
 from protostar.testing.starkware.execution_resources_summary import (
     ExecutionResourcesSummary,
@@ -42,15 +46,30 @@ from protostar.testing.starkware.contract_based_test_execution_state import (
 @dataclass
 class FuzzTestExecutionResult(TestExecutionResult):
     fuzz_runs_count: int
+    fuzz_examples_per_second: Optional[float]
 
 
 class FuzzTestExecutionEnvironment(ContractBasedTestExecutionEnvironment):
-    def __init__(self, state: ContractBasedTestExecutionState):
+    def __init__(
+        self,
+        state: ContractBasedTestExecutionState,
+        fuzz_shard: Optional[FuzzShard] = None,
+        example_database: Optional[ExampleDatabase] = None,
+    ):
+        """
+        @param fuzz_shard: runs only a part of the examples with a seed of the shard,
+            when the test case is shared by several workers
+        @param example_database: keeps failing examples between runs, so they are replayed first.
+            Examples are kept only for the current run by default.
+        """
         super().__init__(state)
         if self.state.config.profiling:
             raise ProtostarException("Fuzz tests cannot be profiled")
         self.initial_state = state
         self.given_strategies: dict[str, SearchStrategy] = {}
+        self._fuzz_shard = fuzz_shard
+        self._example_database = example_database
+        self._found_failure = False
 
     async def execute(
         self, function_identifier: OffsetOrName
@@ -66,8 +85,16 @@ class FuzzTestExecutionEnvironment(ContractBasedTestExecutionEnvironment):
 
         execution_resources: List[ExecutionResourcesSummary] = []
 
-        database = InMemoryExampleDatabase()
-        runs_counter = RunsCounter(budget=self.state.config.fuzz_max_examples)
+        database = (
+            self._example_database
+            if self._example_database is not None
+            else InMemoryExampleDatabase()
+        )
+        runs_counter = RunsCounter(
+            budget=self._fuzz_shard.get_budget(self.state.config.fuzz_max_examples)
+            if self._fuzz_shard
+            else self.state.config.fuzz_max_examples
+        )
 
         if (
             not self.state.config.fuzz_examples
@@ -98,6 +125,7 @@ class FuzzTestExecutionEnvironment(ContractBasedTestExecutionEnvironment):
                     runs_counter=runs_counter,
                 )
 
+        start_time = time.perf_counter()
         try:
             with self.state.output_recorder.redirect("test"):
                 await asyncio.to_thread(test_thread)
@@ -106,23 +134,37 @@ class FuzzTestExecutionEnvironment(ContractBasedTestExecutionEnvironment):
             escape_err.error.metadata.append(
                 FuzzInputExceptionMetadata(escape_err.inputs)
             )
+            if not self._is_first_fuzz_shard():
+                escape_err.error.metadata.append(
+                    FuzzShardSeedExceptionMetadata(self._get_seed())
+                )
             raise escape_err.error
 
         return FuzzTestExecutionResult(
             execution_resources=ExecutionResourcesSummary.sum(execution_resources),
             fuzz_runs_count=runs_counter.count,
+            fuzz_examples_per_second=self._get_examples_per_second(
+                runs_counter, start_time
+            ),
         )
 
+    @staticmethod
+    def _get_examples_per_second(
+        runs_counter: RunsCounter, start_time: float
+    ) -> Optional[float]:
+        elapsed = time.perf_counter() - start_time
+        if elapsed <= 0:
+            return None
+        return runs_counter.count / elapsed
+
     def fork_state_for_test(self):
         """
-        Some parts of execution state **must** be shared between fuzz test runs,
-        so as kinda hack, we fork the state and then bring back old, shared, objects selectively.
+        Resets the state to the one after the setup, before each fuzz example.
+        Only the parts of the state which can be modified by the test case are forked,
+        the output recorder, stopwatch and config are shared between examples.
         """
 
-        self.state = dataclasses.replace(
-            self.initial_state.fork(),
-            output_recorder=self.initial_state.output_recorder,
-        )
+        self.state = self.initial_state.fork_for_example()
 
     def set_cheatcodes_for_test(self):
         """
@@ -139,6 +181,8 @@ class FuzzTestExecutionEnvironment(ContractBasedTestExecutionEnvironment):
 
     def decorate_with_examples(self, target_func: Callable) -> Callable:
         func = target_func
+        if not self._is_first_fuzz_shard():
+            return func
         for ex in reversed(self.state.config.fuzz_examples):
             func = example(**ex)(func)
         return func
@@ -168,10 +212,11 @@ class FuzzTestExecutionEnvironment(ContractBasedTestExecutionEnvironment):
             )
 
             @self.decorate_with_examples
-            @seed(self.state.config.seed)
-            @settings_instance
+            @seed_keeping_database(self._get_seed(), settings_instance)
             @self.decorate_with_given
             async def test(**inputs: Any):
+                if self._is_stopped_by_other_fuzz_shard():
+                    raise FuzzShardStoppedException()
                 self.fork_state_for_test()
                 self.set_cheatcodes_for_test()
 
@@ -187,6 +232,7 @@ class FuzzTestExecutionEnvironment(ContractBasedTestExecutionEnvironment):
                         except HypothesisRejectException as reject_ex:
                             raise reject_ex.unsatisfied_assumption_exc
                         except ReportedException as reported_ex:
+                            self._stop_other_fuzz_shards()
                             raise HypothesisFailureSmugglingError(
                                 error=reported_ex,
                                 inputs=inputs,
@@ -198,10 +244,16 @@ class FuzzTestExecutionEnvironment(ContractBasedTestExecutionEnvironment):
                 test.hypothesis.inner_test = wrap_in_sync(test.hypothesis.inner_test)  # type: ignore
 
             if self.given_strategies:
+                if self._fuzz_shard and runs_counter.available_runs == 0:
+                    # The examples budget is smaller than the number of fuzz shards
+                    return
                 # NOTE: The ``test`` function does not expect any arguments at this point,
                 #   because the @given decorator provides all of them behind the scenes.
-                test()
-            elif self.state.config.fuzz_examples:
+                try:
+                    test()
+                except FuzzShardStoppedException:
+                    pass
+            elif self.state.config.fuzz_examples and self._is_first_fuzz_shard():
                 test = wrap_in_sync(test)
                 for ex in reversed(self.state.config.fuzz_examples):
                     test(**ex)
@@ -211,6 +263,34 @@ class FuzzTestExecutionEnvironment(ContractBasedTestExecutionEnvironment):
             # strategy arguments. For example, invalid range for `integers` strategy is caught here.
             raise FuzzingError(str(ex)) from ex
 
+    def _get_seed(self) -> int:
+        if self._fuzz_shard:
+            return self._fuzz_shard.get_seed(self.state.config.seed)
+        return self.state.config.seed
+
+    def _is_first_fuzz_shard(self) -> bool:
+        return self._fuzz_shard is None or self._fuzz_shard.index == 0
+
+    def _is_stopped_by_other_fuzz_shard(self) -> bool:
+        # The shard which found a failure keeps running examples to shrink it
+        return (
+            self._fuzz_shard is not None
+            and not self._found_failure
+            and self._fuzz_shard.is_stopped()
+        )
+
+    def _stop_other_fuzz_shards(self):
+        self._found_failure = True
+        if self._fuzz_shard:
+            self._fuzz_shard.stop()
+
+
+class FuzzShardStoppedException(unittest.SkipTest):
+    """
+    Stops generating examples, once another shard found a failure.
+    Hypothesis re-raises skip exceptions right away, without treating them as a failure to shrink.
+    """
+
 
 @dataclass
 class HypothesisFailureSmugglingError(Exception):
@@ -14,3 +14,15 @@ class FuzzInputExceptionMetadata(ExceptionMetadata):
 
     def format(self) -> str:
         return "\n".join(f"{k} = {v!r}" for k, v in self.inputs.items())
+
+
+@dataclass(frozen=True)
+class FuzzShardSeedExceptionMetadata(ExceptionMetadata):
+    seed: int
+
+    @property
+    def name(self) -> str:
+        return "fuzz shard seed"
+
+    def format(self) -> str:
+        return str(self.seed)
@@ -1,4 +1,7 @@
-from .fuzz_input_exception_metadata import FuzzInputExceptionMetadata
+from .fuzz_input_exception_metadata import (
+    FuzzInputExceptionMetadata,
+    FuzzShardSeedExceptionMetadata,
+)
 
 
 def test_display():
@@ -17,3 +20,10 @@ c = 'abc'\
 
 def test_display_empty():
     assert FuzzInputExceptionMetadata({}).format() == ""
+
+
+def test_display_fuzz_shard_seed():
+    metadata = FuzzShardSeedExceptionMetadata(seed=42)
+
+    assert metadata.name == "fuzz shard seed"
+    assert metadata.format() == "42"
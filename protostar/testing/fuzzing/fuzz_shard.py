@@ -0,0 +1,118 @@
+import dataclasses
+import hashlib
+from dataclasses import dataclass
+from typing import Callable, Dict, List
+
+from protostar.testing.starkware.execution_resources_summary import (
+    ExecutionResourcesSummary,
+)
+from protostar.testing.test_output_recorder import OutputName
+from protostar.testing.test_results import (
+    AcceptableResult,
+    FuzzResult,
+    FuzzShardResult,
+    PassedTestCaseResult,
+    TestCaseResult,
+    TimedTestCaseResult,
+)
+from protostar.testing.testing_seed import Seed
+
+
+@dataclass(frozen=True)
+class FuzzShard:
+    """
+    Part of the examples of a fuzz test case, run by one of the workers sharing it.
+    The first shard to find a failure stops the other ones.
+    """
+
+    index: int
+    count: int
+    is_stopped: Callable[[], bool]
+    stop: Callable[[], None]
+
+    def get_seed(self, seed: Seed) -> Seed:
+        if self.index == 0:
+            return seed
+        digest = hashlib.sha256(f"{seed}:{self.index}".encode("utf-8")).digest()
+        return int.from_bytes(digest[:4], byteorder="little", signed=False)
+
+    def get_budget(self, max_examples: int) -> int:
+        budget, remainder = divmod(max_examples, self.count)
+        return budget + 1 if self.index < remainder else budget
+
+
+def merge_fuzz_shard_results(shard_results: List[FuzzShardResult]) -> TestCaseResult:
+    results = [
+        shard_result.result
+        for shard_result in sorted(shard_results, key=lambda r: r.shard_index)
+    ]
+    fuzz_runs_count = sum(
+        result.fuzz_runs_count or 0
+        for result in results
+        if isinstance(result, FuzzResult)
+    )
+    execution_time = max(
+        result.execution_time
+        for result in results
+        if isinstance(result, TimedTestCaseResult)
+    )
+
+    failed_result = next(
+        (result for result in results if not isinstance(result, AcceptableResult)),
+        None,
+    )
+    if failed_result:
+        # The failing shard has shrunk the failure, so its result is reported
+        if isinstance(failed_result, FuzzResult):
+            return dataclasses.replace(
+                failed_result,
+                fuzz_runs_count=fuzz_runs_count,
+                execution_time=execution_time,
+            )
+        return failed_result
+
+    passed_results = [
+        result for result in results if isinstance(result, PassedTestCaseResult)
+    ]
+    if not passed_results:
+        # e.g. the test case was skipped by its setup
+        return results[0]
+    examples_per_second = [
+        result.fuzz_examples_per_second
+        for result in passed_results
+        if isinstance(result, FuzzResult)
+    ]
+    return dataclasses.replace(
+        passed_results[0],
+        fuzz_runs_count=fuzz_runs_count,
+        fuzz_examples_per_second=sum(examples_per_second)
+        if None not in examples_per_second
+        else None,
+        execution_time=execution_time,
+        execution_resources=ExecutionResourcesSummary.sum(
+            result.execution_resources
+            for result in passed_results
+            if result.execution_resources
+        ),
+        captured_stdout=_merge_captured_stdout(passed_results),
+    )
+
+
+def _merge_captured_stdout(
+    results: List[PassedTestCaseResult],
+) -> Dict[OutputName, str]:
+    # Outputs of examples are numbered per shard, so they are renumbered to follow each other
+    captured_stdout = dict(results[0].captured_stdout)
+    runs_offset = _get_fuzz_runs_count(results[0])
+    for result in results[1:]:
+        for name, output in result.captured_stdout.items():
+            if isinstance(name, tuple):
+                captured_stdout[(name[0], name[1] + runs_offset)] = output
+        runs_offset += _get_fuzz_runs_count(result)
+    return captured_stdout
+
+
+def _get_fuzz_runs_count(result: TestCaseResult) -> int:
+    if isinstance(result, FuzzResult):
+        return result.fuzz_runs_count or 0
+    return 0
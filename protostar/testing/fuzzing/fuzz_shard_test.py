@@ -0,0 +1,132 @@
+from pathlib import Path
+
+from protostar.testing.test_results import (
+    BrokenTestCaseResult,
+    FailedFuzzTestCaseResult,
+    FuzzShardResult,
+    PassedFuzzTestCaseResult,
+    SkippedTestCaseResult,
+    TestCaseResult,
+)
+from protostar.testing.test_environment_exceptions import ReportedException
+
+from .fuzz_shard import FuzzShard, merge_fuzz_shard_results
+
+
+def make_fuzz_shard(index: int, count: int) -> FuzzShard:
+    return FuzzShard(
+        index=index, count=count, is_stopped=lambda: False, stop=lambda: None
+    )
+
+
+def make_passed_result(fuzz_runs_count: int) -> PassedFuzzTestCaseResult:
+    return PassedFuzzTestCaseResult(
+        file_path=Path("test_main.cairo"),
+        test_case_name="test_fuzz",
+        captured_stdout={
+            "test": "",
+            **{("test", run): f"{run}" for run in range(1, fuzz_runs_count + 1)},
+        },
+        execution_time=1.0,
+        execution_resources=None,
+        fuzz_runs_count=fuzz_runs_count,
+        fuzz_examples_per_second=10.0,
+    )
+
+
+def wrap(result: TestCaseResult, shard_index: int) -> FuzzShardResult:
+    return FuzzShardResult(
+        file_path=result.file_path,
+        test_case_name=result.test_case_name,
+        shard_index=shard_index,
+        shards_count=2,
+        result=result,
+    )
+
+
+def test_examples_budget_is_split_between_shards():
+    budgets = [make_fuzz_shard(index, 3).get_budget(100) for index in range(3)]
+
+    assert budgets == [34, 33, 33]
+
+
+def test_first_shard_keeps_the_seed_and_other_shards_derive_their_own():
+    seeds = [make_fuzz_shard(index, 3).get_seed(10) for index in range(3)]
+
+    assert seeds[0] == 10
+    assert len(set(seeds)) == 3
+    assert seeds == [make_fuzz_shard(index, 3).get_seed(10) for index in range(3)]
+
+
+def test_passed_shard_results_are_merged():
+    merged = merge_fuzz_shard_results(
+        [wrap(make_passed_result(2), 1), wrap(make_passed_result(3), 0)]
+    )
+
+    assert isinstance(merged, PassedFuzzTestCaseResult)
+    assert merged.fuzz_runs_count == 5
+    assert merged.fuzz_examples_per_second == 20.0
+    assert merged.captured_stdout == {
+        "test": "",
+        ("test", 1): "1",
+        ("test", 2): "2",
+        ("test", 3): "3",
+        ("test", 4): "1",
+        ("test", 5): "2",
+    }
+
+
+def test_failed_shard_result_is_reported():
+    failed_result = FailedFuzzTestCaseResult(
+        file_path=Path("test_main.cairo"),
+        test_case_name="test_fuzz",
+        captured_stdout={},
+        execution_time=2.0,
+        exception=ReportedException(),
+        fuzz_runs_count=1,
+        fuzz_examples_per_second=None,
+    )
+
+    merged = merge_fuzz_shard_results(
+        [wrap(make_passed_result(3), 0), wrap(failed_result, 1)]
+    )
+
+    assert isinstance(merged, FailedFuzzTestCaseResult)
+    assert merged.exception is failed_result.exception
+    assert merged.fuzz_runs_count == 4
+    assert merged.execution_time == 2.0
+
+
+def test_broken_shard_result_is_reported():
+    broken_result = BrokenTestCaseResult(
+        file_path=Path("test_main.cairo"),
+        test_case_name="test_fuzz",
+        captured_stdout={},
+        execution_time=0.0,
+        exception=ReportedException(),
+    )
+
+    merged = merge_fuzz_shard_results(
+        [wrap(make_passed_result(3), 0), wrap(broken_result, 1)]
+    )
+
+    assert merged is broken_result
+
+
+def test_skipped_shard_results_are_merged():
+    skipped_results = [
+        SkippedTestCaseResult(
+            file_path=Path("test_main.cairo"),
+            test_case_name="test_fuzz",
+            captured_stdout={},
+            execution_time=0.0,
+            reason="skipped",
+        )
+        for _ in range(2)
+    ]
+
+    merged = merge_fuzz_shard_results(
+        [wrap(result, index) for index, result in enumerate(skipped_results)]
+    )
+
+    assert merged is skipped_results[0]
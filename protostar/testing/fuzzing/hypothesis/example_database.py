@@ -0,0 +1,49 @@
+from pathlib import Path
+
+from hypothesis.database import DirectoryBasedExampleDatabase, ExampleDatabase
+
+from protostar.self.artifact_cache import hash_strings
+from protostar.self.cache_io import CACHE_DIR_NAME
+
+
+class FuzzExampleDatabaseFactory:
+    """
+    Creates Hypothesis example databases kept under `.protostar_cache/<namespace>`.
+    Each test case has its own database, so the failing examples shrunk by a previous run
+    are replayed before any new examples are generated.
+    """
+
+    CACHE_NAMESPACE = "fuzz_examples"
+
+    def __init__(self, project_root_path: Path):
+        self._project_root_path = project_root_path
+        self._root_cache_path = project_root_path / CACHE_DIR_NAME
+        self._cache_path = self._root_cache_path / self.CACHE_NAMESPACE
+
+    def create(self, test_path: Path, test_case_name: str) -> ExampleDatabase:
+        self._ensure_gitignore()
+        # Hypothesis keys examples by the source of the test function,
+        # which is the same for all test cases, so they are separated by directories
+        return DirectoryBasedExampleDatabase(
+            str(self._cache_path / self._get_key(test_path, test_case_name))
+        )
+
+    def _get_key(self, test_path: Path, test_case_name: str) -> str:
+        # Relative paths keep the examples valid when the project is checked out elsewhere, e.g. on CI
+        try:
+            test_path = test_path.resolve().relative_to(
+                self._project_root_path.resolve()
+            )
+        except ValueError:
+            pass
+        return hash_strings(test_path.as_posix(), test_case_name)
+
+    def _ensure_gitignore(self):
+        gitignore_path = self._root_cache_path / ".gitignore"
+        try:
+            if not gitignore_path.exists():
+                self._root_cache_path.mkdir(parents=True, exist_ok=True)
+                gitignore_path.write_text("*\n", encoding="utf-8")
+        except OSError:
+            # The database is an optimization, an unwritable cache must not break the test
+            pass
@@ -0,0 +1,28 @@
+from pathlib import Path
+
+from .example_database import FuzzExampleDatabaseFactory
+
+
+def test_examples_are_kept_per_test_case(tmp_path: Path):
+    factory = FuzzExampleDatabaseFactory(project_root_path=tmp_path)
+    test_path = tmp_path / "tests" / "test_main.cairo"
+
+    factory.create(test_path, "test_fuzz").save(b"key", b"example")
+
+    assert list(factory.create(test_path, "test_fuzz").fetch(b"key")) == [b"example"]
+    assert not list(factory.create(test_path, "test_other").fetch(b"key"))
+    assert (tmp_path / ".protostar_cache" / ".gitignore").exists()
+
+
+def test_examples_are_found_in_moved_project(tmp_path: Path):
+    test_path = Path("tests") / "test_main.cairo"
+    FuzzExampleDatabaseFactory(project_root_path=tmp_path / "a").create(
+        tmp_path / "a" / test_path, "test_fuzz"
+    ).save(b"key", b"example")
+    (tmp_path / "a").rename(tmp_path / "b")
+
+    database = FuzzExampleDatabaseFactory(project_root_path=tmp_path / "b").create(
+        tmp_path / "b" / test_path, "test_fuzz"
+    )
+
+    assert list(database.fetch(b"key")) == [b"example"]
@@ -0,0 +1,21 @@
+from typing import Callable, TypeVar
+
+from hypothesis import seed, settings
+
+TestFunction = TypeVar("TestFunction", bound=Callable)
+
+
+def seed_keeping_database(
+    seed_value: int, settings_instance: settings
+) -> Callable[[TestFunction], TestFunction]:
+    """
+    Seeds a Hypothesis test without disabling its example database.
+
+    ``seed`` sets ``database=None`` in the settings it attaches to the test,
+    so ``settings_instance`` is applied after it to restore the database.
+    """
+
+    def decorate(test: TestFunction) -> TestFunction:
+        return settings_instance(seed(seed_value)(test))
+
+    return decorate
@@ -0,0 +1,56 @@
+from pathlib import Path
+from typing import Callable
+
+import pytest
+from hypothesis import given, seed, settings
+from hypothesis.database import DirectoryBasedExampleDatabase
+from hypothesis.strategies import integers
+
+from .seeding import seed_keeping_database
+
+
+def run_failing_test(decorate: Callable[[Callable], Callable]) -> list[int]:
+    values: list[int] = []
+
+    @decorate
+    @given(integers())
+    def test(value: int):
+        values.append(value)
+        assert value < 10
+
+    with pytest.raises(AssertionError):
+        test()
+    return values
+
+
+def get_saved_files(database_path: Path) -> list[Path]:
+    return [path for path in database_path.rglob("*") if path.is_file()]
+
+
+@pytest.fixture(name="settings_instance")
+def settings_instance_fixture(tmp_path: Path) -> settings:
+    return settings(
+        database=DirectoryBasedExampleDatabase(str(tmp_path)), print_blob=False
+    )
+
+
+def test_failing_examples_are_saved(tmp_path: Path, settings_instance: settings):
+    run_failing_test(seed_keeping_database(42, settings_instance))
+
+    assert get_saved_files(tmp_path)
+
+
+def test_saved_examples_are_replayed_first(settings_instance: settings):
+    run_failing_test(seed_keeping_database(42, settings_instance))
+
+    values = run_failing_test(seed_keeping_database(43, settings_instance))
+
+    assert values[0] == 10
+
+
+def test_seed_applied_after_settings_disables_database(
+    tmp_path: Path, settings_instance: settings
+):
+    run_failing_test(lambda test: seed(42)(settings_instance(test)))
+
+    assert not get_saved_files(tmp_path)
@@ -1,4 +1,5 @@
 import dataclasses
+from copy import deepcopy
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -27,6 +28,19 @@ class ContractBasedTestExecutionState(TestExecutionState):
             contract=super_instance.starknet.copy_and_adapt_contract(self.contract),
         )
 
+    def fork_for_example(self) -> Self:
+        """
+        Cheaper `fork` used before each fuzz example. It forks only the Starknet state and the context,
+        which can be modified by the test case. Output recorder, stopwatch and config are shared.
+        """
+        starknet = self.starknet.fork()
+        return dataclasses.replace(
+            self,
+            starknet=starknet,
+            context=deepcopy(self.context),
+            contract=starknet.bind_contract(self.contract),
+        )
+
     @classmethod
     async def from_test_suite_definition(
         cls,
@@ -1,6 +1,11 @@
+from typing import Optional
+
+from hypothesis.database import ExampleDatabase
+
 from protostar.testing.environments.fuzz_test_execution_environment import (
     FuzzTestExecutionEnvironment,
 )
+from protostar.testing.fuzzing.fuzz_shard import FuzzShard
 from protostar.testing.starkware.contract_based_test_execution_state import (
     ContractBasedTestExecutionState,
 )
@@ -16,8 +21,15 @@ from ..environments.contract_based_test_execution_environment import (
 
 
 class TestCaseRunnerFactory:
-    def __init__(self, state: ContractBasedTestExecutionState) -> None:
+    def __init__(
+        self,
+        state: ContractBasedTestExecutionState,
+        fuzz_shard: Optional[FuzzShard] = None,
+        fuzz_example_database: Optional[ExampleDatabase] = None,
+    ) -> None:
         self._state = state
+        self._fuzz_shard = fuzz_shard
+        self._fuzz_example_database = fuzz_example_database
 
     def make(self, test_case: TestCase) -> TestCaseRunner:
         mode = self._state.config.mode
@@ -27,7 +39,9 @@ class TestCaseRunnerFactory:
         if mode in [TestMode.FUZZ, TestMode.PARAMETERIZED]:
             return FuzzTestCaseRunner(
                 fuzz_test_execution_environment=FuzzTestExecutionEnvironment(
-                    self._state
+                    self._state,
+                    fuzz_shard=self._fuzz_shard,
+                    example_database=self._fuzz_example_database,
                 ),
                 test_case=test_case,
                 output_recorder=self._state.output_recorder,
@@ -0,0 +1,7 @@
+from protostar.self.dependency_index import DependencyIndex
+
+
+class TestCollectionIndex(DependencyIndex):
+    """
+    Persists results of collecting test suites between runs.
+    """
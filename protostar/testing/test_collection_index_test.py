@@ -0,0 +1,31 @@
+from pathlib import Path
+
+from .test_collection_index import TestCollectionIndex
+
+
+def test_collection_is_reused_until_dependencies_change(tmp_path: Path):
+    test_path = tmp_path / "test_main.cairo"
+    test_path.write_text("func test_a() {}", encoding="utf-8")
+    dependency_path = tmp_path / "utils.cairo"
+    dependency_path.write_text("func helper() {}", encoding="utf-8")
+    collect_calls: list[Path] = []
+
+    def collect(file_path: Path):
+        collect_calls.append(file_path)
+        return ["test_a"], [dependency_path]
+
+    index = TestCollectionIndex(tmp_path, namespace="test", fingerprint="compiler")
+
+    assert index.get_or_collect(test_path, collect) == ["test_a"]
+    assert index.get_or_collect(test_path, collect) == ["test_a"]
+    assert len(collect_calls) == 1
+
+    dependency_path.write_text("func other_helper() {}", encoding="utf-8")
+
+    assert index.get_or_collect(test_path, collect) == ["test_a"]
+    assert len(collect_calls) == 2
+
+    other_index = TestCollectionIndex(
+        tmp_path, namespace="test", fingerprint="other compiler"
+    )
+    assert other_index.read(test_path) is None
@@ -60,6 +60,7 @@ class SkippedTestCaseResult(TimedTestCaseResult, AcceptableResult):
 @dataclass(frozen=True)
 class FuzzResult:
     fuzz_runs_count: Optional[int]
+    fuzz_examples_per_second: Optional[float]
 
 
 @dataclass(frozen=True)
@@ -75,6 +76,7 @@ class PassedFuzzTestCaseResult(PassedTestCaseResult, FuzzResult):
             execution_resources=passed_test_case_result.execution_resources,
             execution_time=passed_test_case_result.execution_time,
             fuzz_runs_count=fuzz_result.fuzz_runs_count,
+            fuzz_examples_per_second=fuzz_result.fuzz_examples_per_second,
         )
 
 
@@ -87,6 +89,9 @@ class FailedFuzzTestCaseResult(FailedTestCaseResult, FuzzResult):
         fuzz_result: Optional[FuzzResult],
     ) -> Self:
         fuzz_runs_count = fuzz_result.fuzz_runs_count if fuzz_result else None
+        fuzz_examples_per_second = (
+            fuzz_result.fuzz_examples_per_second if fuzz_result else None
+        )
 
         return cls(
             file_path=failed_test_case_result.file_path,
@@ -95,6 +100,7 @@ class FailedFuzzTestCaseResult(FailedTestCaseResult, FuzzResult):
             exception=failed_test_case_result.exception,
             execution_time=failed_test_case_result.execution_time,
             fuzz_runs_count=fuzz_runs_count,
+            fuzz_examples_per_second=fuzz_examples_per_second,
         )
 
 
@@ -107,6 +113,9 @@ class BrokenFuzzTestCaseResult(BrokenTestCaseResult, FuzzResult):
         fuzz_result: Optional[FuzzResult],
     ) -> Self:
         fuzz_runs_count = fuzz_result.fuzz_runs_count if fuzz_result else None
+        fuzz_examples_per_second = (
+            fuzz_result.fuzz_examples_per_second if fuzz_result else None
+        )
 
         return cls(
             file_path=broken_test_case_result.file_path,
@@ -115,9 +124,23 @@ class BrokenFuzzTestCaseResult(BrokenTestCaseResult, FuzzResult):
             exception=broken_test_case_result.exception,
             execution_time=broken_test_case_result.execution_time,
             fuzz_runs_count=fuzz_runs_count,
+            fuzz_examples_per_second=fuzz_examples_per_second,
         )
 
 
+@dataclass(frozen=True)
+class FuzzShardResult(TestResult):
+    """
+    Result of a fuzz test case run by one of the workers sharing its examples.
+    Shard results are merged into a single test case result in the main process.
+    """
+
+    test_case_name: str
+    shard_index: int
+    shards_count: int
+    result: TestCaseResult
+
+
 @dataclass(frozen=True)
 class SetupCaseResult(TestResult, TimedTestResult):
     test_case_name: str
@@ -3,13 +3,14 @@ import traceback
 from dataclasses import dataclass
 from logging import getLogger
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from starkware.starknet.services.api.contract_class.contract_class import (
     DeprecatedCompiledClass,
 )
 from starkware.starkware_utils.error_handling import StarkException
 
+from protostar.cairo.bindings.cairo_bindings import PackageName
 from protostar.compiler import (
     ProjectCairoPathBuilder,
     Cairo0ProjectCompiler,
@@ -24,17 +25,22 @@ from protostar.starknet import StarknetCompiler, StarknetCompilerConfig
 from protostar.contract_path_resolver import ContractPathResolver
 
 from .environments.setup_execution_environment import SetupExecutionEnvironment
+from .fuzzing.fuzz_shard import FuzzShard
+from .fuzzing.hypothesis.example_database import FuzzExampleDatabaseFactory
 from .starkware.contract_based_test_execution_state import (
     ContractBasedTestExecutionState,
 )
 from .test_case_runners.setup_case_runner import run_setup_case
 from .test_case_runners.test_case_runner_factory import TestCaseRunnerFactory
-from .test_config import TestConfig
+from .test_config import TestConfig, TestMode
 from .test_environment_exceptions import ReportedException
 from .test_results import (
     BrokenSetupCaseResult,
+    BrokenTestCaseResult,
     BrokenTestSuiteResult,
+    FuzzShardResult,
     SkippedSetupCaseResult,
+    TestCaseResult,
     TestResult,
     UnexpectedBrokenTestSuiteResult,
 )
@@ -47,6 +53,12 @@ logger = getLogger()
 
 # pylint: disable=too-many-instance-attributes
 class TestRunner:
+    # The post-setup state of the suite run most recently by this worker process.
+    # It is reused when the worker picks up another shard of the same suite.
+    _last_suite_state: Optional[
+        Tuple[Tuple[Path, Seed], ContractBasedTestExecutionState]
+    ] = None
+
     def __init__(
         self,
         shared_tests_state: SharedTestsState,
@@ -57,10 +69,21 @@ class TestRunner:
         include_paths: Optional[List[str]] = None,
         profiling: bool = False,
         gas_estimation_enabled: bool = False,
+        fuzz_shard_index: int = 0,
+        fuzz_shards_count: int = 1,
     ):
+        """
+        @param fuzz_shard_index: workers with a different index run other examples of
+            the same fuzz test cases. Only the first shard reports results of other test cases.
+        """
         self._gas_estimation_enabled = gas_estimation_enabled
+        self._fuzz_shard_index = fuzz_shard_index
+        self._fuzz_shards_count = fuzz_shards_count
         self.shared_tests_state = shared_tests_state
         self.profiling = profiling
+        self._fuzz_example_database_factory = FuzzExampleDatabaseFactory(
+            project_root_path=project_root_path
+        )
         include_paths = include_paths or []
 
         self.tests_compiler = StarknetCompiler(
@@ -102,6 +125,11 @@ class TestRunner:
         active_profile_name: Optional[str]
         max_steps: Optional[int]
         gas_estimation_enabled: bool
+        # None means that the libraries are fetched from Scarb when a contract is declared
+        linked_libraries: Optional[List[Tuple[Path, PackageName]]] = None
+        declared_classes_snapshot_key: Optional[str] = None
+        fuzz_shard_index: int = 0
+        fuzz_shards_count: int = 1
 
     @classmethod
     def worker(cls, args: "TestRunner.WorkerArgs"):
@@ -115,6 +143,8 @@ class TestRunner:
                 cwd=args.cwd,
                 active_profile_name=args.active_profile_name,
                 gas_estimation_enabled=args.gas_estimation_enabled,
+                fuzz_shard_index=args.fuzz_shard_index,
+                fuzz_shards_count=args.fuzz_shards_count,
             ).run_test_suite(
                 test_suite=args.test_suite,
                 testing_seed=args.testing_seed,
@@ -135,26 +165,35 @@ class TestRunner:
             gas_estimation_enabled=self._gas_estimation_enabled,
         )
 
+        suite_state_key = (test_suite.test_path, testing_seed)
         try:
-            compiled_test = self.tests_compiler.compile_contract(
-                test_suite.test_path,
-                add_debug_info=True,
-            )
-
-            execution_state = await self._build_execution_state(
-                test_contract=compiled_test,
-                test_suite=test_suite,
-                test_config=test_config,
-                contract_path=test_suite.test_path,
+            execution_state = (
+                TestRunner._last_suite_state[1]
+                if TestRunner._last_suite_state
+                and TestRunner._last_suite_state[0] == suite_state_key
+                else None
             )
             if not execution_state:
-                return
+                compiled_test = self.tests_compiler.compile_contract(
+                    test_suite.test_path,
+                    add_debug_info=True,
+                )
+
+                execution_state = await self._build_execution_state(
+                    test_contract=compiled_test,
+                    test_suite=test_suite,
+                    test_config=test_config,
+                    contract_path=test_suite.test_path,
+                )
+                if not execution_state:
+                    return
+                TestRunner._last_suite_state = (suite_state_key, execution_state)
             await self._invoke_test_cases(
                 test_suite=test_suite,
                 execution_state=execution_state,
             )
         except ProtostarException as ex:
-            self.shared_tests_state.put_result(
+            self._put_result(
                 BrokenTestSuiteResult(
                     file_path=test_suite.test_path,
                     test_case_names=test_suite.collect_test_case_names(),
@@ -163,7 +202,7 @@ class TestRunner:
             )
 
         except ReportedException as ex:
-            self.shared_tests_state.put_result(
+            self._put_result(
                 BrokenTestSuiteResult(
                     file_path=test_suite.test_path,
                     test_case_names=test_suite.collect_test_case_names(),
@@ -173,7 +212,7 @@ class TestRunner:
 
         # An unexpected exception in a worker should neither crash nor freeze the whole application
         except BaseException as ex:  # pylint: disable=broad-except
-            self.shared_tests_state.put_result(
+            self._put_result(
                 UnexpectedBrokenTestSuiteResult(
                     file_path=test_suite.test_path,
                     test_case_names=test_suite.collect_test_case_names(),
@@ -207,7 +246,7 @@ class TestRunner:
 
             return execution_state
         except StarkException as ex:
-            self.shared_tests_state.put_result(
+            self._put_result(
                 BrokenTestSuiteResult(
                     file_path=test_suite.test_path,
                     test_case_names=test_suite.collect_test_case_names(),
@@ -224,11 +263,50 @@ class TestRunner:
     ) -> None:
         for test_case in test_suite.test_cases:
             test_result = await self._invoke_test_case(test_case, execution_state)
-            self.shared_tests_state.put_result(test_result)
+            if test_result:
+                self._put_result(test_result)
+
+    def _put_result(self, result: TestResult) -> None:
+        if self._fuzz_shard_index == 0 or isinstance(result, FuzzShardResult):
+            self.shared_tests_state.put_result(result)
+            return
+        # Other shards run only fuzz test cases, and the main process waits for results of all shards
+        # before merging them, so a broken suite or setup is reported as a result of this shard
+        for test_case_result in self._into_test_case_results(result):
+            self.shared_tests_state.put_result(
+                FuzzShardResult(
+                    file_path=test_case_result.file_path,
+                    test_case_name=test_case_result.test_case_name,
+                    shard_index=self._fuzz_shard_index,
+                    shards_count=self._fuzz_shards_count,
+                    result=test_case_result,
+                )
+            )
+
+    @staticmethod
+    def _into_test_case_results(result: TestResult) -> List[TestCaseResult]:
+        if isinstance(result, TestCaseResult):
+            return [result]
+        assert isinstance(result, BrokenTestSuiteResult)
+        exception = (
+            result.exception
+            if isinstance(result.exception, ReportedException)
+            else ReportedException(str(result.exception))
+        )
+        return [
+            BrokenTestCaseResult(
+                file_path=result.file_path,
+                test_case_name=test_case_name,
+                captured_stdout={},
+                execution_time=0.0,
+                exception=exception,
+            )
+            for test_case_name in result.test_case_names
+        ]
 
     async def _invoke_test_case(
         self, test_case: TestCase, initial_state: ContractBasedTestExecutionState
-    ) -> TestResult:
+    ) -> Optional[TestResult]:
         state: ContractBasedTestExecutionState = initial_state.fork()
 
         if test_case.setup_fn_name:
@@ -240,6 +318,43 @@ class TestRunner:
 
         state.determine_test_mode(test_case)
 
-        test_case_runner_factory = TestCaseRunnerFactory(state)
+        fuzz_shard = self._create_fuzz_shard(test_case, state.config.mode)
+        if not fuzz_shard and self._fuzz_shard_index > 0:
+            return None
+
+        test_case_runner_factory = TestCaseRunnerFactory(
+            state,
+            fuzz_shard=fuzz_shard,
+            fuzz_example_database=self._fuzz_example_database_factory.create(
+                test_case.test_path, test_case.test_fn_name
+            )
+            if state.config.mode is TestMode.FUZZ
+            else None,
+        )
         test_case_runner = test_case_runner_factory.make(test_case)
-        return await test_case_runner.run()
+        test_result = await test_case_runner.run()
+        if fuzz_shard:
+            return FuzzShardResult(
+                file_path=test_case.test_path,
+                test_case_name=test_case.test_fn_name,
+                shard_index=fuzz_shard.index,
+                shards_count=fuzz_shard.count,
+                result=test_result,
+            )
+        return test_result
+
+    def _create_fuzz_shard(
+        self, test_case: TestCase, mode: TestMode
+    ) -> Optional[FuzzShard]:
+        if self._fuzz_shards_count <= 1 or mode is not TestMode.FUZZ:
+            return None
+        return FuzzShard(
+            index=self._fuzz_shard_index,
+            count=self._fuzz_shards_count,
+            is_stopped=lambda: self.shared_tests_state.is_fuzz_test_stopped(
+                test_case.test_path, test_case.test_fn_name
+            ),
+            stop=lambda: self.shared_tests_state.stop_fuzz_test(
+                test_case.test_path, test_case.test_fn_name
+            ),
+        )
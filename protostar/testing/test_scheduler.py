@@ -1,21 +1,39 @@
+import copy
 import multiprocessing
 import signal
 import dataclasses
+from functools import partial
 from pathlib import Path
-from typing import TYPE_CHECKING, Callable, Optional
+from statistics import mean
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
+
+from protostar.cairo.bindings.cairo_bindings import PackageName
 
 from .test_results import TestResult
 from .test_collector import TestCollector
 from .test_runner import TestRunner
 from .test_shared_tests_state import SharedTestsState
+from .test_suite import TestCase, TestSuite
 from .testing_seed import Seed
 
+TestDurations = Dict[str, Dict[str, float]]
+"""Test suite path (resolved) -> test case name -> duration in seconds"""
+
 if TYPE_CHECKING:
     from protostar.commands.legacy_commands.test_cairo0.testing_live_logger import (
         TestingLiveLogger,
     )
 
 
+@dataclasses.dataclass
+class PrewarmArgs:
+    project_root_path: Path
+    cwd: Path
+    active_profile_name: Optional[str]
+    linked_libraries: Optional[list[Tuple[Path, PackageName]]]
+    test_paths: list[Path]
+
+
 def make_path_relative_if_possible(test_result: TestResult, path: Path) -> TestResult:
     try:
         test_result = dataclasses.replace(
@@ -28,6 +46,53 @@ def make_path_relative_if_possible(test_result: TestResult, path: Path) -> TestR
     return test_result
 
 
+def order_by_expected_duration(
+    setups: list[TestRunner.WorkerArgs], test_durations: TestDurations
+) -> list[TestRunner.WorkerArgs]:
+    """
+    Orders tasks from the longest to the shortest, based on durations from previous runs,
+    so that the slowest suites don't start at the end of the run.
+    """
+    known_durations = [
+        duration
+        for suite_durations in test_durations.values()
+        for duration in suite_durations.values()
+    ]
+    default_duration = mean(known_durations) if known_durations else 1.0
+
+    def expected_duration(setup: TestRunner.WorkerArgs) -> float:
+        suite_durations = test_durations.get(
+            str(setup.test_suite.test_path.resolve()), {}
+        )
+        return sum(
+            suite_durations.get(test_case.test_fn_name, default_duration)
+            for test_case in setup.test_suite.test_cases
+        )
+
+    return sorted(setups, key=expected_duration, reverse=True)
+
+
+def split_into_fuzz_shards(
+    test_suite: TestSuite,
+    fuzz_shards_count: int,
+    is_parameterized: Optional[Callable[[TestCase], bool]] = None,
+) -> list[TestSuite]:
+    """
+    Only suites with test cases taking parameters, which are fuzzed, are run by several workers.
+    The first shard runs the whole suite, other shards run only the test cases taking parameters.
+    """
+    parameterized_test_cases = [
+        test_case
+        for test_case in test_suite.test_cases
+        if is_parameterized is None or is_parameterized(test_case)
+    ]
+    if fuzz_shards_count <= 1 or not parameterized_test_cases:
+        return [test_suite]
+    fuzzed_test_suite = copy.copy(test_suite)
+    fuzzed_test_suite.test_cases = parameterized_test_cases
+    return [test_suite] + [fuzzed_test_suite] * (fuzz_shards_count - 1)
+
+
 class TestScheduler:
     def __init__(
         self,
@@ -36,9 +101,15 @@ class TestScheduler:
             [TestRunner.WorkerArgs],
             None,
         ],
+        prewarm: Optional[Callable[[PrewarmArgs], Optional[str]]] = None,
     ):
+        """
+        @param prewarm: runs once in the main process before the workers start,
+            returns a key of the declared classes snapshot that workers load at startup
+        """
         self._live_logger = live_logger
         self._worker = worker
+        self._prewarm = prewarm
 
     def run(
         self,
@@ -54,53 +125,107 @@ class TestScheduler:
         active_profile_name: Optional[str],
         gas_estimation_enabled: bool,
         on_exit_first: Callable[[], None],
+        linked_libraries: Optional[list[Tuple[Path, PackageName]]] = None,
+        shard_size: Optional[int] = None,
+        test_durations: Optional[TestDurations] = None,
+        fuzz_shards_count: Optional[int] = None,
+        is_parameterized: Optional[Callable[[TestCase], bool]] = None,
     ):
-        with multiprocessing.Manager() as manager:
-            shared_tests_state = SharedTestsState(
-                test_collector_result=test_collector_result, manager=manager
-            )
-            setups: list[TestRunner.WorkerArgs] = [
-                TestRunner.WorkerArgs(
-                    test_suite,
-                    shared_tests_state=shared_tests_state,
-                    include_paths=include_paths,
-                    disable_hint_validation_in_user_contracts=disable_hint_validation,
-                    profiling=profiling,
-                    testing_seed=testing_seed,
-                    max_steps=max_steps,
+        """
+        @param shard_size: suites with more test cases are split into shards of this size,
+            so idle workers can pick up the remaining test cases of a long suite
+        @param fuzz_shards_count: examples of each fuzz test case are split between this many workers
+        @param is_parameterized: tells test cases taking parameters, only these can be fuzz test cases
+        @param test_durations: durations from previous runs, used to start the slowest tasks first
+        """
+        declared_classes_snapshot_key = (
+            self._prewarm(
+                PrewarmArgs(
                     project_root_path=project_root_path,
-                    active_profile_name=active_profile_name,
                     cwd=cwd,
-                    gas_estimation_enabled=gas_estimation_enabled,
+                    active_profile_name=active_profile_name,
+                    linked_libraries=linked_libraries,
+                    test_paths=[
+                        test_suite.test_path
+                        for test_suite in test_collector_result.test_suites
+                    ],
                 )
-                for test_suite in test_collector_result.test_suites
-            ]
-
-            # A test case was broken
-            if exit_first and shared_tests_state.any_failed_or_broken():
-                on_exit_first()
-                return
-
-            try:
-                with multiprocessing.Pool(
-                    processes=multiprocessing.cpu_count(),
-                    initializer=_init_worker,
-                ) as pool:
-                    results = pool.map_async(self._worker, setups)
-                    self._live_logger.log(
-                        shared_tests_state,
-                        test_collector_result,
+            )
+            if self._prewarm
+            else None
+        )
+
+        shared_tests_state = SharedTestsState(
+            test_collector_result=test_collector_result
+        )
+        setups: list[TestRunner.WorkerArgs] = []
+        for test_suite in test_collector_result.test_suites:
+            for shard in test_suite.split(shard_size) if shard_size else [test_suite]:
+                fuzz_shards = split_into_fuzz_shards(
+                    shard, fuzz_shards_count or 1, is_parameterized
+                )
+                setups.extend(
+                    TestRunner.WorkerArgs(
+                        fuzz_shard,
+                        shared_tests_state=shared_tests_state,
+                        include_paths=include_paths,
+                        disable_hint_validation_in_user_contracts=disable_hint_validation,
+                        profiling=profiling,
+                        testing_seed=testing_seed,
+                        max_steps=max_steps,
+                        project_root_path=project_root_path,
+                        active_profile_name=active_profile_name,
+                        cwd=cwd,
+                        gas_estimation_enabled=gas_estimation_enabled,
+                        linked_libraries=linked_libraries,
+                        declared_classes_snapshot_key=declared_classes_snapshot_key,
+                        fuzz_shard_index=fuzz_shard_index,
+                        fuzz_shards_count=len(fuzz_shards),
                     )
-                    if exit_first and shared_tests_state.any_failed_or_broken():
-                        pool.terminate()
-                        return
+                    for fuzz_shard_index, fuzz_shard in enumerate(fuzz_shards)
+                )
+        if test_durations is not None:
+            setups = order_by_expected_duration(setups, test_durations)
 
-                    results.get()
-            except KeyboardInterrupt:
-                return
+        # A test case was broken
+        if exit_first and shared_tests_state.any_failed_or_broken():
+            on_exit_first()
+            return
+
+        try:
+            with multiprocessing.Pool(
+                processes=multiprocessing.cpu_count(),
+                initializer=_init_worker,
+                initargs=shared_tests_state.worker_initializer_args,
+            ) as pool:
+                # Each idle worker takes the next task from the queue
+                results = pool.map_async(
+                    partial(_run_worker, self._worker), setups, chunksize=1
+                )
+                self._live_logger.log(
+                    shared_tests_state,
+                    test_collector_result,
+                )
+                if exit_first and shared_tests_state.any_failed_or_broken():
+                    pool.terminate()
+                    return
+
+                results.get()
+        except KeyboardInterrupt:
+            return
 
 
 # Note: This function has to be top-level function, because it is being pickled by multiprocessing.
-def _init_worker():
+def _init_worker(*shared_tests_state_args: Any):
     # Prevent showing a stacktrace on CMD/CTRL+C.
     signal.signal(signal.SIGINT, signal.SIG_IGN)
+    SharedTestsState.init_worker(*shared_tests_state_args)
+
+
+def _run_worker(
+    worker: Callable[["TestRunner.WorkerArgs"], None], args: "TestRunner.WorkerArgs"
+):
+    try:
+        worker(args)
+    finally:
+        args.shared_tests_state.flush()
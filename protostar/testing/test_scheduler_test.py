@@ -0,0 +1,63 @@
+from pathlib import Path
+from typing import cast
+
+from .test_runner import TestRunner
+from .test_scheduler import order_by_expected_duration, split_into_fuzz_shards
+from .test_shared_tests_state import SharedTestsState
+from .test_suite import TestCase, TestSuite
+
+
+def make_worker_args(test_path: Path, test_case_names: list[str]):
+    return TestRunner.WorkerArgs(
+        test_suite=TestSuite(
+            test_path=test_path,
+            test_cases=[
+                TestCase(test_path=test_path, test_fn_name=test_case_name)
+                for test_case_name in test_case_names
+            ],
+        ),
+        shared_tests_state=cast(SharedTestsState, None),
+        include_paths=[],
+        disable_hint_validation_in_user_contracts=False,
+        profiling=False,
+        testing_seed=0,
+        project_root_path=test_path.parent,
+        cwd=test_path.parent,
+        active_profile_name=None,
+        max_steps=None,
+        gas_estimation_enabled=False,
+    )
+
+
+def test_order_by_expected_duration(tmp_path: Path):
+    fast_suite = make_worker_args(tmp_path / "fast_test.cairo", ["test_a", "test_b"])
+    slow_suite = make_worker_args(tmp_path / "slow_test.cairo", ["test_a"])
+    new_suite = make_worker_args(tmp_path / "new_test.cairo", ["test_a", "test_b"])
+
+    ordered = order_by_expected_duration(
+        [fast_suite, slow_suite, new_suite],
+        test_durations={
+            str(tmp_path / "fast_test.cairo"): {"test_a": 1.0, "test_b": 1.0},
+            str(tmp_path / "slow_test.cairo"): {"test_a": 10.0},
+        },
+    )
+
+    # new suite has no history, so its test cases take the mean duration of known test cases
+    assert ordered == [slow_suite, new_suite, fast_suite]
+
+
+def test_only_parameterized_test_cases_are_split_into_fuzz_shards(tmp_path: Path):
+    test_path = tmp_path / "main_test.cairo"
+    test_suite = make_worker_args(test_path, ["test_a", "test_fuzz"]).test_suite
+
+    fuzz_shards = split_into_fuzz_shards(
+        test_suite, 3, lambda test_case: test_case.test_fn_name == "test_fuzz"
+    )
+
+    assert [shard.collect_test_case_names() for shard in fuzz_shards] == [
+        ["test_a", "test_fuzz"],
+        ["test_fuzz"],
+        ["test_fuzz"],
+    ]
+    assert split_into_fuzz_shards(test_suite, 3, lambda _: False) == [test_suite]
+    assert split_into_fuzz_shards(test_suite, 1) == [test_suite]
@@ -1,29 +1,176 @@
 import ctypes
-from multiprocessing.managers import SyncManager
+import multiprocessing
+import pickle
+import queue
+import threading
+from collections import deque
+from multiprocessing.connection import Connection
+from pathlib import Path
+from typing import Any, Optional
 
+from .fuzzing.fuzz_shard import merge_fuzz_shard_results
 from .test_collector import TestCollector
-from .test_results import AcceptableResult, TestResult
+from .test_results import AcceptableResult, FuzzShardResult, TestResult
+
+# Pipe end, write lock, failure flag and fuzz test stop flags inherited by a worker process,
+# see `SharedTestsState.init_worker`
+_inherited_channel: Optional[tuple[Connection, Any, Any, Any, dict]] = None
+
+FuzzTestKey = tuple[str, str]
 
 
 class SharedTestsState:
+    """
+    Carries test results from worker processes to the main process through a pipe.
+    Workers send results in batches, so a batch is pickled and written at once.
+    A batch is sent once it has `MAX_BATCH_SIZE` results, or by a timer `MAX_BATCH_DELAY_S`
+    after its first result, even if the worker is busy running a long test case.
+    Failures are sent right away, so `exit_first` reacts to them without a delay.
+    Results of fuzz test shards are merged, once all shards of a test case are received.
+    """
+
+    MAX_BATCH_SIZE = 64
+    MAX_BATCH_DELAY_S = 0.1
+
     def __init__(
         self,
         test_collector_result: "TestCollector.Result",
-        manager: SyncManager,
     ) -> None:
-        self._shared_queue = manager.Queue()
-        self._any_failed_or_broken_shared_value = manager.Value(
+        self._results_reader, self._results_writer = multiprocessing.Pipe(duplex=False)
+        self._write_lock = multiprocessing.Lock()
+        self._any_failed_or_broken_flag = multiprocessing.RawValue(
             ctypes.c_bool,
             (len(test_collector_result.broken_test_suites) > 0),
         )
+        self._fuzz_test_slots: dict[FuzzTestKey, int] = {
+            (str(test_case.test_path), test_case.test_fn_name): slot
+            for slot, test_case in enumerate(
+                test_case
+                for test_suite in test_collector_result.test_suites
+                for test_case in test_suite.test_cases
+            )
+        }
+        self._fuzz_test_stop_flags = multiprocessing.RawArray(
+            ctypes.c_bool, max(1, len(self._fuzz_test_slots))
+        )
+        self._received_results: deque[TestResult] = deque()
+        self._received_fuzz_shard_results: dict[FuzzTestKey, list[FuzzShardResult]] = {}
+        self._batch: list[TestResult] = []
+        self._batch_lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
+
+    @property
+    def worker_initializer_args(self) -> tuple:
+        return (
+            self._results_writer,
+            self._write_lock,
+            self._any_failed_or_broken_flag,
+            self._fuzz_test_stop_flags,
+            self._fuzz_test_slots,
+        )
+
+    @staticmethod
+    def init_worker(
+        results_writer: Connection,
+        write_lock: Any,
+        any_failed_or_broken_flag: Any,
+        fuzz_test_stop_flags: Any,
+        fuzz_test_slots: dict,
+    ) -> None:
+        """
+        Pipes, locks and shared memory can only be inherited, so they are passed to a worker
+        when it starts. Instances unpickled in the worker afterwards use them.
+        """
+        global _inherited_channel  # pylint: disable=global-statement
+        _inherited_channel = (
+            results_writer,
+            write_lock,
+            any_failed_or_broken_flag,
+            fuzz_test_stop_flags,
+            fuzz_test_slots,
+        )
+
+    def __getstate__(self):
+        # A falsy state would skip `__setstate__`
+        return {"inherited": True}
+
+    def __setstate__(self, _state: dict):
+        assert _inherited_channel, "SharedTestsState.init_worker was not called"
+        (
+            self._results_writer,
+            self._write_lock,
+            self._any_failed_or_broken_flag,
+            self._fuzz_test_stop_flags,
+            self._fuzz_test_slots,
+        ) = _inherited_channel
+        self._received_results = deque()
+        self._received_fuzz_shard_results = {}
+        self._batch = []
+        self._batch_lock = threading.Lock()
+        self._flush_timer = None
 
     def get_result(self) -> TestResult:
-        return self._shared_queue.get(block=True, timeout=20000)
+        while True:
+            while not self._received_results:
+                if not self._results_reader.poll(timeout=20000):
+                    raise queue.Empty()
+                self._received_results.extend(
+                    pickle.loads(self._results_reader.recv_bytes())
+                )
+            result = self._received_results.popleft()
+            if not isinstance(result, FuzzShardResult):
+                return result
+            key = (str(result.file_path), result.test_case_name)
+            shard_results = self._received_fuzz_shard_results.setdefault(key, [])
+            shard_results.append(result)
+            if len(shard_results) == result.shards_count:
+                del self._received_fuzz_shard_results[key]
+                return merge_fuzz_shard_results(shard_results)
 
     def put_result(self, item: TestResult) -> None:
-        if not isinstance(item, AcceptableResult):
-            self._any_failed_or_broken_shared_value.value = True
-        self._shared_queue.put(item)
+        result = item.result if isinstance(item, FuzzShardResult) else item
+        is_failed_or_broken = not isinstance(result, AcceptableResult)
+        if is_failed_or_broken:
+            self._any_failed_or_broken_flag.value = True
+        with self._batch_lock:
+            self._batch.append(item)
+            if not is_failed_or_broken and len(self._batch) < self.MAX_BATCH_SIZE:
+                self._start_flush_timer()
+                return
+        self.flush()
+
+    def flush(self) -> None:
+        # The batch is sent under the lock, so batches sent by the timer keep their order
+        with self._batch_lock:
+            if self._flush_timer:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._batch:
+                return
+            data = pickle.dumps(self._batch, protocol=pickle.HIGHEST_PROTOCOL)
+            self._batch = []
+            with self._write_lock:
+                self._results_writer.send_bytes(data)
+
+    def _start_flush_timer(self) -> None:
+        if self._flush_timer:
+            return
+        self._flush_timer = threading.Timer(self.MAX_BATCH_DELAY_S, self.flush)
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
 
     def any_failed_or_broken(self) -> bool:
-        return self._any_failed_or_broken_shared_value.value
+        return self._any_failed_or_broken_flag.value
+
+    def stop_fuzz_test(self, test_path: Path, test_case_name: str) -> None:
+        self._fuzz_test_stop_flags[
+            self._get_fuzz_test_slot(test_path, test_case_name)
+        ] = True
+
+    def is_fuzz_test_stopped(self, test_path: Path, test_case_name: str) -> bool:
+        return self._fuzz_test_stop_flags[
+            self._get_fuzz_test_slot(test_path, test_case_name)
+        ]
+
+    def _get_fuzz_test_slot(self, test_path: Path, test_case_name: str) -> int:
+        return self._fuzz_test_slots[(str(test_path), test_case_name)]
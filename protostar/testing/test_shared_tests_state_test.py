@@ -0,0 +1,77 @@
+import multiprocessing
+import time
+from pathlib import Path
+
+from .test_collector import TestCollector
+from .test_results import PassedTestCaseResult, TestResult
+from .test_shared_tests_state import SharedTestsState
+
+
+def _put_results(shared_tests_state: SharedTestsState):
+    for index in range(3):
+        shared_tests_state.put_result(
+            PassedTestCaseResult(
+                file_path=Path("test_main.cairo"),
+                test_case_name=f"test_{index}",
+                captured_stdout={},
+                execution_time=0.0,
+                execution_resources=None,
+            )
+        )
+    shared_tests_state.put_result(TestResult(file_path=Path("test_main.cairo")))
+    shared_tests_state.flush()
+
+
+def test_results_are_passed_from_workers_in_batches():
+    shared_tests_state = SharedTestsState(
+        test_collector_result=TestCollector.Result(test_suites=[])
+    )
+
+    with multiprocessing.Pool(
+        processes=1,
+        initializer=SharedTestsState.init_worker,
+        initargs=shared_tests_state.worker_initializer_args,
+    ) as pool:
+        pool.apply(_put_results, (shared_tests_state,))
+
+    results = [shared_tests_state.get_result() for _ in range(4)]
+
+    assert [getattr(result, "test_case_name", None) for result in results] == [
+        "test_0",
+        "test_1",
+        "test_2",
+        None,
+    ]
+    assert shared_tests_state.any_failed_or_broken()
+
+
+def _put_result_and_run_long_test_case(shared_tests_state: SharedTestsState):
+    shared_tests_state.put_result(
+        PassedTestCaseResult(
+            file_path=Path("test_main.cairo"),
+            test_case_name="test_fast",
+            captured_stdout={},
+            execution_time=0.0,
+            execution_resources=None,
+        )
+    )
+    time.sleep(5)
+
+
+def test_batch_is_sent_while_worker_runs_long_test_case():
+    shared_tests_state = SharedTestsState(
+        test_collector_result=TestCollector.Result(test_suites=[])
+    )
+
+    with multiprocessing.Pool(
+        processes=1,
+        initializer=SharedTestsState.init_worker,
+        initargs=shared_tests_state.worker_initializer_args,
+    ) as pool:
+        pool.apply_async(_put_result_and_run_long_test_case, (shared_tests_state,))
+        # pylint: disable=protected-access
+        assert shared_tests_state._results_reader.poll(timeout=2)
+        result = shared_tests_state.get_result()
+        pool.terminate()
+
+    assert getattr(result, "test_case_name") == "test_fast"
@@ -1,3 +1,4 @@
+import copy
 from pathlib import Path
 from typing import List, Optional, Union
 from typing_extensions import Self
@@ -59,6 +60,19 @@ class TestSuite:
     def collect_test_case_names(self) -> List[str]:
         return [tc.test_fn_name for tc in self.test_cases]
 
+    def split(self, max_test_cases_count: int) -> List[Self]:
+        """
+        Splits the suite into shards, that can be run independently by different workers.
+        """
+        if len(self.test_cases) <= max_test_cases_count:
+            return [self]
+        shards: List[Self] = []
+        for start in range(0, len(self.test_cases), max_test_cases_count):
+            shard = copy.copy(self)
+            shard.test_cases = self.test_cases[start : start + max_test_cases_count]
+            shards.append(shard)
+        return shards
+
 
 class Cairo1TestSuite(TestSuite):
     def __init__(
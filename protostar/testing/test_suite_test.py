@@ -0,0 +1,40 @@
+from pathlib import Path
+
+from .test_suite import Cairo1TestSuite, TestCase, TestSuite
+
+
+def make_test_cases(count: int) -> list[TestCase]:
+    return [
+        TestCase(test_path=Path("test_foo.cairo"), test_fn_name=f"test_{index}")
+        for index in range(count)
+    ]
+
+
+def test_split_returns_suite_when_it_is_small_enough():
+    test_suite = TestSuite(
+        test_path=Path("test_foo.cairo"), test_cases=make_test_cases(3)
+    )
+
+    assert test_suite.split(3) == [test_suite]
+
+
+def test_split_preserves_suite_data_in_shards():
+    test_suite = Cairo1TestSuite(
+        test_path=Path("test_foo.cairo"),
+        test_cases=make_test_cases(5),
+        sierra_output="sierra",
+        setup_fn_name="__setup__",
+    )
+
+    shards = test_suite.split(2)
+
+    assert [shard.collect_test_case_names() for shard in shards] == [
+        ["test_0", "test_1"],
+        ["test_2", "test_3"],
+        ["test_4"],
+    ]
+    for shard in shards:
+        assert isinstance(shard, Cairo1TestSuite)
+        assert shard.sierra_output == "sierra"
+        assert shard.setup_fn_name == "__setup__"
+    assert test_suite.collect_test_case_names() == [f"test_{i}" for i in range(5)]
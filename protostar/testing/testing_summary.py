@@ -1,3 +1,4 @@
+import dataclasses
 from collections import defaultdict
 from pathlib import Path
 from typing import Dict, List
@@ -55,10 +56,28 @@ class TestingSummary:
             if isinstance(case_result, BrokenTestCaseResult):
                 self.broken.append(case_result)
             if isinstance(case_result, BrokenTestSuiteResult):
-                self.broken_suites.append(case_result)
+                self._add_broken_suite(case_result)
             if isinstance(case_result, SkippedTestCaseResult):
                 self.explicitly_skipped.append(case_result)
 
+    def _add_broken_suite(self, broken_suite_result: BrokenTestSuiteResult):
+        # Each shard of a suite reports its own result, but the suite is counted once
+        for index, broken_suite in enumerate(self.broken_suites):
+            if broken_suite.file_path == broken_suite_result.file_path:
+                self.broken_suites[index] = dataclasses.replace(
+                    broken_suite,
+                    test_case_names=[
+                        *broken_suite.test_case_names,
+                        *(
+                            test_case_name
+                            for test_case_name in broken_suite_result.test_case_names
+                            if test_case_name not in broken_suite.test_case_names
+                        ),
+                    ],
+                )
+                return
+        self.broken_suites.append(broken_suite_result)
+
     def get_skipped_test_cases_count(self) -> int:
         return _calculate_skipped(
             broken_count=len(self.broken),
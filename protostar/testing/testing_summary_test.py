@@ -0,0 +1,37 @@
+from pathlib import Path
+
+from .test_collector import TestCollector
+from .test_results import BrokenTestSuiteResult
+from .test_suite import TestCase, TestSuite
+from .testing_summary import TestingSummary
+
+
+def test_broken_shards_of_suite_are_counted_once(tmp_path: Path):
+    test_path = tmp_path / "test_main.cairo"
+    test_suite = TestSuite(
+        test_path=test_path,
+        test_cases=[
+            TestCase(test_path=test_path, test_fn_name=test_case_name)
+            for test_case_name in ["test_a", "test_b", "test_c"]
+        ],
+    )
+    exception = Exception("Setup failed")
+
+    summary = TestingSummary(
+        initial_test_results=[
+            BrokenTestSuiteResult(
+                file_path=test_path,
+                test_case_names=["test_a", "test_b"],
+                exception=exception,
+            ),
+            BrokenTestSuiteResult(
+                file_path=test_path, test_case_names=["test_c"], exception=exception
+            ),
+        ],
+        testing_seed=0,
+        test_collector_result=TestCollector.Result(test_suites=[test_suite]),
+    )
+
+    [broken_suite] = summary.broken_suites
+    assert broken_suite.test_case_names == ["test_a", "test_b", "test_c"]
+    assert summary.get_skipped_test_suites_count() == 0
@@ -14,6 +14,7 @@ from protostar.commands import (
     BuildCommand,
     CalculateAccountAddressCommand,
     CallCommand,
+    BatchCallCommand,
     DeclareCommand,
     FormatCommand,
     InitCommand,
@@ -64,6 +65,7 @@ class ProtostarFixture:
         test_cairo0_command: TestCairo0Command,
         invoke_command: InvokeCommand,
         call_command: CallCommand,
+        batch_call_command: BatchCallCommand,
         deploy_account_command: DeployAccountCommand,
         calculate_account_address_command: CalculateAccountAddressCommand,
         multicall_command: MulticallCommand,
@@ -87,6 +89,7 @@ class ProtostarFixture:
         self._calculate_account_address_command = calculate_account_address_command
         self._transaction_registry = transaction_registry
         self._call_command = call_command
+        self._batch_call_command = batch_call_command
         self._deploy_account_command = deploy_account_command
         self._multicall_command = multicall_command
         self._cli_app = cli_app
@@ -390,6 +393,26 @@ class ProtostarFixture:
 
         return result
 
+    async def batch_call(
+        self,
+        file_path: Path,
+        gateway_url: str,
+        max_concurrency: Optional[int] = None,
+    ):
+        named_args: dict[str, Any] = {
+            "gateway-url": gateway_url,
+            "chain-id": StarknetChainId.TESTNET.value,
+        }
+        if max_concurrency is not None:
+            named_args["max-concurrency"] = max_concurrency
+        return await self._batch_call_command.run(
+            self._parse(
+                command_name="batch-call",
+                positional_args=[file_path],
+                named_args=named_args,
+            )
+        )
+
     async def run_cairo0_test_runner_cairo0(
         self,
         target: Union[str, Path],
@@ -13,6 +13,7 @@ from protostar.commands import (
     BuildCairo0Command,
     CalculateAccountAddressCommand,
     CallCommand,
+    BatchCallCommand,
     DeclareCommand,
     FormatCommand,
     InitCommand,
@@ -44,6 +45,7 @@ from protostar.self.protostar_compatibility_with_project_checker import (
     parse_protostar_version,
 )
 from protostar.self.protostar_directory import ProtostarDirectory
+from protostar.starknet_gateway import GatewayClientFactory
 from .protostar_fixture import ProtostarFixture
 from .transaction_registry import TransactionRegistry
 from .spying_gateway_facade_factory import SpyingGatewayFacadeFactory
@@ -138,9 +140,11 @@ def create_protostar_fixture(
         project_root_path=project_root_path,
         transaction_registry=transaction_registry,
     )
+    gateway_client_factory = GatewayClientFactory()
 
     deploy_account_command = DeployAccountCommand(
         gateway_facade_factory=gateway_facade_factory,
+        gateway_client_factory=gateway_client_factory,
         messenger_factory=messenger_factory,
     )
 
@@ -150,16 +154,19 @@ def create_protostar_fixture(
     )
     declare_cairo0_command = DeclareCairo0Command(
         gateway_facade_factory=gateway_facade_factory,
+        gateway_client_factory=gateway_client_factory,
         messenger_factory=messenger_factory,
     )
     declare_command = DeclareCommand(
         contract_path_resolver=contract_path_resolver,
         gateway_facade_factory=gateway_facade_factory,
+        gateway_client_factory=gateway_client_factory,
         messenger_factory=messenger_factory,
     )
 
     deploy_command = DeployCommand(
         gateway_facade_factory=gateway_facade_factory,
+        gateway_client_factory=gateway_client_factory,
         messenger_factory=messenger_factory,
     )
 
@@ -183,12 +190,21 @@ def create_protostar_fixture(
     )
 
     invoke_command = InvokeCommand(
+        project_root_path=project_root_path,
         gateway_facade_factory=gateway_facade_factory,
+        gateway_client_factory=gateway_client_factory,
         messenger_factory=messenger_factory,
     )
     call_command = CallCommand(
         project_root_path=project_root_path,
         gateway_facade_factory=gateway_facade_factory,
+        gateway_client_factory=gateway_client_factory,
+        messenger_factory=messenger_factory,
+    )
+    batch_call_command = BatchCallCommand(
+        project_root_path=project_root_path,
+        gateway_facade_factory=gateway_facade_factory,
+        gateway_client_factory=gateway_client_factory,
         messenger_factory=messenger_factory,
     )
     calculate_account_address_command = CalculateAccountAddressCommand(
@@ -196,6 +212,7 @@ def create_protostar_fixture(
     )
     multicall_command = MulticallCommand(
         gateway_facade_factory=gateway_facade_factory,
+        gateway_client_factory=gateway_client_factory,
         messenger_factory=messenger_factory,
     )
 
@@ -204,6 +221,7 @@ def create_protostar_fixture(
             deploy_account_command,
             calculate_account_address_command,
             multicall_command,
+            batch_call_command,
         ]
     )
     parser = ArgumentParserFacade(
@@ -215,6 +233,7 @@ def create_protostar_fixture(
         init_command=init_command,
         init_cairo0_command=init_cairo0_command,
         call_command=call_command,
+        batch_call_command=batch_call_command,
         build_command=build_command,
         build_cairo0_command=build_cairo0_command,
         format_command=format_command,
@@ -348,3 +348,67 @@ async def test_calling_through_proxy(
 
     assert call_result.call_output.human_data is not None
     assert call_result.call_output.human_data["res"] == 6
+
+
+async def test_batch_call(
+    protostar_project: ProtostarProjectFixture,
+    devnet_gateway_url: str,
+    devnet_account: DevnetAccount,
+    set_private_key_env_var: SetPrivateKeyEnvVarFixture,
+):
+    with set_private_key_env_var(devnet_account.private_key):
+        deploy_response = await deploy_main_contract(
+            protostar_project.protostar, devnet_gateway_url, devnet_account
+        )
+    file_path = protostar_project.protostar.project_root_path / "calls.toml"
+    file_path.write_text(
+        f"""
+        [[call]]
+        contract-address = "{deploy_response.address}"
+        function = "add_3"
+        inputs = [3]
+
+        [[call]]
+        contract-address = "{deploy_response.address}"
+        function = "add_multiple_values"
+        inputs = {{ a = 5, c = 3, b = 2 }}
+        """,
+        encoding="utf-8",
+    )
+
+    results = await protostar_project.protostar.batch_call(
+        file_path=file_path, gateway_url=devnet_gateway_url, max_concurrency=2
+    )
+
+    assert [result.call_output.cairo_data for result in results] == [[6], [10]]
+
+
+async def test_batch_call_reports_failed_calls(
+    protostar_project: ProtostarProjectFixture,
+    devnet_gateway_url: str,
+    devnet_account: DevnetAccount,
+    set_private_key_env_var: SetPrivateKeyEnvVarFixture,
+):
+    with set_private_key_env_var(devnet_account.private_key):
+        deploy_response = await deploy_main_contract(
+            protostar_project.protostar, devnet_gateway_url, devnet_account
+        )
+    file_path = protostar_project.protostar.project_root_path / "calls.toml"
+    file_path.write_text(
+        f"""
+        [[call]]
+        contract-address = "{deploy_response.address}"
+        function = "UNKNOWN_FUNCTION"
+
+        [[call]]
+        contract-address = "{deploy_response.address}"
+        function = "add_3"
+        inputs = [3]
+        """,
+        encoding="utf-8",
+    )
+
+    with pytest.raises(ProtostarException, match="1 of 2 calls failed"):
+        await protostar_project.protostar.batch_call(
+            file_path=file_path, gateway_url=devnet_gateway_url
+        )
@@ -10,7 +10,7 @@ from protostar.cli import MessengerFactory
 from protostar.commands import DeclareCommand
 from protostar.contract_path_resolver import ContractPathResolver
 from protostar.io import log_color_provider
-from protostar.starknet_gateway import GatewayFacadeFactory
+from protostar.starknet_gateway import GatewayClientFactory, GatewayFacadeFactory
 from tests.conftest import DevnetAccount, SetPrivateKeyEnvVarFixture
 
 
@@ -44,6 +44,7 @@ async def test_declaring_cairo1_contract(
 ):
     declare = DeclareCommand(
         gateway_facade_factory=GatewayFacadeFactory(Path("")),
+        gateway_client_factory=GatewayClientFactory(),
         messenger_factory=MessengerFactory(
             log_color_provider=log_color_provider,
             activity_indicator=MagicMock(),
@@ -0,0 +1,80 @@
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+from starkware.cairo.lang.compiler import import_loader
+from starkware.cairo.lang.compiler.parser import parse_file
+from starkware.starknet.core.os.contract_class.deprecated_class_hash import (
+    compute_deprecated_class_hash,
+)
+
+from protostar import cached_parse_file
+from protostar.starknet import StarknetCompiler, StarknetCompilerConfig
+from protostar.starknet.pass_managers import StarknetPassManagerFactory
+
+CONTRACT = """%lang starknet
+
+from utils import scale
+
+@view
+func get_{name}(x: felt) -> (res: felt) {{
+    return (res=scale(x));
+}}
+"""
+
+UTILS = """func scale(x: felt) -> felt {{
+    return x * {factor};
+}}
+"""
+
+
+@pytest.fixture(name="compiler")
+def compiler_fixture(tmp_path: Path) -> StarknetCompiler:
+    return StarknetCompiler(
+        config=StarknetCompilerConfig(
+            include_paths=[str(tmp_path)], disable_hint_validation=False
+        ),
+        pass_manager_factory=StarknetPassManagerFactory,
+    )
+
+
+@pytest.fixture(name="contract_paths")
+def contract_paths_fixture(tmp_path: Path) -> list[Path]:
+    (tmp_path / "utils.cairo").write_text(UTILS.format(factor=2), encoding="utf-8")
+    contract_paths: list[Path] = []
+    for name in ("first", "second"):
+        contract_path = tmp_path / f"{name}.cairo"
+        contract_path.write_text(CONTRACT.format(name=name), encoding="utf-8")
+        contract_paths.append(contract_path)
+    return contract_paths
+
+
+def compile_class_hash(compiler: StarknetCompiler, contract_path: Path) -> int:
+    return compute_deprecated_class_hash(compiler.compile_contract(contract_path))
+
+
+def test_sharing_parsed_modules_does_not_change_compiled_contracts(
+    compiler: StarknetCompiler, contract_paths: list[Path], mocker: MockerFixture
+):
+    cached_parse_file.cache_clear()
+    class_hashes = [
+        compile_class_hash(compiler, contract_path) for contract_path in contract_paths
+    ]
+
+    mocker.patch.object(import_loader, "parse_file", parse_file)
+    assert class_hashes == [
+        compile_class_hash(compiler, contract_path) for contract_path in contract_paths
+    ]
+
+    cache_info = cached_parse_file.cache_info()
+    assert cache_info.hits > 0
+    assert cache_info.misses == cache_info.currsize
+
+
+def test_edited_module_is_parsed_again(
+    compiler: StarknetCompiler, contract_paths: list[Path], tmp_path: Path
+):
+    class_hash = compile_class_hash(compiler, contract_paths[0])
+    (tmp_path / "utils.cairo").write_text(UTILS.format(factor=3), encoding="utf-8")
+
+    assert compile_class_hash(compiler, contract_paths[0]) != class_hash
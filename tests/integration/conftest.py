@@ -48,6 +48,7 @@ class RunCairo0TestRunnerFixture(Protocol):
         cairo_path: Optional[List[Path]] = None,
         test_cases: Optional[List[str]] = None,
         ignored_test_cases: Optional[List[str]] = None,
+        fuzz_workers: Optional[int] = None,
     ) -> TestingSummary:
         ...
 
@@ -71,6 +72,7 @@ def run_cairo0_test_runner_fixture(
         cairo_path: Optional[List[Path]] = None,
         test_cases: Optional[List[str]] = None,
         ignored_test_cases: Optional[List[str]] = None,
+        fuzz_workers: Optional[int] = None,
     ) -> TestingSummary:
         protostar_directory_mock = session_mocker.MagicMock()
         protostar_directory_mock.protostar_test_only_cairo_packages_path = Path()
@@ -119,6 +121,7 @@ def run_cairo0_test_runner_fixture(
             max_steps=max_steps,
             disable_hint_validation=disable_hint_validation,
             cairo_path=cairo_path or [],
+            fuzz_workers=fuzz_workers,
             messenger=messenger_factory.human(),
         )
 
@@ -24,6 +24,24 @@ async def test_basic(run_cairo0_test_runner: RunCairo0TestRunnerFixture):
     assert testing_summary.testing_seed == seed
 
 
+async def test_examples_are_split_between_fuzz_workers(
+    run_cairo0_test_runner: RunCairo0TestRunnerFixture,
+):
+    testing_summary = await run_cairo0_test_runner(
+        Path(__file__).parent / "basic_test.cairo", seed=10, fuzz_workers=2
+    )
+
+    assert_cairo_test_cases(
+        testing_summary,
+        expected_passed_test_cases_names=["test_fuzz_pass"],
+        expected_failed_test_cases_names=["test_fuzz_fails"],
+    )
+    [passed] = testing_summary.passed
+    assert isinstance(passed, PassedFuzzTestCaseResult)
+    assert passed.fuzz_runs_count is not None
+    assert passed.fuzz_runs_count <= 5
+
+
 async def test_non_felt_parameter(run_cairo0_test_runner: RunCairo0TestRunnerFixture):
     testing_summary = await run_cairo0_test_runner(
         Path(__file__).parent / "non_felt_parameter_test.cairo"
@@ -85,6 +103,19 @@ async def test_max_examples_in_setup_hook(
     assert result.fuzz_runs_count <= 5
 
 
+async def test_fuzz_examples_per_second_is_reported(
+    run_cairo0_test_runner: RunCairo0TestRunnerFixture,
+):
+    testing_summary = await run_cairo0_test_runner(
+        Path(__file__).parent / "max_examples_in_setup_hook_test.cairo", seed=3
+    )
+
+    [result] = testing_summary.passed
+    assert isinstance(result, PassedFuzzTestCaseResult)
+    assert result.fuzz_examples_per_second is not None
+    assert result.fuzz_examples_per_second > 0
+
+
 async def test_max_examples_in_setup_case(
     run_cairo0_test_runner: RunCairo0TestRunnerFixture,
 ):
@@ -9,6 +9,7 @@ from protostar.starknet_gateway import (
     AccountManager,
     GatewayFacade,
     AccountConfig,
+    GatewayClientFactory,
 )
 from protostar.starknet_gateway.multicall import (
     MulticallUseCase,
@@ -52,6 +53,7 @@ async def test_multicall_use_case_happy_case(
         ),
         gateway_url=devnet.get_gateway_url(),
         client=starknet_client,
+        gateway_client_factory=GatewayClientFactory(),
     )
     with set_private_key_env_var(account.private_key):
         declare_result = await protostar.declare_cairo0(
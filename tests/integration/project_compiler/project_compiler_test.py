@@ -91,3 +91,33 @@ def test_handling_not_existing_main_files(tmp_path: Path, datadir: Path):
 
     with pytest.raises(StarknetCompiler.FileNotFoundException):
         project_compiler.compile_project(output_dir=tmp_path)
+
+
+def test_writing_artifacts_only_when_class_hash_changes(tmp_path: Path, datadir: Path):
+    project_root_path = datadir / "importing"
+    project_compiler = create_project_compiler(
+        project_root_path=project_root_path,
+        configuration_file=FakeConfigurationFile(
+            contract_name_to_source_paths={
+                "main": [project_root_path / "entry_point.cairo"]
+            },
+        ),
+    )
+    config = ProjectCompilerConfig(relative_cairo_path=[project_root_path / "modules"])
+
+    class_hashes = project_compiler.compile_project(output_dir=tmp_path, config=config)
+    artifact_mtime = (tmp_path / "main.json").stat().st_mtime_ns
+
+    entry_point_path = project_root_path / "entry_point.cairo"
+    entry_point_path.write_text(
+        entry_point_path.read_text(encoding="utf-8") + "\n// comment\n",
+        encoding="utf-8",
+    )
+
+    assert (
+        project_compiler.compile_project(
+            output_dir=tmp_path, config=config, parallel=True
+        )
+        == class_hashes
+    )
+    assert (tmp_path / "main.json").stat().st_mtime_ns == artifact_mtime